@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+""" A Python module for building Tower of Hanoi move arrays in bulk.
+https://en.wikipedia.org/wiki/Tower_of_Hanoi
+History:
+01.00 2026-Oct-17 Scott S. Initial release.
+
+Each move is returned as three columns:  the disk number, the source rod and
+the target rod, where the rods are coded as indexes into 'ABC' (0, 1, 2).
+When NumPy is installed, the columns are computed with vectorized bit
+operations over a range of move numbers.  Otherwise, the columns are built
+as compact array('B') columns from the iterative generator.
+
+MIT License
+
+Copyright (c) 2023 TigerPointe Software, LLC
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+Please consider giving to cancer research.
+https://braintumor.org/
+https://www.cancer.org/
+"""
+
+from array import array
+from itertools import islice
+
+from hanoi_engine import NAMES
+from hanoi_solver import _steps, iter_moves
+
+# Optional:  pip install numpy
+# (vectorizes the move arrays, otherwise the pure-Python generator is used)
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+def _numpy_chunk(height, lo, hi, rods):
+    """ Computes the move columns for move numbers lo to (hi - 1).
+    PARAMETERS:
+    height : tower height
+    lo     : first move number
+    hi     : move number to stop before
+    rods   : rod codes ordered as a cycle (source, spare, target)
+    """
+    k = numpy.arange(lo, hi, dtype=numpy.uint64)
+
+    # The disk is the trailing-zero count of k, plus one
+    low = k & (~k + numpy.uint64(1))
+    disk = numpy.log2(low.astype(numpy.float64)).astype(numpy.uint8) + 1
+
+    # The disk has moved ((k >> (disk - 1)) + 1) >> 1 times, including this
+    # move, and steps around the rod cycle by its parity-based step
+    count = ((k >> (disk - 1).astype(numpy.uint64)) + 1) >> 1
+    step = numpy.array(_steps(height), dtype=numpy.uint64)[disk]
+    new = ((count % 3) * step) % 3
+    old = (((count - 1) % 3) * step) % 3
+    return (disk, rods[old], rods[new])
+
+
+def iter_arrays(height=0, source='A', target='C', spare='B', chunk=1 << 20):
+    """ Generates the solution moves as chunks of column arrays.
+    Only one chunk is held in memory at a time, so the memory stays bounded
+    for any tower height.
+    PARAMETERS:
+    height : tower height (0 to 64)
+    source : source rod
+    target : target rod
+    spare  : spare rod
+    chunk  : number of moves per chunk
+    YIELDS:
+    (disk, source, target) tuples of column arrays
+    """
+    if (height < 0) or (height > 64):
+        raise ValueError(f'Height {height} is out of range [0-64]')
+    end = 2 ** height
+    codes = (NAMES.index(source), NAMES.index(spare), NAMES.index(target))
+
+    # Vectorize each chunk when NumPy is available
+    if (numpy is not None):
+        rods = numpy.array(codes, dtype=numpy.uint8)
+        for lo in range(1, end, chunk):
+            yield _numpy_chunk(height, lo, min(lo + chunk, end), rods)
+        return
+
+    # Otherwise, fill compact byte columns from the iterative generator
+    moves = iter_moves(height=height, source=source, target=target,
+                       spare=spare)
+    index = {source: codes[0], spare: codes[1], target: codes[2]}
+    for lo in range(1, end, chunk):
+        disks = array('B')
+        sources = array('B')
+        targets = array('B')
+        for (disk, old, new) in islice(moves, chunk):
+            disks.append(disk)
+            sources.append(index[old])
+            targets.append(index[new])
+        yield (disks, sources, targets)
+
+
+def solve_array(height=0, source='A', target='C', spare='B', chunk=1 << 20):
+    """ Returns all of the solution moves as three column arrays.
+    The result holds (2 ** height) - 1 entries per column, so use the
+    iter_arrays generator instead for the taller towers.
+    PARAMETERS:
+    height : tower height (0 to 64)
+    source : source rod
+    target : target rod
+    spare  : spare rod
+    chunk  : number of moves per chunk
+    RETURNS:
+    (disk, source, target) tuple of column arrays
+    """
+    parts = list(iter_arrays(height=height, source=source, target=target,
+                             spare=spare, chunk=chunk))
+    if (numpy is not None):
+        if (not parts):
+            empty = numpy.zeros(0, dtype=numpy.uint8)
+            return (empty, empty.copy(), empty.copy())
+        return tuple(numpy.concatenate([part[col] for part in parts])
+                     for col in range(3))
+    columns = (array('B'), array('B'), array('B'))
+    for part in parts:
+        for col in range(3):
+            columns[col].extend(part[col])
+    return columns
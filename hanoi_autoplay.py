@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+""" A Python module for playing Tower of Hanoi moves on a timed schedule.
+https://en.wikipedia.org/wiki/Tower_of_Hanoi
+History:
+01.00 2026-Oct-17 Scott S. Initial release.
+01.01 2026-Oct-17 Scott S. Added the optional profiling hooks.
+
+The moves are applied by an asyncio task, which waits between moves without
+blocking the event loop.  Frames are rendered at most once per frame
+interval, so when the moves are applied faster than the terminal can draw
+them, the intermediate frames are dropped (the moves are never dropped).
+The pause, resume, step, speed and stop controls can be called from any
+thread (such as a keyboard listener) using the call method.
+
+MIT License
+
+Copyright (c) 2023 TigerPointe Software, LLC
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+Please consider giving to cancer research.
+https://braintumor.org/
+https://www.cancer.org/
+"""
+
+import asyncio
+
+import hanoi_profile
+
+# Define the number of unscheduled moves applied between event loop yields
+# (used when playing as fast as possible)
+BATCH = 256
+
+
+class Autoplay:
+    """ Applies a sequence of moves on an asyncio schedule."""
+
+    def __init__(self, moves, apply, render, delay=2.0, interval=(1 / 30),
+                 wait=0.0):
+        """ Initializes the schedule.
+        PARAMETERS:
+        moves    : iterable of moves
+        apply    : function called as apply(move) for every move (no output)
+        render   : function called as render() to draw a frame
+        delay    : seconds between moves (0 plays as fast as possible)
+        interval : minimum seconds between frames
+        wait     : seconds to wait after the first frame
+        """
+        self.moves = iter(moves)
+        self.apply = apply
+        self.render = hanoi_profile.timed('autoplay render')(render)
+        self.delay = delay
+        self.interval = interval
+        self.wait = wait
+        self.paused = False
+        self.stopped = False
+        self.steps = 0
+        self.count = 0
+        self.frames = 0
+        self.loop = None
+        self.wake = None
+
+    def call(self, name, *args):
+        """ Calls a control method safely from any thread.
+        PARAMETERS:
+        name : control method name (pause, resume, toggle, step, faster,
+               slower or stop)
+        args : control method arguments
+        """
+        method = getattr(self, name)
+        if (self.loop is None):
+            method(*args)
+        else:
+            self.loop.call_soon_threadsafe(method, *args)
+
+    def _notify(self):
+        """ Wakes the schedule so that a control takes effect at once."""
+        if (self.wake is not None):
+            self.wake.set()
+
+    def pause(self):
+        """ Pauses the moves."""
+        self.paused = True
+        self._notify()
+
+    def resume(self):
+        """ Resumes the moves."""
+        self.paused = False
+        self._notify()
+
+    def toggle(self):
+        """ Pauses or resumes the moves."""
+        self.paused = not self.paused
+        self._notify()
+
+    def step(self):
+        """ Applies a single move, then pauses."""
+        self.paused = True
+        self.steps += 1
+        self._notify()
+
+    def faster(self):
+        """ Halves the delay between moves (down to as fast as possible)."""
+        self.delay = 0.0 if (self.delay < 0.001) else (self.delay / 2)
+        self._notify()
+
+    def slower(self):
+        """ Doubles the delay between moves."""
+        self.delay = max(self.delay * 2, 0.001)
+        self._notify()
+
+    def stop(self):
+        """ Stops the moves."""
+        self.stopped = True
+        self._notify()
+
+    async def _sleep(self, seconds):
+        """ Waits for a number of seconds, or until a control is called.
+        PARAMETERS:
+        seconds : seconds to wait
+        """
+        self.wake.clear()
+        start = self.loop.time()
+        try:
+            await asyncio.wait_for(self.wake.wait(), timeout=seconds)
+        except asyncio.TimeoutError:
+            pass
+        if (hanoi_profile.ENABLED):
+            hanoi_profile.add_time('autoplay sleep', self.loop.time() - start)
+
+    async def run(self):
+        """ Applies all of the moves, then renders the final frame.
+        RETURNS:
+        number of moves applied
+        """
+        self.loop = asyncio.get_running_loop()
+        self.wake = asyncio.Event()
+        self.render()
+        self.frames += 1
+        shown = self.loop.time()
+        if (self.wait > 0):
+            await self._sleep(self.wait)
+        dirty = False
+        due = self.loop.time()
+        for move in self.moves:
+
+            # Wait while paused, unless a single step was requested
+            while (self.paused) and (self.steps == 0) and (not self.stopped):
+                if (dirty):
+                    self.render()
+                    self.frames += 1
+                    dirty = False
+                self.wake.clear()
+                await self.wake.wait()
+            if (self.stopped):
+                break
+            stepped = (self.steps > 0)
+            if (stepped):
+                self.steps -= 1
+
+            # Apply the move, then render unless a frame was just drawn
+            self.apply(move)
+            self.count += 1
+            dirty = True
+            now = self.loop.time()
+            if (stepped) or ((now - shown) >= self.interval):
+                self.render()
+                self.frames += 1
+                shown = now
+                dirty = False
+
+            # Wait for the next move (yielding now and then when unlimited)
+            if (self.delay > 0):
+                due = max(due + self.delay, now)
+                if (due > self.loop.time()):
+                    await self._sleep(due - self.loop.time())
+            elif ((self.count % BATCH) == 0):
+                await asyncio.sleep(0)
+        if (dirty):
+            self.render()
+            self.frames += 1
+        if (hanoi_profile.ENABLED):
+            hanoi_profile.count('autoplay moves', self.count)
+            hanoi_profile.count('autoplay frames', self.frames)
+        return self.count
+
+
+def play(moves, apply, render, **kwargs):
+    """ Runs an autoplay schedule until all of the moves are applied.
+    PARAMETERS:
+    moves  : iterable of moves
+    apply  : function called as apply(move) for every move (no output)
+    render : function called as render() to draw a frame
+    kwargs : other Autoplay arguments (delay, interval, wait)
+    RETURNS:
+    number of moves applied
+    """
+    return asyncio.run(Autoplay(moves, apply, render, **kwargs).run())
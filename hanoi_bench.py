@@ -0,0 +1,387 @@
+#!/usr/bin/env python3
+""" A Python module for benchmarking the Tower of Hanoi hot paths.
+https://en.wikipedia.org/wiki/Tower_of_Hanoi
+History:
+01.00 2026-Oct-17 Scott S. Initial release.
+01.01 2026-Oct-17 Scott S. Added the state-space graph benchmark.
+01.02 2026-Oct-17 Scott S. Added the JSON benchmark suite.
+01.03 2026-Oct-17 Scott S. Added the taller xmastree rendering benchmarks.
+01.04 2026-Oct-18 Scott S. Counted the allocated memory blocks per unit.
+
+The benchmark suite times the move generation, the frame rendering of both
+games and the save/reload round-trips, with all of the output written to
+the null device.  Each result reports the units (moves, frames or saves)
+per second, the memory blocks left allocated per unit and the peak traced
+memory, and the whole run is written as JSON so that the results can be
+compared over time.
+
+MIT License
+
+Copyright (c) 2023 TigerPointe Software, LLC
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+Please consider giving to cancer research.
+https://braintumor.org/
+https://www.cancer.org/
+"""
+
+from collections import deque
+from itertools import islice
+import gc
+import json
+import os
+import platform
+import shutil
+import tempfile
+import time
+import tracemalloc
+
+from hanoi_engine import Game, Rods
+import hanoi_graph
+from hanoi_journal import Journal
+from hanoi_solver import iter_moves, solve
+
+# Import the game front-ends, if possible (the keyboard library can fail to
+# load without a display, in which case the rendering is not measured)
+try:
+    import hanoi_game
+except ImportError:
+    hanoi_game = None
+try:
+    import xmastree_game
+except ImportError:
+    xmastree_game = None
+
+
+def apply_lists(height=0, moves=()):
+    """ Applies the moves to list rods using the original index scan.
+    PARAMETERS:
+    height : tower height
+    moves  : sequence of (disk, source, target) tuples
+    """
+    rods = {}
+    rods['A'] = list((x + 1) for x in reversed(range(height)))
+    rods['B'] = list()
+    rods['C'] = list()
+    for (disk, source, target) in moves:
+        rods[target].append(rods[source].pop(rods[source].index(disk)))
+    return rods
+
+
+def apply_engine(height=0, moves=()):
+    """ Applies the moves to the shared rod state engine.
+    PARAMETERS:
+    height : tower height
+    moves  : sequence of (disk, source, target) tuples
+    """
+    rods = Rods(height)
+    rods.apply(moves)
+    return rods
+
+
+def best_time(func, repeat=3, **kwargs):
+    """ Returns the best elapsed time (in seconds) of repeated calls.
+    PARAMETERS:
+    func   : function to be timed
+    repeat : number of calls
+    kwargs : keyword arguments passed to the function
+    """
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(**kwargs)
+        elapsed = time.perf_counter() - start
+        if (best is None) or (elapsed < best):
+            best = elapsed
+    return best
+
+
+def bench_moves(heights=range(20, 29, 2), sample=1000000, repeat=3):
+    """ Compares the per-move cost of the list rods and the engine.
+    The same sample of solution moves is applied by both methods, so only
+    the rod updates are timed (not the move generation).
+    PARAMETERS:
+    heights : tower heights to measure
+    sample  : number of moves to apply at each height
+    repeat  : number of timed runs (the best run is reported)
+    """
+    print('height   list.index ns/move   engine ns/move   speedup')
+    for height in heights:
+        moves = list(islice(iter_moves(height=height), sample))
+        slow = best_time(apply_lists, repeat=repeat,
+                         height=height, moves=moves) * 1e9 / len(moves)
+        fast = best_time(apply_engine, repeat=repeat,
+                         height=height, moves=moves) * 1e9 / len(moves)
+        print(f'{height:6}', f'{slow:20.1f}', f'{fast:16.1f}',
+              f'{(slow / fast):8.2f}x')
+
+
+def bench_graph(modes=hanoi_graph.MODES, limit=60.0, largest=18):
+    """ Finds the largest tower each graph mode can search within a limit.
+    A full BFS is run from the initial configuration for each height, and
+    each height takes about three times longer than the one before, so the
+    next height is only attempted when it is expected to finish in time.
+    PARAMETERS:
+    modes   : visited-set modes to measure
+    limit   : time limit (in seconds) for a single search
+    largest : largest tower height to attempt
+    """
+    print('mode     height   states        seconds   bitset bytes')
+    for mode in modes:
+        if (mode == 'numpy') and (hanoi_graph.numpy is None):
+            print(f'{mode:8}', 'skipped (numpy is not installed)')
+            continue
+        elapsed = 0.0
+        height = 0
+        while (height < largest) and ((elapsed * 3) <= limit):
+            height += 1
+            start = time.perf_counter()
+            hanoi_graph.eccentricity(height=height, mode=mode)
+            elapsed = time.perf_counter() - start
+            print(f'{mode:8}', f'{height:6}', f'{(3 ** height):13,}',
+                  f'{elapsed:9.2f}', f'{(((3 ** height) >> 3) + 1):14,}')
+
+
+def measure(name, func, units, repeat=3, **kwargs):
+    """ Times repeated calls, then traces the memory of one more call.
+    The blocks are the change in the number of traced memory blocks over
+    the call (the blocks freed again during the call are not counted),
+    while the peak is the traced memory in bytes.
+    PARAMETERS:
+    name   : benchmark name
+    func   : function to be measured
+    units  : number of units (moves, frames or saves) handled per call
+    repeat : number of timed calls (the best call is reported)
+    kwargs : keyword arguments passed to the function
+    RETURNS:
+    dictionary of the results
+    """
+    seconds = best_time(func, repeat=repeat, **kwargs)
+    gc.collect()
+    tracemalloc.start()
+    blocks = len(tracemalloc.take_snapshot().traces)
+    func(**kwargs)
+    gc.collect()
+    blocks = len(tracemalloc.take_snapshot().traces) - blocks
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    result = {'name': name, 'units': units, 'seconds': seconds,
+              'rate': units / seconds, 'blocks': blocks,
+              'blocks_per_unit': blocks / units, 'peak_bytes': peak}
+    print(f'{name:32}', f'{units:11,}', f'{result["rate"]:14,.0f}/s',
+          f'{result["blocks_per_unit"]:12,.3f}', f'{peak:14,}')
+    return result
+
+
+def consume_moves(height=0):
+    """ Generates all of the moves of a solution, without storing them.
+    PARAMETERS:
+    height : tower height
+    """
+    deque(iter_moves(height=height), maxlen=0)
+
+
+def solve_to(height=0, mode='moves', sink=None):
+    """ Solves the puzzle with the output written to a sink.
+    PARAMETERS:
+    height : tower height
+    mode   : output mode
+    sink   : output stream
+    """
+    solve(height=height, mode=mode, out=sink)
+
+
+def bench_generation(heights=(16, 20), sink=None):
+    """ Measures the moves per second of the move generation and output.
+    PARAMETERS:
+    heights : tower heights to measure
+    sink    : output stream
+    RETURNS:
+    list of the results
+    """
+    results = []
+    for height in heights:
+        units = (1 << height) - 1
+        results.append(measure(f'iter_moves {height}', consume_moves, units,
+                               height=height))
+        for mode in ('moves', 'full'):
+            if (mode == 'full') and (height > 16):
+                continue  # the full boards grow with the height squared
+            results.append(measure(f'solve {mode} {height}', solve_to, units,
+                                   height=height, mode=mode, sink=sink))
+    return results
+
+
+def render_hanoi(height=0, moves=(), sink=None):
+    """ Renders a frame of the hanoi game after each move.
+    PARAMETERS:
+    height : tower height
+    moves  : sequence of (disk, source, target) tuples
+    sink   : output stream
+    """
+    rods = Rods(height)
+    for (disk, source, target) in moves:
+        rods.move(source, target)
+        sink.write(hanoi_game.render_frame(rods, height))
+
+
+def render_tree(height=2, moves=(), sink=None, incremental=False):
+    """ Renders a frame of the xmastree game after each move.
+    PARAMETERS:
+    height      : tower height
+    moves       : sequence of (disk, source, target) tuples
+    sink        : output stream
+    incremental : redraw only the changed cells
+    """
+    rods = Rods(height)
+    renderer = xmastree_game.TreeRenderer(height, out=sink,
+                                          incremental=incremental)
+    for (disk, source, target) in moves:
+        rods.move(source, target)
+        renderer.draw(rods)
+
+
+def bench_render(heights=(7, 12, 16), sink=None):
+    """ Measures the frames per second of the game renderers.
+    PARAMETERS:
+    heights : tower heights to measure
+    sink    : output stream
+    RETURNS:
+    list of the results
+    """
+    results = []
+    for height in heights:
+        moves = list(iter_moves(height=height))
+        if (hanoi_game is None):
+            print('hanoi_game', 'skipped (the keyboard library did not load)')
+        else:
+            results.append(measure(f'hanoi_game frames {height}',
+                                   render_hanoi, len(moves), height=height,
+                                   moves=moves, sink=sink))
+        if (xmastree_game is None):
+            print('xmastree_game',
+                  'skipped (the keyboard library did not load)')
+        else:
+            for incremental in (False, True):
+                label = 'cells' if (incremental) else 'frames'
+                results.append(measure(f'xmastree_game {label} {height}',
+                                       render_tree, len(moves), height=height,
+                                       moves=moves, sink=sink,
+                                       incremental=incremental))
+    return results
+
+
+def round_trips(game=None, count=0):
+    """ Serializes and restores a game a number of times.
+    PARAMETERS:
+    game  : game state
+    count : number of round-trips
+    """
+    for _ in range(count):
+        Game.loads(game.dumps())
+
+
+def journal_moves(path='', height=0, moves=(), sync='batch'):
+    """ Journals the moves of a game (as the games autosave each move).
+    PARAMETERS:
+    path   : base file path
+    height : tower height
+    moves  : sequence of (disk, source, target) tuples
+    sync   : sync policy
+    """
+    game = Game(height)
+    journal = Journal(path, game, sync=sync, every=0)
+    for (disk, source, target) in moves:
+        game.apply_moves(((source, target),))
+        journal.record(source, target)
+    journal.close()
+
+
+def reload_journal(path=''):
+    """ Reloads a game from its snapshot and journal files.
+    PARAMETERS:
+    path : base file path
+    """
+    Journal.load(path).close()
+
+
+def bench_persistence(height=16, count=100000, synced=1000):
+    """ Measures the save and reload round-trips.
+    PARAMETERS:
+    height : tower height (the journaled game plays the whole solution)
+    count  : number of serialized state round-trips
+    synced : number of journaled moves when every move is synced
+    RETURNS:
+    list of the results
+    """
+    results = []
+    moves = list(iter_moves(height=height))
+    game = Game(height)
+    game.apply_moves((source, target) for (disk, source, target)
+                     in moves[:(len(moves) // 2)])
+    results.append(measure(f'dumps/loads {height}', round_trips, count,
+                           game=game, count=count))
+    folder = tempfile.mkdtemp()
+    try:
+        path = os.path.join(folder, 'bench')
+        for sync in ('close', 'batch', 'always'):
+            sample = moves if (sync != 'always') else moves[:synced]
+            results.append(measure(f'journal {sync} {height}', journal_moves,
+                                   len(sample), path=path, height=height,
+                                   moves=sample, sync=sync))
+        journal_moves(path=path, height=height, moves=moves)
+        results.append(measure(f'journal reload {height}', reload_journal,
+                               len(moves), path=path))
+    finally:
+        shutil.rmtree(folder)
+    return results
+
+
+def run_suite(path='hanoi_bench.json'):
+    """ Runs the benchmark suite and writes the results as JSON.
+    PARAMETERS:
+    path : JSON file path
+    RETURNS:
+    dictionary of the run
+    """
+    print(f'{"benchmark":32}', f'{"units":>11}', f'{"rate":>16}',
+          f'{"blocks/unit":>12}', f'{"peak bytes":>14}')
+    sink = open(os.devnull, 'w')
+    try:
+        results = bench_generation(sink=sink) + bench_render(sink=sink) + \
+            bench_persistence()
+    finally:
+        sink.close()
+    run = {'time': time.strftime('%Y-%m-%dT%H:%M:%S'),
+           'python': platform.python_version(),
+           'platform': platform.platform(),
+           'results': results}
+    f = open(path, 'w')
+    json.dump(run, f, indent=2)
+    f.close()
+    print('Results written:', path)
+    return run
+
+
+# Start the program interactively
+if __name__ == '__main__':
+    run_suite()
+    bench_moves()
+    bench_graph()
@@ -0,0 +1,471 @@
+#!/usr/bin/env python3
+""" A Python module for holding the Tower of Hanoi rod state.
+https://en.wikipedia.org/wiki/Tower_of_Hanoi
+History:
+01.00 2026-Oct-17 Scott S. Initial release.
+01.01 2026-Oct-17 Scott S. Added the compact state encoding.
+01.02 2026-Oct-17 Scott S. Added the headless game engine.
+01.03 2026-Oct-17 Scott S. Added the cyclic and adjacent rule sets.
+01.04 2026-Oct-17 Scott S. Added the source rod of the lifted disk.
+01.05 2026-Oct-18 Scott S. Rejected the unknown rods and malformed moves.
+01.06 2026-Oct-18 Scott S. Rejected the truncated game states.
+
+Each rod is stored as a bitmask integer, where bit (disk - 1) is set when the
+disk is on that rod.  Since a smaller disk is always stacked above a larger
+disk, the top disk of a rod is simply the lowest set bit of its mask, so the
+push, pop and top-of-rod checks are all performed in constant time.
+
+The Game class holds the gameplay rules (lifting and placing a disk, the
+move counter and the solution check) without any keyboard or console I/O,
+so that the game can be driven by the front-ends, or replayed in bulk.
+Each game follows a rule set, which restricts the rod pairs a disk may be
+moved between (see RULES).
+
+The compact serialized form stores 2 bits per disk (0 = A, 1 = B, 2 = C and
+3 = held, i.e. lifted off the rods), so a 64-disk position fits in 16 bytes.
+While a disk is lifted, one more byte holds the rod it was lifted from.
+
+MIT License
+
+Copyright (c) 2023 TigerPointe Software, LLC
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+Please consider giving to cancer research.
+https://braintumor.org/
+https://www.cancer.org/
+"""
+
+# Define the rod names
+NAMES = 'ABC'
+
+# Define the held disk code for the compact encoding
+HELD = 3
+
+# Define the rule sets as the allowed (source, target) rod pairs
+#   classic  : any rod onto any other rod
+#   cyclic   : clockwise only (A -> B -> C -> A)
+#   adjacent : between neighbouring rods only (A <-> B <-> C)
+RULES = {'classic': frozenset((('A', 'B'), ('A', 'C'), ('B', 'A'),
+                               ('B', 'C'), ('C', 'A'), ('C', 'B'))),
+         'cyclic': frozenset((('A', 'B'), ('B', 'C'), ('C', 'A'))),
+         'adjacent': frozenset((('A', 'B'), ('B', 'A'), ('B', 'C'),
+                                ('C', 'B')))}
+
+
+class Rods:
+    """ Holds the disks on the A, B, C rods as bitmask integers."""
+
+    __slots__ = ('height', 'masks')
+
+    def __init__(self, height=0):
+        """ Initializes the rods with all of the disks on rod A.
+        PARAMETERS:
+        height : tower height
+        """
+        self.height = height
+        self.masks = {'A': (1 << height) - 1, 'B': 0, 'C': 0}
+
+    @classmethod
+    def from_lists(cls, lists, height=None):
+        """ Creates the rods from disk number lists keyed by rod name.
+        PARAMETERS:
+        lists  : dictionary of disk number lists (A, B and C)
+        height : tower height (defaults to the largest disk number)
+        """
+        rods = cls(0)
+        for name in NAMES:
+            for disk in lists.get(name, ()):
+                rods.masks[name] |= 1 << (disk - 1)
+        if (height is None):
+            height = rods.masks['A'] | rods.masks['B'] | rods.masks['C']
+            height = height.bit_length()
+        rods.height = height
+        return rods
+
+    @classmethod
+    def decode(cls, blob, height):
+        """ Creates the rods from the compact 2 bits per disk encoding.
+        PARAMETERS:
+        blob   : encoded bytes (see encode)
+        height : tower height
+        RETURNS:
+        (rods, held) tuple, where held is the lifted disk number (or 0)
+        """
+        code = int.from_bytes(blob, 'little')
+        full = _spread((1 << height) - 1)
+        even = code & full
+        odd = (code >> 1) & full
+        rods = cls(0)
+        rods.height = height
+        rods.masks['A'] = _squeeze(full ^ (even | odd))
+        rods.masks['B'] = _squeeze(even & ~odd)
+        rods.masks['C'] = _squeeze(odd & ~even)
+        return (rods, _squeeze(even & odd).bit_length())
+
+    def encode(self, held=0):
+        """ Returns the compact 2 bits per disk encoding of the rods.
+        PARAMETERS:
+        held : lifted disk number, not on any rod (or 0)
+        """
+        code = _spread(self.masks['B']) | (_spread(self.masks['C']) << 1)
+        if (held):
+            code |= HELD << (2 * (held - 1))
+        return code.to_bytes((self.height + 3) // 4, 'little')
+
+    def state(self):
+        """ Returns the hashable (A, B, C) bitmask tuple of the rods."""
+        return (self.masks['A'], self.masks['B'], self.masks['C'])
+
+    def valid(self, held=0):
+        """ Checks the rods for a legal configuration using bitwise tests.
+        Every disk must be on exactly one rod (or held).  The stacking order
+        is implied by the masks, so no ordering check is required.
+        PARAMETERS:
+        held : lifted disk number, not on any rod (or 0)
+        """
+        a = self.masks['A']
+        b = self.masks['B']
+        c = self.masks['C']
+        lift = (1 << (held - 1)) if (held) else 0
+        return (((a & b) | (a & c) | (b & c) | ((a | b | c) & lift)) == 0) \
+            and ((a | b | c | lift) == ((1 << self.height) - 1))
+
+    def top(self, rod):
+        """ Returns the top disk number of a rod (0 when empty).
+        PARAMETERS:
+        rod : rod name (A, B or C)
+        """
+        mask = self.masks[rod]
+        return (mask & -mask).bit_length()
+
+    def count(self, rod):
+        """ Returns the number of disks on a rod.
+        PARAMETERS:
+        rod : rod name (A, B or C)
+        """
+        return bin(self.masks[rod]).count('1')
+
+    def disks(self, rod):
+        """ Returns the disk numbers on a rod (ordered from bottom to top).
+        PARAMETERS:
+        rod : rod name (A, B or C)
+        """
+        mask = self.masks[rod]
+        return [disk for disk in range(mask.bit_length(), 0, -1)
+                if ((mask >> (disk - 1)) & 1)]
+
+    def lists(self):
+        """ Returns the disk number lists keyed by rod name."""
+        return {name: self.disks(name) for name in NAMES}
+
+    def can_move(self, source, target):
+        """ Checks whether the top disk of the source fits onto the target.
+        PARAMETERS:
+        source : source rod
+        target : target rod
+        """
+        mask = self.masks[source]
+        low = mask & -mask
+        return (low != 0) and ((self.masks[target] & (low - 1)) == 0)
+
+    def move(self, source, target):
+        """ Moves the top disk from the source to the target (unchecked).
+        PARAMETERS:
+        source : source rod
+        target : target rod
+        RETURNS:
+        moved disk number
+        """
+        masks = self.masks
+        mask = masks[source]
+        low = mask & -mask
+        masks[source] = mask ^ low
+        masks[target] |= low
+        return low.bit_length()
+
+    def apply(self, moves):
+        """ Applies a batch of moves (unchecked) and returns the count.
+        The loop keeps the masks in local variables, which avoids the method
+        call overhead of calling move() once per move.
+        PARAMETERS:
+        moves : iterable of (disk, source, target) tuples
+        """
+        masks = self.masks
+        count = 0
+        for (disk, source, target) in moves:
+            mask = masks[source]
+            low = mask & -mask
+            masks[source] = mask ^ low
+            masks[target] |= low
+            count += 1
+        return count
+
+    def pop(self, rod):
+        """ Removes and returns the top disk number of a rod (0 when empty).
+        PARAMETERS:
+        rod : rod name (A, B or C)
+        """
+        mask = self.masks[rod]
+        low = mask & -mask
+        self.masks[rod] = mask ^ low
+        return low.bit_length()
+
+    def push(self, rod, disk):
+        """ Places a disk onto the top of a rod (unchecked).
+        PARAMETERS:
+        rod  : rod name (A, B or C)
+        disk : disk number
+        """
+        self.masks[rod] |= 1 << (disk - 1)
+
+    def solved(self, rod='C'):
+        """ Checks whether all of the disks are on a rod.
+        PARAMETERS:
+        rod : rod name (defaults to C)
+        """
+        return self.masks[rod] == ((1 << self.height) - 1)
+
+
+def _spread(mask):
+    """ Spreads the bits of a mask onto the even bit positions.
+    Reading the binary digits as base 4 digits doubles each bit position.
+    PARAMETERS:
+    mask : bitmask integer
+    """
+    return int(bin(mask)[2:], 4)
+
+
+def _squeeze(code):
+    """ Gathers the even bit positions of a code back into a mask.
+    PARAMETERS:
+    code : integer having only even bits set (see _spread)
+    """
+    if (code == 0):
+        return 0
+    digits = bin(code)[2:]
+    return int(digits[(len(digits) - 1) % 2::2], 2)
+
+
+def dumps(rods, held=0, n=0, source=None):
+    """ Serializes a game state to compact bytes.
+    The layout is the tower height (1 byte), the byte length of the move
+    counter (1 byte), the move counter (little-endian) and the encoded rods,
+    followed by the rod index of the source (1 byte, only when a disk is
+    lifted from a known source rod).
+    PARAMETERS:
+    rods   : rod state
+    held   : lifted disk number, not on any rod (or 0)
+    n      : number of moves counter
+    source : rod name from which the disk was lifted (or None)
+    """
+    size = (n.bit_length() + 7) // 8
+    blob = bytes((rods.height, size)) + n.to_bytes(size, 'little') + \
+        rods.encode(held=held)
+    if (held) and (source is not None):
+        blob += bytes((NAMES.index(source),))
+    return blob
+
+
+def loads(blob):
+    """ Deserializes a game state from compact bytes (see dumps).
+    PARAMETERS:
+    blob : serialized bytes
+    RETURNS:
+    (rods, held, n, source) tuple, where source is the rod name from which
+    the disk was lifted (None when no disk is lifted, or when it was not
+    saved)
+    """
+    if (len(blob) < 2):
+        raise ValueError('Invalid game state')
+    height = blob[0]
+    size = blob[1]
+    n = int.from_bytes(blob[2:(2 + size)], 'little')
+    end = 2 + size + ((height + 3) // 4)
+    if (len(blob) < end):
+        raise ValueError('Invalid game state')  # truncated
+    (rods, held) = Rods.decode(blob[(2 + size):end], height)
+    if (not rods.valid(held=held)):
+        raise ValueError('Invalid game state')
+    source = None
+    if (len(blob) > end):
+
+        # The disk must be able to return onto its source rod
+        top = rods.top(NAMES[blob[end]]) if (blob[end] < 3) else -1
+        if (not held) or (len(blob) > end + 1) or \
+                ((top != 0) and not (held < top)):
+            raise ValueError('Invalid game state')
+        source = NAMES[blob[end]]
+    return (rods, held, n, source)
+
+
+class Game:
+    """ Holds the gameplay state and rules (without any I/O)."""
+
+    __slots__ = ('rods', 'held', 'source', 'n', 'goal', 'rule')
+
+    def __init__(self, height=0, goal='C', rule='classic'):
+        """ Initializes a new game with all of the disks on rod A.
+        PARAMETERS:
+        height : tower height
+        goal   : rod name on which the tower is solved (defaults to C)
+        rule   : rule set name (classic, cyclic or adjacent)
+        """
+        if (rule not in RULES):
+            raise ValueError(f'Unknown rule set: {rule}')
+        self.rods = Rods(height)
+        self.held = 0        # lifted disk number (or 0)
+        self.source = None   # rod name from which the disk was lifted
+        self.n = 0           # number of moves counter
+        self.goal = goal
+        self.rule = rule
+
+    @property
+    def height(self):
+        """ Returns the tower height."""
+        return self.rods.height
+
+    @classmethod
+    def loads(cls, blob, goal='C', rule='classic'):
+        """ Creates a game from a serialized state (see dumps).
+        PARAMETERS:
+        blob : serialized bytes
+        goal : rod name on which the tower is solved (defaults to C)
+        rule : rule set name (classic, cyclic or adjacent)
+        """
+        game = cls(0, goal=goal, rule=rule)
+        (game.rods, game.held, game.n, game.source) = loads(blob)
+        return game
+
+    def dumps(self):
+        """ Returns the game state serialized as compact bytes."""
+        return dumps(self.rods, held=self.held, n=self.n, source=self.source)
+
+    def solved(self):
+        """ Checks whether all of the disks are on the goal rod."""
+        return (self.held == 0) and self.rods.solved(self.goal)
+
+    def allowed(self, source, target):
+        """ Checks whether the rule set allows a move between two rods
+        (placing a disk back onto its own rod is always allowed, as is any
+        placement from an unknown source rod, restored from a state that
+        was saved without it).
+        PARAMETERS:
+        source : source rod (or None)
+        target : target rod
+        """
+        return (source == target) or (source is None) or \
+            ((source, target) in RULES[self.rule])
+
+    def select(self, rod):
+        """ Selects a rod, either lifting its top disk or placing the lifted
+        disk onto it (the same rules as pressing A, B or C in the games).
+        A placement is invalid onto a smaller disk, or when the rule set does
+        not allow the move from the source rod.  An unknown rod name is
+        invalid, and leaves the game unchanged.
+        PARAMETERS:
+        rod : rod name (A, B or C)
+        RETURNS:
+        dictionary of the action (lift, place, invalid or empty), rod,
+        source rod of the lifted disk, disk, number of moves and solved flag
+        """
+        rods = self.rods
+        disk = self.held
+        source = self.source
+        if (rod not in rods.masks):
+            return {'action': 'invalid', 'rod': rod, 'source': source,
+                    'disk': disk, 'n': self.n, 'solved': self.solved()}
+        top = rods.top(rod)  # 0 when the rod is empty
+        if (disk == 0):
+            if (top > 0):
+                self.held = rods.pop(rod)
+                self.source = rod
+                action = 'lift'
+                disk = self.held
+                source = rod
+            else:
+                action = 'empty'
+        elif ((top == 0) or (disk < top)) and self.allowed(source, rod):
+            rods.push(rod, disk)
+            self.held = 0
+            self.source = None
+            self.n += 1
+            action = 'place'
+        else:
+            action = 'invalid'
+        return {'action': action, 'rod': rod, 'source': source, 'disk': disk,
+                'n': self.n, 'solved': self.solved()}
+
+    def run(self, commands):
+        """ Selects a sequence of rods, stopping once the game is solved.
+        PARAMETERS:
+        commands : iterable of rod names (such as the string 'ACAB')
+        RETURNS:
+        list of the select results (an unknown rod name is an invalid
+        result, as in select)
+        """
+        results = []
+        for rod in commands:
+            result = self.select(rod.upper())
+            results.append(result)
+            if (result['solved']):
+                break
+        return results
+
+    def apply_moves(self, moves):
+        """ Validates and applies a batch of complete moves.
+        The moves are applied in order until the first illegal move (by the
+        disk sizes or by the rule set), which raises a ValueError giving its
+        position (counted from 1, as in hanoi_validator).  The earlier moves
+        remain applied.  An unknown rod name, or a move that is not a pair,
+        is illegal in the same way.
+        PARAMETERS:
+        moves : iterable of (source, target) rod name pairs
+        RETURNS:
+        number of moves applied
+        """
+        if (self.held):
+            raise ValueError(f'Disk {self.held} is lifted')
+        masks = self.rods.masks
+        pairs = RULES[self.rule]  # excludes moves onto the same rod
+        count = 0
+        moves = iter(moves)  # a TypeError here is not an illegal move
+        try:
+            for move in moves:
+                if (len(move) != 2):
+                    raise TypeError
+                (source, target) = move
+                mask = masks[source]
+                low = mask & -mask
+                if (low == 0) or (masks[target] & (low - 1)) or \
+                        ((source, target) not in pairs):
+                    raise ValueError(f'Illegal move {count + 1}: '
+                                     f'{source} onto {target}')
+                masks[source] = mask ^ low
+                masks[target] |= low
+                count += 1
+        except KeyError as e:
+            raise ValueError(f'Illegal move {count + 1}: '
+                             f'unknown rod {e}') from None
+        except TypeError:
+            raise ValueError(f'Illegal move {count + 1}: '
+                             f'{move!r} is not a rod pair') from None
+        finally:
+            self.n += count
+        return count
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+""" A Python module for handling the Tower of Hanoi key events off the
+keyboard listener thread.
+https://en.wikipedia.org/wiki/Tower_of_Hanoi
+History:
+01.00 2026-Oct-17 Scott S. Initial release.
+
+The keyboard listener only places each key event (with its time stamp) on a
+thread-safe queue, so it never waits for the terminal.  The game thread
+takes the events from the queue and applies them in order, while the frames
+are drawn at most once per refresh interval.  A burst of key events (such as
+a held key repeating) is applied as a batch, followed by a single frame.
+The latency from each key event to its output is measured, and recorded by
+the profiling hooks when they are enabled (see hanoi_profile).
+
+MIT License
+
+Copyright (c) 2023 TigerPointe Software, LLC
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+Please consider giving to cancer research.
+https://braintumor.org/
+https://www.cancer.org/
+"""
+
+import queue
+import time
+
+import hanoi_profile
+
+# Define the default refresh interval (in seconds)
+INTERVAL = 1 / 30
+
+
+class EventQueue:
+    """ Queues the key events, then applies them and draws the frames."""
+
+    def __init__(self, handle, render, interval=INTERVAL, name='events'):
+        """ Initializes an empty queue.
+        PARAMETERS:
+        handle   : function called as handle(key) on the game thread for
+                   each key event (returning False stops the game)
+        render   : function called as render() to draw a frame
+        interval : minimum seconds between frames
+        name     : timer name of the latency measurement
+        """
+        self.queue = queue.SimpleQueue()
+        self.handle = handle
+        self.render = render
+        self.interval = interval
+        self.name = name
+        self.dirty = False      # a frame is waiting to be drawn
+        self.shown = None       # time at which the last frame was drawn
+        self.waiting = []       # time stamps of the events not yet drawn
+        self.count = 0          # number of events applied
+        self.frames = 0         # number of frames drawn
+        self.total = 0.0        # total latency (in seconds)
+        self.worst = 0.0        # maximum latency (in seconds)
+
+    def put(self, key):
+        """ Queues a key event (called on the keyboard listener thread).
+        PARAMETERS:
+        key : pressed key
+        RETURNS:
+        True, so that the listener continues listening
+        """
+        self.queue.put((key, time.perf_counter()))
+        return True
+
+    def stop(self):
+        """ Queues an event that stops the game (from any thread)."""
+        self.queue.put((None, time.perf_counter()))
+
+    def invalidate(self):
+        """ Requests a frame (drawn once the refresh interval allows)."""
+        self.dirty = True
+
+    def _measure(self, stamps, now):
+        """ Records the latency of events whose output was just written.
+        PARAMETERS:
+        stamps : time stamps of the events
+        now    : time at which the output was written
+        """
+        for stamp in stamps:
+            latency = now - stamp
+            self.total += latency
+            if (latency > self.worst):
+                self.worst = latency
+            if (hanoi_profile.ENABLED):
+                hanoi_profile.add_time(self.name + ' latency', latency)
+
+    def draw(self):
+        """ Draws the requested frame now (if any)."""
+        if (not self.dirty):
+            return
+        self.render()
+        self.dirty = False
+        self.frames += 1
+        self.shown = time.perf_counter()
+        self._measure(self.waiting, self.shown)
+        self.waiting.clear()
+
+    def run(self):
+        """ Applies the queued events until the game is stopped or solved,
+        drawing at most one frame per refresh interval.
+        """
+        while (True):
+
+            # Wait for an event, or until the requested frame is due
+            timeout = None
+            if (self.dirty):
+                due = (self.shown or 0.0) + self.interval
+                timeout = max(due - time.perf_counter(), 0.0)
+            try:
+                (key, stamp) = self.queue.get(timeout=timeout)
+            except queue.Empty:
+                self.draw()
+                continue
+            if (key is None):
+                break
+
+            # Apply the event (its output is either a message written at
+            # once, or a frame drawn later)
+            self.count += 1
+            result = self.handle(key)
+            if (self.dirty):
+                self.waiting.append(stamp)
+            else:
+                self._measure((stamp,), time.perf_counter())
+            if (result is False):
+                break
+            if (self.dirty) and (self.shown is not None) and \
+                    ((time.perf_counter() - self.shown) >= self.interval):
+                self.draw()  # keep drawing through a continuous burst
+        self.draw()
+
+    def latency(self):
+        """ Returns the latency measurement.
+        RETURNS:
+        dictionary of the events, frames, mean and worst latency (in
+        seconds)
+        """
+        return {'events': self.count, 'frames': self.frames,
+                'mean': (self.total / self.count) if (self.count) else 0.0,
+                'worst': self.worst}
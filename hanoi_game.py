@@ -1,244 +1,430 @@
-﻿#!/usr/bin/env python3
-""" A Python module for playing the Tower of Hanoi puzzle game.
-https://en.wikipedia.org/wiki/Tower_of_Hanoi
-History:
-01.00 2023-Oct-16 Scott S. Initial release.
-
-MIT License
-
-Copyright (c) 2023 TigerPointe Software, LLC
-
-Permission is hereby granted, free of charge, to any person obtaining a copy
-of this software and associated documentation files (the "Software"), to deal
-in the Software without restriction, including without limitation the rights
-to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
-copies of the Software, and to permit persons to whom the Software is
-furnished to do so, subject to the following conditions:
-
-The above copyright notice and this permission notice shall be included in all
-copies or substantial portions of the Software.
-
-THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
-IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
-FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
-AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
-LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
-OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
-SOFTWARE.
-
-Please consider giving to cancer research.
-https://braintumor.org/
-https://www.cancer.org/
-"""
-
-# Requires:  pip install pynput
-# (using a keypress library improves the game playability over text inputs)
-from pynput.keyboard import Key, Listener
-import json
-import os
-import time
-
-
-def play(height=0, solve=False):
-    """ Starts the gameplay.
-    PARAMETERS:
-    height : tower height
-    solve  : solve automatically
-    """
-
-    # Sanity check for the maximum tower height
-    if (height > 12):  # 12 requires 4,095 moves ((2 ** height) - 1)
-        height = 12    # higher values are unlikely to be playable
-
-    # Create a new dictionary for the game data (can be saved as JSON)
-    data = {}
-
-    # Initialize the A, B, C rods and disk numbers
-    data['A'] = list((x + 1) for x in reversed(range(height)))
-    data['B'] = list()
-    data['C'] = list()
-
-    # Initialize the state variables
-    data['disk'] = None      # disk currently being moved
-    data['height'] = height  # height of the tower
-    data['n'] = 0            # number of moves counter
-
-    def write_disks():
-        """ Writes all the disks contained on each rod.
-        The maximum width of each disk is two times the tower height.  Repeat
-        the disk character based on the numeric disk value and RIGHT-justify
-        to half of the maximum width (i.e., the height).  Next, slice enough
-        characters from the tail to hold the numeric label.  Then, repeat the
-        disk character again based on the numeric disk value and LEFT-justify
-        to the other half of the maximum width (i.e., the height again).
-        """
-        for x in reversed(range(data['height'])):
-            if (x < len(data['A'])):
-                outA = ('=' * data['A'][x]).rjust(data['height'])
-                outA = outA[:-len(str(data['A'][x]))] + str(data['A'][x])
-                outA = outA + ('=' * data['A'][x]).ljust(data['height'])
-            else:
-                outA = '|'.rjust(data['height']) + ' '.ljust(data['height'])
-            if (x < len(data['B'])):
-                outB = ('=' * data['B'][x]).rjust(data['height'])
-                outB = outB[:-len(str(data['B'][x]))] + str(data['B'][x])
-                outB = outB + ('=' * data['B'][x]).ljust(data['height'])
-            else:
-                outB = '|'.rjust(data['height']) + ' '.ljust(data['height'])
-            if (x < len(data['C'])):
-                outC = ('=' * data['C'][x]).rjust(data['height'])
-                outC = outC[:-len(str(data['C'][x]))] + str(data['C'][x])
-                outC = outC + ('=' * data['C'][x]).ljust(data['height'])
-            else:
-                outC = '|'.rjust(data['height']) + ' '.ljust(data['height'])
-            print('  :', outA, outB, outC)
-        print('  :',
-              'A'.rjust(data['height']) + ' '.ljust(data['height']),
-              'B'.rjust(data['height']) + ' '.ljust(data['height']),
-              'C'.rjust(data['height']) + ' '.ljust(data['height']))
-
-    def solve_game(disk, source, target, spare):
-        """ Solves the game using a recursive subproblems code pattern.
-        PARAMETERS:
-        disk   : disk number
-        source : source rod
-        target : target rod
-        spare  : spare rod
-        """
-
-        # Stop the recursion when no more disks can be moved
-        if (disk < 1):
-            return
-
-        # Recursively move the next disk from the source to the spare
-        solve_game(disk=(disk - 1), source=source, target=spare, spare=target)
-
-        # Move the current disk from the source to the target
-        data[target].append(data[source].pop(data[source].index(disk)))
-        data['n'] += 1
-        print('\r\nMoving disk', disk, 'from', source, 'onto', target,
-              f"(move {data['n']:,})")
-        write_disks()
-        time.sleep(2)
-
-        # Recursively move the next disk from the spare to the target
-        solve_game(disk=(disk - 1), source=spare, target=target, spare=source)
-
-    def save_game():
-        """ Saves the game data to a file."""
-        file = os.path.basename(__file__) + '.txt'
-        f = open(file, 'w')
-        f.write(json.dumps(data))
-        f.close()
-        print('Game saved:', file)
-        return True
-
-    def reload_game():
-        """ Reloads the game data from a file."""
-        nonlocal data  # required for assigning a new value
-        file = os.path.basename(__file__) + '.txt'
-        if (os.path.isfile(file)):
-            f = open(file, 'r')
-            data = json.loads(f.read())
-            f.close()
-            print('\r\nGame reloaded:', file)
-            write_disks()
-            if ((data['disk']) is not None):
-                print('\r\nMoving disk', data['disk'], 'onto ...')
-        else:
-            print('File not found:', file)
-        return True
-
-    def move_disk(rod):
-        """Moves a disk between rods.
-        PARAMETERS:
-        rod : rod name (A, B or C)
-        """
-
-        # If unset, pop the top disk from the source rod
-        if (data['disk'] is None) and (len(data[rod]) > 0):
-            data['disk'] = data[rod].pop()
-            print('\r\nMoving disk', data['disk'], 'from', rod, 'onto ...')
-
-        # Otherwise, append the popped disk to the target rod
-        elif (data['disk'] is not None):
-            top = None
-            if (len(data[rod]) > 0):
-                top = data[rod][-1]
-            if (top is None) or (data['disk'] < top):
-                data[rod].append(data['disk'])
-                data['disk'] = None
-                data['n'] += 1
-                print('  ...', rod, f"(move {data['n']:,})")
-                write_disks()
-            else:
-                print('  ... invalid move onto ', rod, ', try again', sep='')
-
-        # Check for a solution (all disks having been moved)
-        if (len(data['C']) < data['height']):
-            return True  # not solved, continue listening
-        label = 'moves'
-        if (data['n'] == 1):
-            label = 'move'
-        print('Success, puzzle solved in', f"{data['n']:,}", label)
-        return False  # solved, stop listening
-
-    def on_press(key):
-        """Handles the keypress event.
-        PARAMETERS:
-        key : pressed key
-        """
-        if (hasattr(key, 'char')):
-            if (key.char == 'a'):
-                return move_disk(rod='A')
-            elif (key.char == 'b'):
-                return move_disk(rod='B')
-            elif (key.char == 'c'):
-                return move_disk(rod='C')
-            elif (key.char == 'l'):
-                return reload_game()
-            elif (key.char == 'r'):
-                return reload_game()
-            elif (key.char == 's'):
-                return save_game()
-            elif (key.char == 'q'):
-                return False
-        else:
-            if (key == Key.esc):
-                return False
-        return True  # for any other key, continue listening
-
-    # Show the solution, if specified
-    if (solve):
-        print('\r\nSolving, please wait ...')
-        write_disks()
-        time.sleep(4)
-        solve_game(disk=data['height'], source='A', target='C', spare='B')
-        return
-
-    # Otherwise, begin listening for keypresses until False is returned
-    # (suppress input events from being passed back to the console)
-    print('\r\nGood luck, move disks by pressing A, B, or C ...')
-    write_disks()
-    with Listener(on_press=on_press, suppress=True) as lstn:
-        lstn.join()
-
-
-# Start the program interactively
-if __name__ == '__main__':
-    try:
-        print('\r\nTHE TOWER OF HANOI')
-        height = int(input('Please enter a height for the tower [0-12]: '))
-        solve = None
-        while (solve != 'y') and (solve != 'n'):
-            solve = input('Do you want the computer to play itself? [Y|N]: ')
-            solve = solve.lower()
-        print('  Move all of the disks from rod A to rod C')
-        print('  Press A, B, or C to move a disk between two rods')
-        print('  A larger disk cannot be placed on top of a smaller disk')
-        print('  Press S to save the game, R or L to reload a saved game')
-        print('  Press ESC or Q to quit')
-        play(height=height, solve=(solve == 'y'))
-        input('Press the ENTER key to exit the game: ')
-    except Exception as e:
-        print(str(e))
+﻿#!/usr/bin/env python3
+""" A Python module for playing the Tower of Hanoi puzzle game.
+https://en.wikipedia.org/wiki/Tower_of_Hanoi
+History:
+01.00 2023-Oct-16 Scott S. Initial release.
+01.01 2026-Oct-17 Scott S. Added the precomputed render cache.
+01.02 2026-Oct-17 Scott S. Added the non-blocking autoplay controls.
+01.03 2026-Oct-17 Scott S. Moved the gameplay rules to the headless engine.
+01.04 2026-Oct-17 Scott S. Added the move journal autosave, undo and redo.
+01.05 2026-Oct-17 Scott S. Added the optional profiling hooks.
+01.06 2026-Oct-17 Scott S. Deferred the keyboard and terminal setup.
+01.07 2026-Oct-17 Scott S. Moved the key handling off the listener thread.
+01.08 2026-Oct-17 Scott S. Added the cyclic and adjacent rule sets.
+01.09 2026-Oct-18 Scott S. Profiled the interactive moves and messages.
+01.10 2026-Oct-18 Scott S. Kept the journal when a reload is rejected.
+
+MIT License
+
+Copyright (c) 2023 TigerPointe Software, LLC
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+Please consider giving to cancer research.
+https://braintumor.org/
+https://www.cancer.org/
+"""
+
+from functools import lru_cache
+import os
+import sys
+
+# Shared game engine, solver and autoplay modules
+from hanoi_engine import RULES, Game
+from hanoi_events import EventQueue
+from hanoi_journal import Journal
+import hanoi_profile
+from hanoi_solver import hint, hint_place, iter_rule
+
+
+@lru_cache(maxsize=None)
+def build_rows(height=0):
+    """ Builds every possible row string for a tower height (built once).
+    The maximum width of each disk is two times the tower height.  Repeat
+    the disk character based on the numeric disk value and RIGHT-justify
+    to half of the maximum width (i.e., the height).  Next, slice enough
+    characters from the tail to hold the numeric label.  Then, repeat the
+    disk character again based on the numeric disk value and LEFT-justify
+    to the other half of the maximum width (i.e., the height again).
+    PARAMETERS:
+    height : tower height
+    RETURNS:
+    (first, middle, last, footer) tuple, where each of the first three is a
+    list of the rod rows for columns A, B and C (index 0 is the empty rod
+    and index n is disk n), already joined with the column separators
+    """
+    rows = ['|'.rjust(height) + ' '.ljust(height)]
+    for disk in range(1, height + 1):
+        out = ('=' * disk).rjust(height)
+        out = out[:-len(str(disk))] + str(disk)
+        rows.append(out + ('=' * disk).ljust(height))
+    first = ['  : ' + row + ' ' for row in rows]
+    middle = [row + ' ' for row in rows]
+    last = [row + '\n' for row in rows]
+    footer = '  : ' + ' '.join(name.rjust(height) + ' '.ljust(height)
+                               for name in 'ABC') + '\n'
+    return (first, middle, last, footer)
+
+
+@hanoi_profile.timed('hanoi_game render')
+def render_frame(rods, height=0):
+    """ Returns all the disks contained on each rod as a single frame.
+    The frame is composed by indexing the cached rows from build_rows.
+    PARAMETERS:
+    rods   : rod state
+    height : tower height
+    """
+    (first, middle, last, footer) = build_rows(height)
+    cols = []
+    for name in 'ABC':
+        disks = rods.disks(name)  # disk numbers from bottom to top
+        cols.append(disks + ([0] * (height - len(disks))))
+    pieces = []
+    for (a, b, c) in reversed(list(zip(*cols))):
+        pieces.append(first[a])
+        pieces.append(middle[b])
+        pieces.append(last[c])
+    pieces.append(footer)
+    return ''.join(pieces)
+
+
+def load_keyboard():
+    """ Imports the keyboard library when the gameplay begins, rather than
+    when the module is imported (it loads the display input backends).
+    RETURNS:
+    (Key, Listener) tuple
+    """
+
+    # Requires:  pip install pynput
+    # (using a keypress library improves the game playability over text
+    # inputs)
+    from pynput.keyboard import Key, Listener
+    return (Key, Listener)
+
+
+@hanoi_profile.captured
+@hanoi_profile.printed('hanoi_game print')
+def play(height=0, solve=False, delay=2.0, rule='classic'):
+    """ Starts the gameplay.
+    PARAMETERS:
+    height : tower height
+    solve  : solve automatically
+    delay  : seconds between automatic moves (0 is as fast as possible)
+    rule   : rule set name (classic, cyclic or adjacent, see RULES)
+    """
+
+    # Sanity check for the maximum tower height
+    if (height > 12):  # 12 requires 4,095 moves ((2 ** height) - 1)
+        height = 12    # higher values are unlikely to be playable
+
+    # Create a new headless game (the A, B, C rods are held as bitmasks,
+    # along with the lifted disk and the number of moves counter)
+    game = Game(height, rule=rule)
+
+    # Create a new dictionary for the display data
+    data = {}
+    data['last'] = None  # last automatic move
+
+    # Initialize the move journal (started by the first move, so that the
+    # previously saved game can still be reloaded until then); each rule set
+    # keeps its own files, so that a game never overwrites the game saved
+    # under other rules
+    file = os.path.basename(__file__)
+    if (rule != 'classic'):
+        file += '.' + rule
+    journal = None
+
+    # Count the bytes written to the terminal (when profiling is enabled)
+    out = hanoi_profile.writer(sys.stdout, 'hanoi_game terminal')
+
+    def write_disks():
+        """ Writes all the disks contained on each rod (in a single write)."""
+        out.write(render_frame(game.rods, game.height))
+
+    def apply_move(move):
+        """ Applies an automatic move (without writing any output).
+        PARAMETERS:
+        move : disk, source and target
+        """
+        game.apply_moves((move[1:],))
+        data['last'] = move
+
+    def show_move():
+        """ Writes the last automatic move and all the disks."""
+        if (data['last'] is not None):
+            (disk, source, target) = data['last']
+            print('\r\nMoving disk', disk, 'from', source, 'onto', target,
+                  f"(move {game.n:,})")
+        write_disks()
+
+    def solve_game():
+        """ Solves the game using the iterative move generator, played on a
+        non-blocking schedule (frames are dropped when the moves are faster
+        than the terminal).
+        """
+        # The scheduler is only imported for the automatic moves
+        import asyncio
+        from hanoi_autoplay import Autoplay
+        moves = iter_rule(height=game.height, rule=game.rule)
+        autoplay = Autoplay(moves, apply=apply_move, render=show_move,
+                            delay=delay, wait=(delay * 2))
+
+        def on_control(key):
+            """Handles the keypress event while solving.
+            PARAMETERS:
+            key : pressed key
+            """
+            if (hasattr(key, 'char')):
+                if (key.char == ' ') or (key.char == 'p'):
+                    autoplay.call('toggle')
+                elif (key.char == 'n'):
+                    autoplay.call('step')
+                elif (key.char == '+') or (key.char == '='):
+                    autoplay.call('faster')
+                elif (key.char == '-'):
+                    autoplay.call('slower')
+                elif (key.char == 'q'):
+                    autoplay.call('stop')
+                    return False
+            else:
+                if (key == Key.space):
+                    autoplay.call('toggle')
+                elif (key == Key.esc):
+                    autoplay.call('stop')
+                    return False
+            return True  # for any other key, continue listening
+
+        # Listen for the controls while the disks are moved (when the keyboard
+        # library is available, otherwise the moves are played without them)
+        try:
+            (Key, Listener) = load_keyboard()
+        except ImportError:
+            asyncio.run(autoplay.run())
+            return
+        lstn = Listener(on_press=on_control, suppress=True)
+        lstn.start()
+        try:
+            asyncio.run(autoplay.run())
+        finally:
+            lstn.stop()
+
+    def save_game():
+        """ Saves a snapshot of the game data to a file (the moves are also
+        saved automatically to the journal file).
+        """
+        nonlocal journal  # required for assigning a new value
+        if (journal is None):
+            journal = Journal(file, game)
+        else:
+            journal.snapshot()
+        print('Game saved:', file + '.sav')
+        return True
+
+    def reload_game():
+        """ Reloads the game data from the snapshot and journal files."""
+        nonlocal game, journal  # required for assigning new values
+        if (os.path.isfile(file + '.sav')):
+            if (journal is not None):
+                journal.flush()  # writes any buffered moves
+
+            # A saved game that cannot be reloaded (such as one using another
+            # rule set) leaves the current game and its journal unchanged
+            try:
+                loaded = Journal.load(file, rule=game.rule)
+            except (OSError, ValueError) as e:
+                print('\r\nGame not reloaded:', e)
+                return True
+            if (journal is not None):
+                journal.close()
+            journal = loaded
+            game = journal.game
+            print('\r\nGame reloaded:', file + '.sav')
+            events.invalidate()
+        else:
+            print('File not found:', file + '.sav')
+        return True
+
+    def undo_game(redo=False):
+        """ Undoes (or redoes) the last move from the journal.
+        PARAMETERS:
+        redo : redo the last undone move instead
+        """
+        label = 'Redo' if (redo) else 'Undo'
+        move = None
+        if (journal is not None):
+            move = journal.redo() if (redo) else journal.undo()
+        if (move is None):
+            print('\r\n' + label + ': no move available')
+            return True
+        if (hanoi_profile.ENABLED):
+            hanoi_profile.count('hanoi_game moves')
+        print('\r\n' + label + ': moving disk', move[0], 'from', move[1],
+              'onto', move[2], f"(move {game.n:,})")
+        events.invalidate()
+        return finish_game()
+
+    def hint_game():
+        """ Writes a hint for the best next move."""
+
+        # The shortest remaining solution is only searched for the classic
+        # rules (the other rule sets are solved from the start only)
+        if (game.rule != 'classic'):
+            print('\r\nHint: only available for the classic rules')
+            return True
+
+        # If unset, suggest the first move of the shortest solution
+        rods = game.rods
+        disk = game.held
+        if (disk == 0):
+            move = hint(rods.lists())
+            if (move is None):
+                print('\r\nHint: the puzzle is already solved')
+            else:
+                print('\r\nHint: move disk', move[0], 'from', move[1], 'onto',
+                      move[2])
+            return True
+
+        # Otherwise, suggest the rod leaving the fewest remaining moves
+        print('  ... hint: place disk', disk, 'onto', hint_place(rods, disk))
+        return True
+
+    def move_disk(rod):
+        """Moves a disk between rods.
+        PARAMETERS:
+        rod : rod name (A, B or C)
+        """
+        nonlocal journal  # required for assigning a new value
+
+        # Lift the top disk from the source rod, or place the lifted disk
+        # onto the target rod (the rules are checked by the game engine)
+        result = game.select(rod)
+        if (result['action'] == 'lift'):
+            if (journal is None):
+                journal = Journal(file, game)
+            print('\r\nMoving disk', result['disk'], 'from', rod, 'onto ...')
+        elif (result['action'] == 'place'):
+            journal.record(result['source'], rod)
+            if (hanoi_profile.ENABLED):
+                hanoi_profile.count('hanoi_game moves')
+            print('  ...', rod, f"(move {result['n']:,})")
+            events.invalidate()
+        elif (result['action'] == 'invalid'):
+            print('  ... invalid move onto ', rod, ', try again', sep='')
+        return finish_game()
+
+    def finish_game():
+        """Checks for a solution (all disks having been moved)."""
+        if (not game.solved()):
+            return True  # not solved, continue listening
+        events.draw()  # writes the final disks before the message
+        label = 'moves'
+        if (game.n == 1):
+            label = 'move'
+        print('Success, puzzle solved in', f"{game.n:,}", label)
+        return False  # solved, stop listening
+
+    def on_press(key):
+        """Handles the keypress event (applied on the game thread).
+        PARAMETERS:
+        key : pressed key
+        """
+        if (hasattr(key, 'char')):
+            if (key.char == 'a'):
+                return move_disk(rod='A')
+            elif (key.char == 'b'):
+                return move_disk(rod='B')
+            elif (key.char == 'c'):
+                return move_disk(rod='C')
+            elif (key.char == 'h'):
+                return hint_game()
+            elif (key.char == 'l'):
+                return reload_game()
+            elif (key.char == 'r'):
+                return reload_game()
+            elif (key.char == 's'):
+                return save_game()
+            elif (key.char == 'u'):
+                return undo_game()
+            elif (key.char == 'y'):
+                return undo_game(redo=True)
+            elif (key.char == 'q'):
+                return False
+        else:
+            if (key == Key.esc):
+                return False
+        return True  # for any other key, continue listening
+
+    # Show the solution, if specified
+    if (solve):
+        print('\r\nSolving, please wait ...')
+        solve_game()
+        return
+
+    # Otherwise, begin listening for keypresses (suppress input events from
+    # being passed back to the console); the listener only queues the events,
+    # which are applied here until False is returned, with the disks being
+    # written at most once per refresh interval
+    (Key, Listener) = load_keyboard()
+    events = EventQueue(handle=on_press, render=write_disks,
+                        name='hanoi_game input')
+    print('\r\nGood luck, move disks by pressing A, B, or C ...')
+    write_disks()
+    lstn = Listener(on_press=events.put, suppress=True)
+    lstn.start()
+    try:
+        events.run()
+    finally:
+        lstn.stop()
+        if (journal is not None):
+            journal.close()  # writes any buffered moves
+
+
+# Start the program interactively
+if __name__ == '__main__':
+    try:
+        print('\r\nTHE TOWER OF HANOI')
+        height = int(input('Please enter a height for the tower [0-12]: '))
+        solve = None
+        while (solve != 'y') and (solve != 'n'):
+            solve = input('Do you want the computer to play itself? [Y|N]: ')
+            solve = solve.lower()
+        delay = 2.0
+        if (solve == 'y'):
+            delay = input('Enter the seconds between moves [2, 0 = fastest]: ')
+            delay = float(delay or 2)
+        rule = None
+        while (rule not in RULES):
+            rule = input('Choose the rules [classic|cyclic|adjacent]: ')
+            rule = rule.lower() or 'classic'
+        print('  Move all of the disks from rod A to rod C')
+        print('  Press A, B, or C to move a disk between two rods')
+        print('  A larger disk cannot be placed on top of a smaller disk')
+        print('  Cyclic rules: disks only move clockwise (A, B, C, A)')
+        print('  Adjacent rules: disks only move to a neighbouring rod')
+        print('  Press H for a hint')
+        print('  Press U to undo a move, Y to redo an undone move')
+        print('  Moves are saved automatically, press S to save a snapshot')
+        print('  Press R or L to reload the saved game')
+        print('  Press SPACE or P to pause the computer, N to step one move')
+        print('  Press + or - to change the speed of the computer')
+        print('  Press ESC or Q to quit')
+        play(height=height, solve=(solve == 'y'), delay=delay, rule=rule)
+        input('Press the ENTER key to exit the game: ')
+    except Exception as e:
+        print(str(e))
@@ -0,0 +1,286 @@
+#!/usr/bin/env python3
+""" A Python module for exploring the Tower of Hanoi state-space graph.
+https://en.wikipedia.org/wiki/Tower_of_Hanoi#Graphical_representation
+History:
+01.00 2026-Oct-17 Scott S. Initial release.
+
+Each of the 3 ** n configurations is encoded as a base 3 integer, where the
+digit for disk d (weight 3 ** (d - 1)) is its rod (0 = A, 1 = B, 2 = C).
+The breadth-first searches expand one level at a time and only keep the
+current frontier, while the visited states are marked in a bitset of
+(3 ** n) / 8 bytes (about 48 MB for 18 disks).
+
+Visited-set modes:
+  bitset : bytearray bitset, frontier expanded one state at a time
+  numpy  : packed NumPy bitset, frontier expanded with vectorized digits
+
+MIT License
+
+Copyright (c) 2023 TigerPointe Software, LLC
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+Please consider giving to cancer research.
+https://braintumor.org/
+https://www.cancer.org/
+"""
+
+from array import array
+
+from hanoi_engine import NAMES
+
+# Optional:  pip install numpy
+# (enables the vectorized numpy mode)
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# Define the visited-set modes
+MODES = ('bitset', 'numpy')
+
+
+def encode(config):
+    """ Returns the base 3 state code of a configuration.
+    PARAMETERS:
+    config : dictionary of disk number lists keyed by rod (A, B and C)
+    """
+    state = 0
+    for (idx, name) in enumerate(NAMES):
+        for disk in config.get(name, ()):
+            state += idx * (3 ** (disk - 1))
+    return state
+
+
+def decode(state, height):
+    """ Returns the configuration of a base 3 state code.
+    PARAMETERS:
+    state  : state code
+    height : tower height
+    """
+    config = {name: list() for name in NAMES}
+    digits = []
+    for disk in range(height):
+        (state, digit) = divmod(state, 3)
+        digits.append(digit)
+    for disk in reversed(range(height)):
+        config[NAMES[digits[disk]]].append(disk + 1)
+    return config
+
+
+def neighbors(state, height, pow3=None):
+    """ Generates the state codes reachable in a single move.
+    PARAMETERS:
+    state  : state code
+    height : tower height
+    pow3   : powers of 3 for each disk (optional, computed when omitted)
+    """
+    if (pow3 is None):
+        pow3 = [3 ** disk for disk in range(height)]
+
+    # Find the top (smallest) disk on each rod
+    tops = [0, 0, 0]
+    found = 0
+    rest = state
+    disk = 1
+    while (disk <= height) and (found < 3):
+        (rest, rod) = divmod(rest, 3)
+        if (tops[rod] == 0):
+            tops[rod] = disk
+            found += 1
+        disk += 1
+
+    # Move each top disk onto any rod that is empty or has a larger top
+    for source in range(3):
+        top = tops[source]
+        if (top == 0):
+            continue
+        for target in range(3):
+            if (target != source) and \
+                    ((tops[target] == 0) or (top < tops[target])):
+                yield state + ((target - source) * pow3[top - 1])
+
+
+def _levels_bitset(height, source):
+    """ Generates the BFS frontier levels using a bytearray bitset.
+    PARAMETERS:
+    height : tower height
+    source : state code of the starting configuration
+    """
+    pow3 = [3 ** disk for disk in range(height)]
+    visited = bytearray(((3 ** height) >> 3) + 1)
+    visited[source >> 3] |= 1 << (source & 7)
+    frontier = array('Q', [source])
+    while (frontier):
+        yield frontier
+        following = array('Q')
+        for state in frontier:
+            for nxt in neighbors(state, height, pow3):
+                bit = 1 << (nxt & 7)
+                if (not (visited[nxt >> 3] & bit)):
+                    visited[nxt >> 3] |= bit
+                    following.append(nxt)
+        frontier = following
+
+
+def _levels_numpy(height, source, chunk=1 << 16):
+    """ Generates the BFS frontier levels using a packed NumPy bitset.
+    PARAMETERS:
+    height : tower height
+    source : state code of the starting configuration
+    chunk  : number of frontier states expanded at once
+    """
+    if (numpy is None):
+        raise ImportError('The numpy mode requires:  pip install numpy')
+    pow3 = numpy.array([3 ** disk for disk in range(height)],
+                       dtype=numpy.int64)
+    visited = numpy.zeros(((3 ** height) >> 3) + 1, dtype=numpy.uint8)
+    visited[source >> 3] |= numpy.uint8(1 << (source & 7))
+    frontier = numpy.array([source], dtype=numpy.int64)
+    none = height + 1  # top disk number for an empty rod
+    while (frontier.size > 0):
+        yield frontier
+        if (height < 1):
+            break
+        parts = []
+        for lo in range(0, frontier.size, chunk):
+            states = frontier[lo:(lo + chunk)]
+
+            # Find the top (smallest) disk on each rod
+            digits = (states[:, None] // pow3) % 3
+            tops = []
+            for rod in range(3):
+                on = (digits == rod)
+                tops.append(numpy.where(on.any(axis=1),
+                                        on.argmax(axis=1) + 1, none))
+
+            # Move each top disk onto any rod that is empty or larger
+            for old in range(3):
+                for new in range(3):
+                    if (new == old):
+                        continue
+                    legal = (tops[old] < tops[new])
+                    if (legal.any()):
+                        top = tops[old][legal]
+                        parts.append(states[legal] +
+                                     ((new - old) * pow3[top - 1]))
+
+        # Keep the unique states that have not been visited, then mark them
+        if (not parts):
+            break
+        following = numpy.unique(numpy.concatenate(parts))
+        bits = (numpy.uint8(1) << (following & 7).astype(numpy.uint8))
+        fresh = (visited[following >> 3] & bits) == 0
+        following = following[fresh]
+        numpy.bitwise_or.at(visited, following >> 3, bits[fresh])
+        frontier = following
+
+
+def levels(height=0, source=0, mode='bitset'):
+    """ Generates the BFS frontier levels from a starting configuration.
+    Level d holds every state at a distance of exactly d moves.
+    PARAMETERS:
+    height : tower height
+    source : state code of the starting configuration
+    mode   : visited-set mode (bitset or numpy)
+    YIELDS:
+    arrays of state codes, one per level
+    """
+    if (mode == 'bitset'):
+        return _levels_bitset(height, source)
+    if (mode == 'numpy'):
+        return _levels_numpy(height, source)
+    raise ValueError(f'Unknown mode: {mode}')
+
+
+def level_sizes(height=0, source=0, mode='bitset'):
+    """ Returns the number of states at each distance from a configuration.
+    PARAMETERS:
+    height : tower height
+    source : state code of the starting configuration
+    mode   : visited-set mode (bitset or numpy)
+    """
+    return [len(level) for level in levels(height, source, mode)]
+
+
+def eccentricity(height=0, source=0, mode='bitset'):
+    """ Returns the largest distance from a configuration to any other.
+    PARAMETERS:
+    height : tower height
+    source : state code of the starting configuration
+    mode   : visited-set mode (bitset or numpy)
+    """
+    return len(level_sizes(height, source, mode)) - 1
+
+
+def distance(height=0, source=0, target=0, mode='bitset'):
+    """ Returns the shortest distance between two configurations.
+    PARAMETERS:
+    height : tower height
+    source : state code of the starting configuration
+    target : state code of the ending configuration
+    mode   : visited-set mode (bitset or numpy)
+    """
+    for (dist, level) in enumerate(levels(height, source, mode)):
+        if (target in level):
+            return dist
+    raise ValueError(f'State {target} is out of range for {height} disks')
+
+
+def diameter(height=0, mode='bitset'):
+    """ Returns the largest distance between any two configurations.
+    A search is started from every one of the 3 ** n states, so this is
+    only practical for the smaller towers (about 7 disks or fewer).
+    PARAMETERS:
+    height : tower height
+    mode   : visited-set mode (bitset or numpy)
+    """
+    return max(eccentricity(height, source, mode)
+               for source in range(3 ** height))
+
+
+def count_paths(height=0, source=0, target=0):
+    """ Returns the distance and the number of shortest paths between two
+    configurations.  Each frontier level maps its states to their path
+    counts, so only two levels are held at once (plus the bitset).
+    PARAMETERS:
+    height : tower height
+    source : state code of the starting configuration
+    target : state code of the ending configuration
+    RETURNS:
+    (distance, paths) tuple
+    """
+    pow3 = [3 ** disk for disk in range(height)]
+    visited = bytearray(((3 ** height) >> 3) + 1)
+    visited[source >> 3] |= 1 << (source & 7)
+    frontier = {source: 1}
+    dist = 0
+    while (frontier):
+        if (target in frontier):
+            return (dist, frontier[target])
+        following = {}
+        for (state, paths) in frontier.items():
+            for nxt in neighbors(state, height, pow3):
+                if (not (visited[nxt >> 3] & (1 << (nxt & 7)))):
+                    following[nxt] = following.get(nxt, 0) + paths
+        for nxt in following:
+            visited[nxt >> 3] |= 1 << (nxt & 7)
+        frontier = following
+        dist += 1
+    raise ValueError(f'State {target} is out of range for {height} disks')
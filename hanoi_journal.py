@@ -0,0 +1,285 @@
+#!/usr/bin/env python3
+""" A Python module for saving Tower of Hanoi games to a move journal.
+https://en.wikipedia.org/wiki/Tower_of_Hanoi
+History:
+01.00 2026-Oct-17 Scott S. Initial release.
+01.01 2026-Oct-17 Scott S. Added the rule set of the reloaded game.
+01.02 2026-Oct-17 Scott S. Saved the rule set in the snapshot header.
+01.03 2026-Oct-18 Scott S. Cleared the undo history on each snapshot.
+
+Instead of rewriting the whole game state on every save, each completed move
+is appended to a journal file as a single rod pair code byte (see PAIRS in
+hanoi_stream, followed by the codes for placing a disk back onto the same
+rod, which the games count as a move), along with single byte undo and redo
+markers.  A compact snapshot file holds the serialized game state, its rule
+set and the journal offset at which it was taken, so that a reload only
+replays the records written after the last snapshot.  The journal is never
+rewritten while it is open, and the snapshot is replaced atomically, so an
+interrupted save leaves a consistent pair of files.
+
+The records are buffered and written according to the sync policy:
+  always : write and fsync every record
+  batch  : write and fsync every batch of records
+  close  : write every batch of records, fsync on snapshots and close only
+
+A disk that is lifted but not yet placed is not part of any record, so it is
+returned to its rod when the game is reloaded.  The undo history is not
+part of the snapshot, so each snapshot clears it (the moves before the last
+snapshot cannot be undone, whether or not the game is reloaded).
+
+MIT License
+
+Copyright (c) 2023 TigerPointe Software, LLC
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+Please consider giving to cancer research.
+https://braintumor.org/
+https://www.cancer.org/
+"""
+
+import os
+import struct
+
+from hanoi_engine import Game, Rods, dumps
+from hanoi_stream import PAIRS
+
+# Define the snapshot file header layout (magic, journal offset, rule set)
+MAGIC = b'HNJR'
+HEADER = struct.Struct('<4sQB')
+
+# Define the rule set codes of the snapshot header (see RULES in hanoi_engine)
+RULE_CODES = ('classic', 'cyclic', 'adjacent')
+
+# Define the move codes (the rod pair codes, then the same rod codes)
+MOVES = PAIRS + (('A', 'A'), ('B', 'B'), ('C', 'C'))
+CODES = {pair: code for (code, pair) in enumerate(MOVES)}
+
+# Define the undo and redo marker codes (after the move codes)
+UNDO = len(MOVES)
+REDO = UNDO + 1
+
+# Define the sync policies
+SYNCS = ('always', 'batch', 'close')
+
+
+class Journal:
+    """ Appends the moves of a game to a journal file, with snapshots."""
+
+    def __init__(self, path, game, sync='batch', batch=32, every=4096,
+                 offset=None):
+        """ Opens the journal for a game.  Unless an offset is given (see
+        load), the journal is started over from a snapshot of the game.
+        PARAMETERS:
+        path   : base file path (the .sav and .jnl extensions are appended)
+        game   : game being journaled (Game object)
+        sync   : sync policy (always, batch or close)
+        batch  : number of records buffered before each write
+        every  : number of records between automatic snapshots (0 for none)
+        offset : journal length to keep when reopening an existing journal
+        """
+        if (sync not in SYNCS):
+            raise ValueError(f'Sync policy {sync} is not one of {SYNCS}')
+        self.path = path
+        self.game = game
+        self.sync = sync
+        self.batch = 1 if (sync == 'always') else max(batch, 1)
+        self.every = every
+        self.buffer = bytearray()
+        self.done = bytearray()    # codes of the moves that can be undone
+        self.undone = bytearray()  # codes of the moves that can be redone
+        self.records = 0           # records since the last snapshot
+        if (offset is None):
+            self.file = open(path + '.jnl', 'wb')
+            self.snapshot()
+        else:
+            self.file = open(path + '.jnl', 'r+b')
+            self.file.seek(offset)
+
+    @classmethod
+    def load(cls, path, rule=None, **kwargs):
+        """ Reloads a game from the last snapshot, then replays the journal
+        records written after it.  A game saved under another rule set than
+        the one given is rejected with a ValueError.
+        PARAMETERS:
+        path   : base file path (the .sav and .jnl extensions are appended)
+        rule   : expected rule set name (defaults to the saved rule set)
+        kwargs : other Journal arguments (sync, batch, every)
+        RETURNS:
+        journal, with the reloaded game as its game attribute
+        """
+        f = open(path + '.sav', 'rb')
+        blob = f.read()
+        f.close()
+        if (blob[:len(MAGIC)] != MAGIC) or (len(blob) < HEADER.size):
+            raise ValueError(f'Not a journal snapshot file: {path}.sav')
+        (magic, offset, code) = HEADER.unpack_from(blob, 0)
+        if (code >= len(RULE_CODES)):
+            raise ValueError(f'Unknown rule set code {code}: {path}.sav')
+        if (rule is not None) and (rule != RULE_CODES[code]):
+            raise ValueError(f'The saved game uses the {RULE_CODES[code]} '
+                             f'rules, not the {rule} rules: {path}.sav')
+        game = Game.loads(blob[HEADER.size:], rule=RULE_CODES[code])
+        f = open(path + '.jnl', 'rb')
+        f.seek(offset)
+        records = f.read()
+        f.close()
+        journal = cls(path, game, offset=(offset + len(records)), **kwargs)
+        journal.replay(records)
+        return journal
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def replay(self, records):
+        """ Applies journal records to the game (without writing them).
+        PARAMETERS:
+        records : bytes of move codes and undo/redo markers
+        """
+        for (index, code) in enumerate(records):
+            if (code < UNDO):
+                (source, target) = MOVES[code]
+                if (not self.game.rods.can_move(source, target)) or \
+                        (not self.game.allowed(source, target)):
+                    raise ValueError(f'Illegal journal record {index}: '
+                                     f'{source} onto {target}')
+                self._apply(code)
+                self.undone.clear()
+            elif (code == UNDO) and (self.done):
+                self._revert()
+            elif (code == REDO) and (self.undone):
+                self._apply(self.undone.pop())
+            else:
+                raise ValueError(f'Invalid journal record {index}: {code}')
+        self.records += len(records)
+
+    def _apply(self, code):
+        """ Applies a move code to the game and pushes it onto the undo stack.
+        PARAMETERS:
+        code : move code
+        """
+        (source, target) = MOVES[code]
+        self.game.rods.move(source, target)
+        self.game.n += 1
+        self.done.append(code)
+
+    def _revert(self):
+        """ Reverses the last move and pushes it onto the redo stack.
+        RETURNS:
+        (disk, source, target) tuple of the reversing move
+        """
+        code = self.done.pop()
+        (source, target) = MOVES[code]
+        disk = self.game.rods.move(target, source)
+        self.game.n -= 1
+        self.undone.append(code)
+        return (disk, target, source)
+
+    def _append(self, code):
+        """ Buffers a record, writing the buffer according to the policy.
+        PARAMETERS:
+        code : record code
+        """
+        self.buffer.append(code)
+        self.records += 1
+        if (len(self.buffer) >= self.batch):
+            self.flush(sync=(self.sync != 'close'))
+        if (self.every) and (self.records >= self.every):
+            self.snapshot()
+
+    def record(self, source, target):
+        """ Records a move that has already been applied to the game.
+        PARAMETERS:
+        source : source rod
+        target : target rod
+        """
+        self.done.append(CODES[(source, target)])
+        self.undone.clear()
+        self._append(self.done[-1])
+
+    def undo(self):
+        """ Reverses the last move (a lifted disk must be placed first).
+        RETURNS:
+        (disk, source, target) tuple of the reversing move, or None
+        """
+        if (self.game.held) or (not self.done):
+            return None
+        move = self._revert()
+        self._append(UNDO)
+        return move
+
+    def redo(self):
+        """ Repeats the last undone move (a lifted disk must be placed first).
+        RETURNS:
+        (disk, source, target) tuple of the repeated move, or None
+        """
+        if (self.game.held) or (not self.undone):
+            return None
+        code = self.undone.pop()
+        self._apply(code)
+        self._append(REDO)
+        (source, target) = MOVES[code]
+        return (self.game.rods.top(target), source, target)
+
+    def flush(self, sync=True):
+        """ Writes the buffered records to the journal file.
+        PARAMETERS:
+        sync : also fsync the journal file
+        """
+        if (self.buffer):
+            self.file.write(self.buffer)
+            self.buffer = bytearray()
+            self.file.flush()
+            if (sync):
+                os.fsync(self.file.fileno())
+
+    def snapshot(self):
+        """ Writes the game state and the journal offset to the snapshot file
+        (replaced atomically), so that a reload starts from here.  The undo
+        history is cleared, since a replay cannot undo past the snapshot.
+        """
+        self.flush()
+        game = self.game
+        rods = Rods(0)
+        rods.height = game.rods.height
+        rods.masks = dict(game.rods.masks)
+        if (game.held):
+            rods.push(game.source, game.held)  # return the lifted disk
+        blob = HEADER.pack(MAGIC, self.file.tell(),
+                           RULE_CODES.index(game.rule)) + dumps(rods, n=game.n)
+        temp = self.path + '.sav.tmp'
+        f = open(temp, 'wb')
+        f.write(blob)
+        f.flush()
+        os.fsync(f.fileno())
+        f.close()
+        os.replace(temp, self.path + '.sav')
+        self.records = 0
+        self.done.clear()
+        self.undone.clear()
+
+    def close(self):
+        """ Writes and syncs the buffered records, then closes the file."""
+        if (self.file.closed):
+            return
+        self.flush()
+        self.file.close()
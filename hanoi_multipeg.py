@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+""" A Python module for solving the Tower of Hanoi puzzle with 4+ rods.
+https://en.wikipedia.org/wiki/Tower_of_Hanoi#Frame%E2%80%93Stewart_algorithm
+History:
+01.00 2026-Oct-17 Scott S. Initial release.
+
+The Frame-Stewart algorithm moves n disks using k rods by first moving the
+top t disks onto a spare rod (using all k rods), then moving the remaining
+(n - t) disks onto the target rod (using the other k - 1 rods), and finally
+moving the top t disks onto the target rod (using all k rods again).  The
+best split t is chosen from a table of the move counts, which is filled in
+once per rod count and then reused for every later solve or query.
+
+The rods are named 'A', 'B', 'C', 'D', ... and the default solution moves
+all of the disks from the first rod onto the last rod.
+
+MIT License
+
+Copyright (c) 2023 TigerPointe Software, LLC
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+Please consider giving to cancer research.
+https://braintumor.org/
+https://www.cancer.org/
+"""
+
+import string
+
+import hanoi_solver
+
+# Define the memoized tables of move counts and best splits, keyed by the
+# number of rods, then indexed by the number of disks
+_counts = {}
+_splits = {}
+
+
+def rod_names(rods=3):
+    """ Returns the rod names for a number of rods.
+    PARAMETERS:
+    rods : number of rods (3 to 26)
+    """
+    if (rods < 3) or (rods > len(string.ascii_uppercase)):
+        raise ValueError(f'Number of rods {rods} is out of range [3-26]')
+    return string.ascii_uppercase[:rods]
+
+
+def _fill(height, rods):
+    """ Extends the count and split tables to cover a tower height.
+    PARAMETERS:
+    height : tower height
+    rods   : number of rods
+    """
+    counts = _counts.setdefault(rods, [0])
+    splits = _splits.setdefault(rods, [0])
+    if (len(counts) > height):
+        return
+    if (rods == 3):
+        for n in range(len(counts), height + 1):
+            counts.append((2 ** n) - 1)
+            splits.append(n - 1)
+        return
+    _fill(height, rods - 1)
+    fewer = _counts[rods - 1]
+    for n in range(len(counts), height + 1):
+        best = None
+        split = 0
+        for t in range(1, n):
+            moves = (2 * counts[t]) + fewer[n - t]
+            if (best is None) or (moves < best):
+                best = moves
+                split = t
+        counts.append(best if (best is not None) else n)
+        splits.append(split)
+
+
+def count_moves(height=0, rods=4):
+    """ Returns the Frame-Stewart move count (O(1) once the table is filled).
+    PARAMETERS:
+    height : tower height
+    rods   : number of rods
+    """
+    rod_names(rods)
+    _fill(height, rods)
+    return _counts[rods][height]
+
+
+def split(height=0, rods=4):
+    """ Returns the best number of top disks moved aside first.
+    PARAMETERS:
+    height : tower height
+    rods   : number of rods
+    """
+    rod_names(rods)
+    _fill(height, rods)
+    return _splits[rods][height]
+
+
+def iter_moves(height=0, rods=4, source=None, target=None):
+    """ Generates the Frame-Stewart solution moves.
+    An explicit stack of pending subproblems is used instead of recursion,
+    and each three-rod subproblem is streamed from the iterative solver.
+    PARAMETERS:
+    height : tower height
+    rods   : number of rods
+    source : source rod (defaults to the first rod)
+    target : target rod (defaults to the last rod)
+    YIELDS:
+    (disk, source, target) tuples, one per move
+    """
+    names = rod_names(rods)
+    source = source or names[0]
+    target = target or names[-1]
+    spares = tuple(name for name in names if name not in (source, target))
+    _fill(height, rods)
+
+    # Each subproblem moves disks (offset + 1) to (offset + n) from the
+    # first rod onto the second rod, using the remaining rods as spares
+    stack = [(0, height, (source, target) + spares)]
+    while (stack):
+        (offset, n, pegs) = stack.pop()
+        if (n < 1):
+            continue
+        if (n == 1):
+            yield (offset + 1, pegs[0], pegs[1])
+            continue
+        if (len(pegs) == 3):
+            for (disk, old, new) in hanoi_solver.iter_moves(
+                    height=n, source=pegs[0], target=pegs[1],
+                    spare=pegs[2]):
+                yield (disk + offset, old, new)
+            continue
+        t = _splits[len(pegs)][n]
+        (first, last, aside) = (pegs[0], pegs[1], pegs[2])
+        others = pegs[3:]
+
+        # Push the three steps in reverse order (the stack is last in,
+        # first out):  the top disks aside, the bottom disks across, then
+        # the top disks back onto the bottom disks
+        stack.append((offset, t, (aside, last, first) + others))
+        stack.append((offset + t, n - t, (first, last) + others))
+        stack.append((offset, t, (first, aside, last) + others))
+
+
+# Start the program interactively
+if __name__ == '__main__':
+    height = int(input('Enter a height for the tower: '))
+    rods = int(input('Enter the number of rods [3-26]: '))
+    names = rod_names(rods)
+    total = count_moves(height=height, rods=rods)
+    print('Solving for', height, 'disks on', rods, 'rods in', f'{total:,}',
+          'moves ...')
+    for (count, (disk, source, target)) in enumerate(
+            iter_moves(height=height, rods=rods), start=1):
+        print(f'{count:,}:', 'Moved disk', disk, 'from', source, 'to', target)
+    print('Solution completed.')
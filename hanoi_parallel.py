@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+""" A Python module for solving the Tower of Hanoi puzzle across processes.
+https://en.wikipedia.org/wiki/Tower_of_Hanoi
+History:
+01.00 2026-Oct-17 Scott S. Initial release.
+01.01 2026-Oct-17 Scott S. Capped the default chunk size.
+
+The move numbers [1, 2 ** height) are split into contiguous chunks.  Each
+worker process computes the rod state at the start of its chunk directly
+from the chunk offset, so every chunk is generated independently.  Results
+are merged back in move order.
+
+Workloads:
+  count  : counts the generated moves
+  verify : applies each move with a legality check and compares the final
+           rods to the expected state at the end of the chunk
+  export : packs the moves as rod pair codes (see hanoi_stream)
+
+MIT License
+
+Copyright (c) 2023 TigerPointe Software, LLC
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+Please consider giving to cancer research.
+https://braintumor.org/
+https://www.cancer.org/
+"""
+
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+import os
+import time
+
+from hanoi_engine import Rods
+from hanoi_solver import iter_moves, state_at
+from hanoi_stream import CODES, StreamWriter
+
+# Define the parallel workloads
+WORKLOADS = ('count', 'verify', 'export')
+
+# Define the largest default number of moves per chunk (at most 2 * workers
+# chunks are pending, so the exported bytes held at once stay bounded)
+CHUNK = 1 << 22
+
+
+def run_chunk(height, lo, hi, workload='count'):
+    """ Runs a workload for the move numbers lo to (hi - 1).
+    PARAMETERS:
+    height   : tower height
+    lo       : first move number
+    hi       : move number to stop before
+    workload : count, verify or export
+    RETURNS:
+    (count, verified, codes) tuple, where codes is only set for export
+    """
+    moves = islice(iter_moves(height=height, start=(lo - 1)), hi - lo)
+
+    # Count the moves
+    if (workload == 'count'):
+        return (sum(1 for _ in moves), True, None)
+
+    # Pack the moves as rod pair codes
+    if (workload == 'export'):
+        codes = CODES
+        packed = bytes(codes[(source, target)]
+                       for (disk, source, target) in moves)
+        return (len(packed), True, packed)
+
+    # Otherwise, apply the moves from the start state of the chunk
+    rods = Rods.from_lists(state_at(height=height, k=(lo - 1)), height=height)
+    count = 0
+    for (disk, source, target) in moves:
+        if (rods.top(source) != disk) or (not rods.can_move(source, target)):
+            return (count, False, None)
+        rods.move(source, target)
+        count += 1
+    expected = Rods.from_lists(state_at(height=height, k=(hi - 1)),
+                               height=height)
+    return (count, rods.masks == expected.masks, None)
+
+
+def solve_parallel(height=0, workload='count', workers=None, chunk=None,
+                   path=None, callback=None):
+    """ Solves the puzzle by running the chunks across worker processes.
+    PARAMETERS:
+    height   : tower height (0 to 64 for export)
+    workload : count, verify or export
+    workers  : number of worker processes (defaults to the CPU count)
+    chunk    : number of moves per chunk (defaults to an even split, of at
+               most CHUNK moves)
+    path     : move stream file written by the export workload
+    callback : function called in move order as callback(lo, result)
+    RETURNS:
+    (count, verified) tuple
+    """
+    if (workload not in WORKLOADS):
+        raise ValueError(f'Unknown workload: {workload}')
+    if (workers is None):
+        workers = os.cpu_count() or 1
+    end = 2 ** height
+    if (chunk is None):
+        chunk = min(max(1 << 16, -(-(end - 1) // (workers * 4))), CHUNK)
+
+    # Open the move stream file, if specified
+    writer = None
+    if (workload == 'export') and (path is not None):
+        writer = StreamWriter(path, height=height)
+
+    # Keep a bounded window of pending chunks, then merge them in order
+    count = 0
+    verified = True
+    pending = deque()
+    starts = iter(range(1, end, chunk))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for lo in islice(starts, workers * 2):
+            pending.append((lo, pool.submit(run_chunk, height, lo,
+                                            min(lo + chunk, end), workload)))
+        while (pending):
+            (lo, future) = pending.popleft()
+            result = future.result()
+            for nxt in islice(starts, 1):
+                pending.append((nxt, pool.submit(run_chunk, height, nxt,
+                                                 min(nxt + chunk, end),
+                                                 workload)))
+            count += result[0]
+            verified = verified and result[1]
+            if (writer is not None):
+                writer.write_codes(result[2])
+            if (callback is not None):
+                callback(lo, result)
+    if (writer is not None):
+        writer.close()
+    return (count, verified and (count == end - 1))
+
+
+# Start the program interactively
+if __name__ == '__main__':
+    height = int(input('Enter a height for the tower: '))
+    workload = input('Enter a workload [count|verify|export]: ') or 'count'
+    path = None
+    if (workload == 'export'):
+        path = input('Enter a file name for the solution: ')
+    start = time.perf_counter()
+    (count, verified) = solve_parallel(height=height, workload=workload,
+                                       path=path)
+    elapsed = time.perf_counter() - start
+    print(f'{count:,}', 'moves', '(verified)' if verified else '(FAILED)',
+          f'in {elapsed:.2f} seconds')
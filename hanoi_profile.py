@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+""" A Python module for profiling the Tower of Hanoi solver and games.
+https://en.wikipedia.org/wiki/Tower_of_Hanoi
+History:
+01.00 2026-Oct-17 Scott S. Initial release.
+01.01 2026-Oct-17 Scott S. Deferred the cProfile imports until required.
+01.02 2026-Oct-18 Scott S. Counted the printed output of the games.
+
+The instrumentation is enabled by the HANOI_PROFILE environment variable:
+  HANOI_PROFILE=1         collect the counters and timers
+  HANOI_PROFILE=cprofile  also run cProfile around solve() and play()
+A summary is printed to standard error at exit, or written to the file named
+by the HANOI_PROFILE_FILE environment variable (with the cProfile statistics
+dumped alongside it, using a .prof extension).
+
+When disabled, the decorators return the original functions and the writer
+returns the original stream, so the instrumented code runs unchanged (the
+remaining hooks are a single flag check per call, not per move).
+
+MIT License
+
+Copyright (c) 2023 TigerPointe Software, LLC
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+Please consider giving to cancer research.
+https://braintumor.org/
+https://www.cancer.org/
+"""
+
+import atexit
+from functools import wraps
+import os
+import sys
+import time
+
+# Read the settings from the environment
+SETTING = os.environ.get('HANOI_PROFILE', '').strip().lower()
+ENABLED = SETTING not in ('', '0', 'no', 'off', 'false')
+CPROFILE = ENABLED and (SETTING == 'cprofile')
+OUTPUT = os.environ.get('HANOI_PROFILE_FILE') or None
+
+# Initialize the counters, timers and the shared profiler
+counters = {}  # totals keyed by name
+timers = {}    # [calls, seconds] lists keyed by name
+profiler = None
+if (CPROFILE):
+    import cProfile  # only imported when requested (slow to import)
+    profiler = cProfile.Profile()
+clock = time.perf_counter
+
+
+def count(name, n=1):
+    """ Adds to a counter (callers check ENABLED first in hot paths).
+    PARAMETERS:
+    name : counter name
+    n    : amount added
+    """
+    counters[name] = counters.get(name, 0) + n
+
+
+def add_time(name, seconds, calls=1):
+    """ Adds to a timer.
+    PARAMETERS:
+    name    : timer name
+    seconds : elapsed seconds
+    calls   : number of calls timed
+    """
+    timer = timers.setdefault(name, [0, 0.0])
+    timer[0] += calls
+    timer[1] += seconds
+
+
+def timed(name):
+    """ Returns a decorator that times every call of a function (or the
+    function unchanged, when disabled).
+    PARAMETERS:
+    name : timer name
+    """
+    def decorate(func):
+        if (not ENABLED):
+            return func
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            start = clock()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                add_time(name, clock() - start)
+        return wrapper
+    return decorate
+
+
+def captured(func):
+    """ Decorates an entry point (such as solve or play) to be timed, and
+    run under cProfile when requested (or returns it unchanged, when
+    disabled).
+    PARAMETERS:
+    func : function to be decorated
+    """
+    if (not ENABLED):
+        return func
+    name = func.__module__ + '.' + func.__qualname__
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        start = clock()
+        active = (profiler is not None) and (not wrapper.depth)
+        wrapper.depth += 1
+        if (active):
+            profiler.enable()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            if (active):
+                profiler.disable()
+            wrapper.depth -= 1
+            add_time(name, clock() - start)
+    wrapper.depth = 0
+    return wrapper
+
+
+class _Writer:
+    """ Counts the bytes and times the writes of an output stream."""
+
+    def __init__(self, stream, name):
+        """ Initializes the writer.
+        PARAMETERS:
+        stream : output stream
+        name   : counter and timer name
+        """
+        self.stream = stream
+        self.name = name
+
+    def write(self, text):
+        """ Writes text to the stream.
+        PARAMETERS:
+        text : output text
+        """
+        start = clock()
+        result = self.stream.write(text)
+        add_time(self.name + ' write', clock() - start)
+        count(self.name + ' bytes', len(text.encode('utf-8', 'replace')))
+        return result
+
+    def flush(self):
+        """ Flushes the stream."""
+        start = clock()
+        self.stream.flush()
+        add_time(self.name + ' flush', clock() - start)
+
+    def __getattr__(self, attr):
+        return getattr(self.stream, attr)
+
+
+def writer(stream, name):
+    """ Returns an output stream that counts the bytes written (or the stream
+    unchanged, when disabled).  A stream that is already counted (such as the
+    standard output within printed) is unwrapped, so that no bytes are
+    counted twice.
+    PARAMETERS:
+    stream : output stream
+    name   : counter and timer name
+    """
+    if (not ENABLED):
+        return stream
+    if (isinstance(stream, _Writer)):
+        stream = stream.stream
+    return _Writer(stream, name)
+
+
+def printed(name):
+    """ Returns a decorator that counts the bytes written to the standard
+    output (including by print) during every call of a function (or the
+    function unchanged, when disabled).
+    PARAMETERS:
+    name : counter and timer name
+    """
+    def decorate(func):
+        if (not ENABLED):
+            return func
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            stdout = sys.stdout
+            sys.stdout = writer(stdout, name)
+            try:
+                return func(*args, **kwargs)
+            finally:
+                sys.stdout = stdout
+        return wrapper
+    return decorate
+
+
+def summary():
+    """ Returns the counters, timers and cProfile statistics as text."""
+    lines = ['HANOI_PROFILE summary']
+    if (counters):
+        lines.append(f'  {"counter":40} {"total":>16}')
+        for name in sorted(counters):
+            lines.append(f'  {name:40} {counters[name]:16,}')
+    if (timers):
+        lines.append(f'  {"timer":40} {"calls":>10} {"seconds":>12} '
+                     f'{"mean ms":>10}')
+        for name in sorted(timers):
+            (calls, seconds) = timers[name]
+            lines.append(f'  {name:40} {calls:10,} {seconds:12.4f} '
+                         f'{(seconds * 1000 / max(calls, 1)):10.4f}')
+    if (profiler is not None) and (profiler.getstats()):
+        import io
+        import pstats
+        text = io.StringIO()
+        pstats.Stats(profiler, stream=text).sort_stats(
+            'cumulative').print_stats(20)
+        lines.append(text.getvalue())
+    return '\n'.join(lines) + '\n'
+
+
+def report():
+    """ Writes the summary to the output file, or to standard error."""
+    if (not counters) and (not timers):
+        return
+    if (OUTPUT is None):
+        sys.stderr.write(summary())
+        return
+    f = open(OUTPUT, 'w')
+    f.write(summary())
+    f.close()
+    if (profiler is not None) and (profiler.getstats()):
+        profiler.dump_stats(os.path.splitext(OUTPUT)[0] + '.prof')
+
+
+# Print the summary at exit, when enabled
+if (ENABLED):
+    atexit.register(report)
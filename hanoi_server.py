@@ -0,0 +1,337 @@
+#!/usr/bin/env python3
+""" A Python module for hosting many Tower of Hanoi games over a socket.
+https://en.wikipedia.org/wiki/Tower_of_Hanoi
+History:
+01.00 2026-Oct-17 Scott S. Initial release.
+01.01 2026-Oct-17 Scott S. Added the lift and place load test.
+01.02 2026-Oct-18 Scott S. Rejected the invalid heights and long lines.
+
+A single asyncio process holds all of the game sessions.  Between commands,
+each session is kept only as its compact serialized state (see dumps in
+hanoi_engine, a few bytes for a small tower), and is restored into a Game
+object just for the command being handled, so that many idle sessions can be
+held in a small amount of memory.
+
+The protocol is one command per line, answered by one line starting with ok
+or error (over TCP, or a Unix socket when a path is given):
+  new [height]         start a session (3 disks by default)  -> ok id height
+  use id               switch to an existing session          -> ok id height
+  select rod           lift or place a disk (A, B or C)       -> ok action
+                                                                 disk n solved
+  move source target   make a complete move                   -> ok disk n
+                                                                 solved
+  hint                 show the best next move                -> ok disk
+                                                                 source target
+  state                show the rods                          -> ok A=3,2 B=
+                                                                 C=1 held=0 n=1
+  save                 return the session state as hex        -> ok hex
+  load hex             restore the session state from hex     -> ok id height
+  quit                 close the connection                   -> ok bye
+
+MIT License
+
+Copyright (c) 2023 TigerPointe Software, LLC
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+Please consider giving to cancer research.
+https://braintumor.org/
+https://www.cancer.org/
+"""
+
+import asyncio
+import time
+
+from hanoi_engine import NAMES, Game
+from hanoi_solver import hint, hint_place, iter_moves
+
+# Define the default network address
+HOST = '127.0.0.1'
+PORT = 8765
+
+# Define the maximum tower height (the height is stored in a single byte)
+LIMIT = 64
+
+
+class Server:
+    """ Holds the compact state of every game session."""
+
+    def __init__(self):
+        """ Initializes an empty session table."""
+        self.sessions = {}  # serialized game state keyed by session id
+        self.next_id = 1
+        self.commands = 0
+
+    def _hint(self, game):
+        """ Returns the reply for the best next move of a game.
+        PARAMETERS:
+        game : game state
+        """
+
+        # If unset, suggest the first move of the shortest solution
+        rods = game.rods
+        disk = game.held
+        if (disk == 0):
+            move = hint(rods.lists())
+            if (move is None):
+                return 'ok solved'
+            return f'ok {move[0]} {move[1]} {move[2]}'
+
+        # Otherwise, suggest the rod leaving the fewest remaining moves
+        return f'ok {disk} held {hint_place(rods, disk)}'
+
+    def handle(self, line, current):
+        """ Handles a single command line for a connection.
+        PARAMETERS:
+        line    : command line (without the line ending)
+        current : session id of the connection (or None)
+        RETURNS:
+        (reply, session id) tuple
+        """
+        self.commands += 1
+        words = line.split()
+        if (not words):
+            return ('error empty command', current)
+        (command, args) = (words[0].lower(), words[1:])
+
+        # Handle the commands that do not need a session
+        if (command == 'new'):
+            if (args) and ((not args[0].isdigit()) or
+                           (int(args[0]) > LIMIT)):
+                return (f'error height is out of range [0-{LIMIT}]', current)
+            height = int(args[0]) if (args) else 3
+            current = self.next_id
+            self.next_id += 1
+            self.sessions[current] = Game(height).dumps()
+            return (f'ok {current} {height}', current)
+        elif (command == 'use'):
+            if (not args) or (not args[0].isdigit()) or \
+                    (int(args[0]) not in self.sessions):
+                return ('error unknown session', current)
+            current = int(args[0])
+            return (f'ok {current} {self.sessions[current][0]}', current)
+        elif (command == 'quit'):
+            return ('ok bye', current)
+        elif (current is None):
+            return ('error no session, send new first', current)
+
+        # Otherwise, restore the session for the command
+        game = Game.loads(self.sessions[current])
+        if (command == 'select') and (len(args) == 1) and \
+                (args[0].upper() in NAMES):
+            result = game.select(args[0].upper())
+            reply = (f"ok {result['action']} {result['disk']} {result['n']} "
+                     f"{int(result['solved'])}")
+        elif (command == 'move') and (len(args) == 2):
+            try:
+                game.apply_moves(((args[0].upper(), args[1].upper()),))
+            except ValueError:
+                return ('error illegal move', current)
+            reply = (f'ok {game.rods.top(args[1].upper())} {game.n} '
+                     f'{int(game.solved())}')
+        elif (command == 'hint'):
+            return (self._hint(game), current)
+        elif (command == 'state'):
+            rods = game.rods
+            lists = ' '.join(name + '=' + ','.join(map(str, rods.disks(name)))
+                             for name in NAMES)
+            return (f'ok {lists} held={game.held} n={game.n}', current)
+        elif (command == 'save'):
+            return ('ok ' + self.sessions[current].hex(), current)
+        elif (command == 'load') and (len(args) == 1):
+            try:
+                game = Game.loads(bytes.fromhex(args[0]))
+            except ValueError:
+                return ('error invalid state', current)
+            if (game.height > LIMIT):
+                return (f'error height is out of range [0-{LIMIT}]', current)
+            reply = f'ok {current} {game.height}'
+        else:
+            return ('error unknown command: ' + line.strip(), current)
+        self.sessions[current] = game.dumps()
+        return (reply, current)
+
+    async def serve_client(self, reader, writer):
+        """ Handles the commands of a connection until it is closed.
+        PARAMETERS:
+        reader : stream reader
+        writer : stream writer
+        """
+        current = None
+        try:
+            while (True):
+                line = await _readline(reader)
+                if (line == b''):
+                    break
+                try:
+                    if (line is None):
+                        reply = 'error line is too long'
+                    else:
+                        (reply, current) = self.handle(line.decode('ascii'),
+                                                       current)
+                except (UnicodeDecodeError, ValueError) as e:
+                    reply = 'error ' + str(e)
+                writer.write(reply.encode('ascii') + b'\n')
+                if (reply == 'ok bye'):
+                    break
+
+                # Only wait for the socket when its buffer is filling up
+                # (pipelined commands are answered in a single write)
+                if (writer.transport.get_write_buffer_size() > 65536):
+                    await writer.drain()
+            await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+
+async def _readline(reader):
+    """ Reads a command line, skipping the whole of any over-long line.
+    PARAMETERS:
+    reader : stream reader
+    RETURNS:
+    line (with its line ending), empty bytes at the end of the stream, or
+    None when the line was over the stream limit
+    """
+    skip = False
+    while (True):
+        try:
+            line = await reader.readuntil(b'\n')
+        except asyncio.IncompleteReadError as e:
+            line = e.partial  # the last line, or empty at the end
+        except asyncio.LimitOverrunError as e:
+
+            # Drop what has been read so far, then the rest of the line
+            await reader.readexactly(e.consumed)
+            skip = True
+            continue
+        return None if (skip) else line
+
+
+async def serve(host=HOST, port=PORT, path=None, server=None):
+    """ Serves the game sessions until cancelled.
+    PARAMETERS:
+    host   : TCP host name
+    port   : TCP port number
+    path   : Unix socket path (used instead of TCP when specified)
+    server : session table (defaults to a new Server)
+    """
+    if (server is None):
+        server = Server()
+    if (path is not None):
+        listener = await asyncio.start_unix_server(server.serve_client,
+                                                   path=path)
+    else:
+        listener = await asyncio.start_server(server.serve_client, host, port)
+    async with listener:
+        await listener.serve_forever()
+
+
+async def _load_client(height, games, pipeline, host, port, path,
+                       select=False):
+    """ Plays complete games on one connection.
+    PARAMETERS:
+    height   : tower height
+    games    : number of games to play
+    pipeline : number of commands sent before reading the replies
+    host     : TCP host name
+    port     : TCP port number
+    path     : Unix socket path (used instead of TCP when specified)
+    select   : lift and place each disk using two select commands, so that
+               every lifted disk is saved and restored between them
+    RETURNS:
+    (commands, solved) tuple
+    """
+    if (path is not None):
+        (reader, writer) = await asyncio.open_unix_connection(path)
+    else:
+        (reader, writer) = await asyncio.open_connection(host, port)
+    if (select):
+        lines = [f'select {rod}\n'.encode('ascii')
+                 for (disk, source, target) in iter_moves(height=height)
+                 for rod in (source, target)]
+    else:
+        lines = [f'move {source} {target}\n'.encode('ascii')
+                 for (disk, source, target) in iter_moves(height=height)]
+    commands = 0
+    solved = 0
+    for game in range(games):
+        writer.write(f'new {height}\n'.encode('ascii'))
+        await reader.readline()
+        commands += 1
+        reply = b''
+        for lo in range(0, len(lines), pipeline):
+            batch = lines[lo:(lo + pipeline)]
+            writer.writelines(batch)
+            await writer.drain()
+            for line in batch:
+                reply = await reader.readline()
+            commands += len(batch)
+        if (reply.endswith(b' 1\n')):
+            solved += 1
+    writer.write(b'quit\n')
+    await reader.readline()
+    writer.close()
+    await writer.wait_closed()
+    return (commands, solved)
+
+
+async def load_test(height=10, clients=10, games=10, pipeline=64, host=HOST,
+                    port=PORT, path=None, select=False):
+    """ Measures the command throughput of a running server, where every
+    client plays complete games using the optimal moves (a game is only
+    counted as solved when its last reply reports the solution).
+    PARAMETERS:
+    height   : tower height
+    clients  : number of concurrent connections
+    games    : number of games played by each client
+    pipeline : number of commands sent before reading the replies
+    host     : TCP host name
+    port     : TCP port number
+    path     : Unix socket path (used instead of TCP when specified)
+    select   : lift and place each disk (see _load_client)
+    RETURNS:
+    (commands, solved, seconds) tuple
+    """
+    start = time.perf_counter()
+    results = await asyncio.gather(*(
+        _load_client(height, games, pipeline, host, port, path, select)
+        for client in range(clients)))
+    seconds = time.perf_counter() - start
+    return (sum(r[0] for r in results), sum(r[1] for r in results), seconds)
+
+
+# Start the program interactively
+if __name__ == '__main__':
+    mode = input('Enter a mode [serve|test]: ') or 'serve'
+    path = input('Enter a Unix socket path [blank for TCP]: ') or None
+    if (mode == 'test'):
+        style = input('Enter a command style [move|select]: ') or 'move'
+        (commands, solved, seconds) = asyncio.run(
+            load_test(path=path, select=(style == 'select')))
+        print(f'{commands:,}', 'commands,', solved, 'games solved',
+              f'in {seconds:.2f} seconds',
+              f'({commands / seconds:,.0f} commands per second)')
+    else:
+        print('Serving, press CTRL+C to stop ...')
+        try:
+            asyncio.run(serve(path=path))
+        except KeyboardInterrupt:
+            pass
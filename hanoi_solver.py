@@ -1,99 +1,746 @@
-#!/usr/bin/env python3
-""" A Python module for solving the Tower of Hanoi puzzle.
-https://en.wikipedia.org/wiki/Tower_of_Hanoi
-History:
-01.00 2023-Oct-10 Scott S. Initial release.
-
-MIT License
-
-Copyright (c) 2023 TigerPointe Software, LLC
-
-Permission is hereby granted, free of charge, to any person obtaining a copy
-of this software and associated documentation files (the "Software"), to deal
-in the Software without restriction, including without limitation the rights
-to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
-copies of the Software, and to permit persons to whom the Software is
-furnished to do so, subject to the following conditions:
-
-The above copyright notice and this permission notice shall be included in all
-copies or substantial portions of the Software.
-
-THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
-IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
-FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
-AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
-LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
-OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
-SOFTWARE.
-
-Please consider giving to cancer research.
-https://braintumor.org/
-https://www.cancer.org/
-"""
-
-
-def solve(height=0):
-    """ Solves the puzzle using a recursive subproblems code pattern.
-    PARAMETERS:
-    height : tower height
-    """
-
-    # Initialize the rods and disk numbers (later accessed using closure)
-    rods = {}
-    rods['A'] = list((x + 1) for x in reversed(range(height)))
-    rods['B'] = list()
-    rods['C'] = list()
-
-    # Initialize the move counters (later updated using nonlocal keyword)
-    total = (2 ** height) - 1
-    count = 0
-
-    def write():
-        """ Writes the disk numbers contained on each rod."""
-        print('  A:', '  '.join(map(str, rods['A'])))
-        print('  B:', '  '.join(map(str, rods['B'])))
-        print('  C:', '  '.join(map(str, rods['C'])))
-
-    def move(n=0, source='A', target='C', spare='B'):
-        """ Moves a disk from the source to the target by way of a spare.
-        PARAMETERS:
-        n      : disk number
-        source : source rod
-        target : target rod
-        spare  : spare rod
-        """
-
-        nonlocal count  # required to assign an updated value
-
-        # Stop the recursion when no more disks can be moved
-        if (n < 1):
-            return
-
-        # Recursively move the next disk from the source to the spare
-        move(n=(n - 1), source=source, target=spare, spare=target)
-
-        # Move the current disk from the source to the target
-        rods[target].append(rods[source].pop(rods[source].index(n)))
-        count += 1
-
-        # Write the output message
-        print(f'{count:,}:', 'Moved disk', n, 'from', source, 'to', target)
-        write()
-
-        # Recursively move the next disk from the spare to the target
-        move(n=(n - 1), source=spare, target=target, spare=source)
-
-    # Write the output header
-    print('Solving for', height, 'disks in', f'{total:,}', 'moves ...')
-    write()
-
-    # Solve the puzzle recursively, starting with the largest disk and then
-    # working backwards
-    move(n=height)
-    print('Solution completed.')
-
-
-# Start the program interactively
-if __name__ == '__main__':
-    height = int(input('Enter a height for the tower: '))
-    solve(height)
+#!/usr/bin/env python3
+""" A Python module for solving the Tower of Hanoi puzzle.
+https://en.wikipedia.org/wiki/Tower_of_Hanoi
+History:
+01.00 2023-Oct-10 Scott S. Initial release.
+01.01 2026-Oct-17 Scott S. Added an iterative move generator.
+01.02 2026-Oct-17 Scott S. Added random-access move and state queries.
+01.03 2026-Oct-17 Scott S. Moved the rod state onto the shared engine.
+01.04 2026-Oct-17 Scott S. Added the buffered output modes.
+01.05 2026-Oct-17 Scott S. Added solving between any two configurations.
+01.06 2026-Oct-17 Scott S. Added the optional profiling hooks.
+01.07 2026-Oct-17 Scott S. Added the cyclic and adjacent rule sets.
+01.08 2026-Oct-17 Scott S. Replayed the small disks from a cached block.
+
+MIT License
+
+Copyright (c) 2023 TigerPointe Software, LLC
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+Please consider giving to cancer research.
+https://braintumor.org/
+https://www.cancer.org/
+"""
+
+from functools import lru_cache
+from itertools import islice
+import sys
+
+from hanoi_engine import NAMES, Rods
+import hanoi_profile
+
+# Define the number of small disks replayed as a cached block of moves
+BLOCK = 10
+BLOCK3 = 6  # for the cyclic and adjacent rules (about 3 ** BLOCK3 moves)
+
+# Define the move count tables of each rule set (indexed by tower height,
+# see move_count), along with the one step cyclic tower moves
+COUNTS = {'classic': [0], 'cyclic': [0], 'adjacent': [0]}
+_ONESTEP = [0]
+
+# Define the output modes for the solver
+#   silent : writes only the move count and a verification
+#   moves  : writes each move message
+#   full   : writes each move message and the rods
+#   every  : writes the move message and the rods for every Nth move
+MODES = ('silent', 'moves', 'full', 'every')
+
+
+def _steps(height=0):
+    """ Returns the rod cycle step for each disk number (index 0 unused).
+    PARAMETERS:
+    height : tower height
+    """
+    step = [0] * (height + 1)
+    for disk in range(1, height + 1):
+        step[disk] = 2 if (((height - disk) % 2) == 0) else 1
+    return step
+
+
+def _moved(k=0, disk=1):
+    """ Returns the number of times a disk has moved within the first k moves.
+    Disk d moves on every odd multiple of 2 ** (d - 1).
+    PARAMETERS:
+    k    : number of moves
+    disk : disk number
+    """
+    return ((k >> (disk - 1)) + 1) >> 1
+
+
+def _iter_simple(height=0, source='A', target='C', spare='B', start=0):
+    """ Generates the solution moves one at a time (see iter_moves).
+    PARAMETERS:
+    height : tower height
+    source : source rod
+    target : target rod
+    spare  : spare rod
+    start  : number of moves to skip (resumes after move number start)
+    """
+
+    # Order the rods as a cycle (source -> spare -> target -> source)
+    rods = (source, spare, target)
+
+    # Initialize the rod position and cycle step for each disk number
+    # (positions are computed directly from the bits of the start counter)
+    step = _steps(height)
+    pos = [0] * (height + 1)
+    for disk in range(1, height + 1):
+        pos[disk] = (_moved(start, disk) * step[disk]) % 3
+
+    # Move the disk numbered by the lowest set bit of each move counter
+    for k in range(start + 1, 2 ** height):
+        disk = (k & -k).bit_length()
+        old = pos[disk]
+        new = (old + step[disk]) % 3
+        pos[disk] = new
+        yield (disk, rods[old], rods[new])
+
+
+@lru_cache(maxsize=None)
+def _block(height=0, source='A', target='C', spare='B'):
+    """ Returns the complete solution for a small tower as a cached tuple.
+    PARAMETERS:
+    height : tower height
+    source : source rod
+    target : target rod
+    spare  : spare rod
+    """
+    return tuple(_iter_simple(height=height, source=source,
+                              target=target, spare=spare))
+
+
+def iter_moves(height=0, source='A', target='C', spare='B', start=0):
+    """ Generates the solution moves iteratively, without any recursion.
+    The k-th move always belongs to the disk numbered by the lowest set bit
+    of k, and every disk travels around the rods in a fixed cycle whose
+    direction depends upon the parity of (height - disk).  Disks having the
+    same parity as the tower height step from the source directly to the
+    target, while all of the other disks step from the source to the spare.
+    Only the current rod of each disk is tracked, so each move is generated
+    in constant time using constant stack depth.
+    Between two moves of the larger disks, the smallest BLOCK disks always
+    travel together as a complete tower, so those runs of moves are replayed
+    from a cached block instead of being generated one at a time.
+    PARAMETERS:
+    height : tower height
+    source : source rod
+    target : target rod
+    spare  : spare rod
+    start  : number of moves to skip (resumes after move number start)
+    YIELDS:
+    (disk, source, target) tuples, one per move
+    """
+    end = 2 ** height
+    if (start < 0) or (start >= end):
+        raise ValueError(f'Move {start} is out of range for {height} disks')
+
+    # Generate the moves one at a time until reaching a block boundary
+    small = min(height, BLOCK)
+    size = 1 << small
+    if ((start % size) != 0):
+        stop = min(start - (start % size) + size, end - 1)
+        yield from islice(_iter_simple(height=height, source=source,
+                                       target=target, spare=spare,
+                                       start=start), stop - start)
+        start = stop
+    if (small < 1) or (start >= (end - 1)):
+        return
+
+    # Order the rods as a cycle (source -> spare -> target -> source)
+    rods = (source, spare, target)
+
+    # Initialize the rod position and cycle step for each disk number
+    step = _steps(height)
+    pos = [0] * (height + 1)
+    for disk in range(small, height + 1):
+        pos[disk] = (_moved(start, disk) * step[disk]) % 3
+
+    # Replay the small tower block, then move the next larger disk
+    for k in range(start + size, end + size, size):
+        old = pos[small]
+        new = (old + step[small]) % 3
+        pos[small] = new
+        yield from _block(small, rods[old], rods[new], rods[3 - old - new])
+        if (k < end):
+            disk = (k & -k).bit_length()
+            old = pos[disk]
+            new = (old + step[disk]) % 3
+            pos[disk] = new
+            yield (disk, rods[old], rods[new])
+
+
+def move_at(height=0, k=1, source='A', target='C', spare='B'):
+    """ Returns the k-th move of the solution in O(height) time.
+    PARAMETERS:
+    height : tower height
+    k      : move number (1 to (2 ** height) - 1)
+    source : source rod
+    target : target rod
+    spare  : spare rod
+    RETURNS:
+    (disk, source, target) tuple
+    """
+    if (k < 1) or (k >= (2 ** height)):
+        raise ValueError(f'Move {k} is out of range for {height} disks')
+    rods = (source, spare, target)
+    disk = (k & -k).bit_length()
+    step = _steps(height)[disk]
+    count = _moved(k, disk)
+    return (disk,
+            rods[((count - 1) * step) % 3],
+            rods[(count * step) % 3])
+
+
+def state_at(height=0, k=0, source='A', target='C', spare='B'):
+    """ Returns the rod configuration after k moves in O(height) time.
+    PARAMETERS:
+    height : tower height
+    k      : number of moves (0 to (2 ** height) - 1)
+    source : source rod
+    target : target rod
+    spare  : spare rod
+    RETURNS:
+    dictionary of disk number lists (bottom to top) keyed by rod
+    """
+    if (k < 0) or (k >= (2 ** height)):
+        raise ValueError(f'Move {k} is out of range for {height} disks')
+    rods = (source, spare, target)
+    state = {source: list(), spare: list(), target: list()}
+    step = _steps(height)
+    for disk in reversed(range(1, height + 1)):
+        state[rods[(_moved(k, disk) * step[disk]) % 3]].append(disk)
+    return state
+
+
+def _extend_counts(height):
+    """ Extends the move count tables of each rule set up to a height.
+    Closed forms are used for the classic (2 ** n - 1) and adjacent
+    (3 ** n - 1) rules.  The cyclic rules use the recurrence of its two
+    mutually recursive moves, where a tower moves one step clockwise in
+    Q(n) = 2 R(n - 1) + 1 moves, or two steps in
+    R(n) = 2 R(n - 1) + Q(n - 1) + 2 moves.
+    PARAMETERS:
+    height : tower height
+    """
+    cyclic = COUNTS['cyclic']
+    for n in range(len(COUNTS['classic']), height + 1):
+        COUNTS['classic'].append((1 << n) - 1)
+        COUNTS['adjacent'].append((3 ** n) - 1)
+        _ONESTEP.append((2 * cyclic[n - 1]) + 1)
+        cyclic.append((2 * cyclic[n - 1]) + _ONESTEP[n - 1] + 2)
+
+
+def move_count(height=0, rule='classic'):
+    """ Returns the number of moves in the shortest solution of a rule set
+    (moving the tower from rod A to rod C), from the precomputed tables.
+    PARAMETERS:
+    height : tower height
+    rule   : rule set name (classic, cyclic or adjacent)
+    """
+    if (rule not in COUNTS):
+        raise ValueError(f'Unknown rule set: {rule}')
+    if (height >= len(COUNTS[rule])):
+        _extend_counts(height)
+    return COUNTS[rule][height]
+
+
+# Precompute the move counts of each rule set for the usual tower heights
+_extend_counts(64)
+
+
+def _iter_cyclic(height, rods, small, steps=2):
+    """ Generates the cyclic solution moves (see iter_cyclic).
+    PARAMETERS:
+    height : tower height
+    rods   : rod names in clockwise order, starting from the tower
+    small  : number of small disks replayed from the cached blocks
+    steps  : number of clockwise steps travelled by the tower (1 or 2)
+    """
+
+    # Each stack entry is (steps, disks, rod index), where a tower of disks
+    # travels one or two steps clockwise, or where zero steps moves the
+    # single disk numbered by disks one step clockwise
+    stack = [(steps, height, 0)]
+    while (stack):
+        (steps, n, i) = stack.pop()
+        if (steps == 0):
+            yield (n, rods[i], rods[(i + 1) % 3])
+        elif (n == 0):
+            continue
+        elif (n <= small):
+            yield from _cyclic_block(steps, n, rods[i], rods[(i + 1) % 3],
+                                     rods[(i + 2) % 3])
+        elif (steps == 1):
+
+            # Q(n): the smaller tower travels two steps out of the way, the
+            # disk moves, then the smaller tower travels two steps onto it
+            stack.append((2, n - 1, (i + 2) % 3))
+            stack.append((0, n, i))
+            stack.append((2, n - 1, i))
+        else:
+
+            # R(n): the disk moves twice, while the smaller tower travels
+            # two steps, one step and two steps around it
+            stack.append((2, n - 1, i))
+            stack.append((0, n, (i + 1) % 3))
+            stack.append((1, n - 1, (i + 2) % 3))
+            stack.append((0, n, i))
+            stack.append((2, n - 1, i))
+
+
+@lru_cache(maxsize=None)
+def _cyclic_block(steps, height, first, second, third):
+    """ Returns a cyclic tower move for a small tower as a cached tuple.
+    PARAMETERS:
+    steps  : number of clockwise steps travelled by the tower (1 or 2)
+    height : tower height
+    first  : rod name on which the tower starts
+    second : next rod name clockwise
+    third  : last rod name clockwise
+    """
+    return tuple(_iter_cyclic(height, (first, second, third), 0, steps))
+
+
+def iter_cyclic(height=0, source='A', target='C', spare='B'):
+    """ Generates the shortest solution when the disks may only move
+    clockwise around the rods (source -> spare -> target -> source), so the
+    tower travels two steps.  The two mutually recursive tower moves (one
+    step and two steps) are expanded on an explicit stack, so the stack
+    depth is bounded by the tower height rather than Python recursion, and
+    the smallest BLOCK3 disks are replayed from cached blocks of moves.
+    PARAMETERS:
+    height : tower height
+    source : source rod
+    target : target rod
+    spare  : spare rod (the next rod clockwise from the source)
+    YIELDS:
+    (disk, source, target) tuples, one per move
+    """
+    yield from _iter_cyclic(height, (source, spare, target),
+                            min(height, BLOCK3))
+
+
+@lru_cache(maxsize=None)
+def _adjacent_block(height=0, source='A', target='C', spare='B'):
+    """ Returns the adjacent solution for a small tower as a cached tuple.
+    PARAMETERS:
+    height : tower height
+    source : source rod (an end rod)
+    target : target rod (the other end rod)
+    spare  : spare rod (the middle rod)
+    """
+    return tuple(_iter_adjacent(height=height, source=source, target=target,
+                                spare=spare))
+
+
+def _iter_adjacent(height=0, source='A', target='C', spare='B', small=0):
+    """ Generates the adjacent solution moves (see iter_adjacent).
+    PARAMETERS:
+    height : tower height
+    source : source rod (an end rod)
+    target : target rod (the other end rod)
+    spare  : spare rod (the middle rod)
+    small  : number of small disks replayed from the cached blocks
+    """
+    rods = (source, spare, target)
+    wave = (0, 1, 2, 1)  # rod index after each move, oscillating end to end
+    moved = [0] * (height + 1)
+    blocks = ((), ())
+    if (small > 0):
+        blocks = (_adjacent_block(small, source, target, spare),
+                  _adjacent_block(small, target, source, spare))
+    yield from blocks[0]
+    for k in range(1, 3 ** (height - small)):
+
+        # Move the disk numbered by the count of trailing ternary zeros of k
+        disk = small + 1
+        j = k
+        while ((j % 3) == 0):
+            j //= 3
+            disk += 1
+        count = moved[disk]
+        moved[disk] = count + 1
+        yield (disk, rods[wave[count & 3]], rods[wave[(count + 1) & 3]])
+
+        # Then move the small tower end to end (alternating the direction)
+        yield from blocks[k & 1]
+
+
+def iter_adjacent(height=0, source='A', target='C', spare='B'):
+    """ Generates the shortest solution when the disks may only move between
+    neighbouring rods (source <-> spare <-> target), in 3 ** height - 1
+    moves.  The k-th move belongs to the disk numbered by one more than the
+    count of trailing zeros of k in base 3, and every disk oscillates from
+    end to end (source, spare, target, spare, source, ...), so only the
+    number of moves of each disk is tracked.  Between two moves of the
+    larger disks, the smallest BLOCK3 disks always travel end to end as a
+    complete tower, so those runs of moves are replayed from cached blocks.
+    PARAMETERS:
+    height : tower height
+    source : source rod (an end rod)
+    target : target rod (the other end rod)
+    spare  : spare rod (the middle rod)
+    YIELDS:
+    (disk, source, target) tuples, one per move
+    """
+    yield from _iter_adjacent(height=height, source=source, target=target,
+                              spare=spare, small=min(height, BLOCK3))
+
+
+# Define the move generator of each rule set
+GENERATORS = {'classic': iter_moves, 'cyclic': iter_cyclic,
+              'adjacent': iter_adjacent}
+
+
+def iter_rule(height=0, rule='classic', source='A', target='C', spare='B'):
+    """ Generates the shortest solution for a rule set (see RULES in
+    hanoi_engine), using the move generator of the rule set.
+    PARAMETERS:
+    height : tower height
+    rule   : rule set name (classic, cyclic or adjacent)
+    source : source rod
+    target : target rod
+    spare  : spare rod
+    RETURNS:
+    generator of (disk, source, target) tuples, one per move
+    """
+    if (rule not in GENERATORS):
+        raise ValueError(f'Unknown rule set: {rule}')
+    return GENERATORS[rule](height=height, source=source, target=target,
+                            spare=spare)
+
+
+def _positions(config):
+    """ Returns the rod name of each disk number (index 0 unused).
+    PARAMETERS:
+    config : dictionary of disk number lists keyed by rod
+    """
+    height = max([0] + [max(disks, default=0) for disks in config.values()])
+    pos = [None] * (height + 1)
+    for (rod, disks) in config.items():
+        for disk in disks:
+            pos[disk] = rod
+    return pos
+
+
+def _plan(pos, k, rod, rods):
+    """ Plans the gathering of disks 1 to k (from any legal configuration)
+    onto a single rod, starting with the largest disk.  Whenever a disk is
+    not already on the rod, the smaller disks must first be gathered onto
+    the third rod, so the rod changes for the remaining smaller disks.
+    PARAMETERS:
+    pos  : rod name of each disk number
+    k    : number of disks to gather
+    rod  : rod to gather onto
+    rods : all three rod names
+    RETURNS:
+    list of (disk, source, target) moves of the planned disks, largest first
+    """
+    plan = []
+    for disk in range(k, 0, -1):
+        if (pos[disk] != rod):
+            plan.append((disk, pos[disk], rod))
+            rod = _third(rods, pos[disk], rod)
+    return plan
+
+
+def _cost(plan):
+    """ Returns the number of moves required to carry out a plan.
+    Each planned disk moves once, after which the smaller disks are moved
+    onto it as a complete tower, for 2 ** (disk - 1) moves in total.
+    PARAMETERS:
+    plan : planned moves (see _plan)
+    """
+    return sum(1 << (disk - 1) for (disk, source, target) in plan)
+
+
+def _third(rods, first, second):
+    """ Returns the rod name that is neither of the two given rod names.
+    PARAMETERS:
+    rods   : all three rod names
+    first  : first rod name
+    second : second rod name
+    """
+    for rod in rods:
+        if (rod != first) and (rod != second):
+            return rod
+
+
+def _iter_gather(plan, rods):
+    """ Generates the moves that gather the planned disks onto one rod.
+    PARAMETERS:
+    plan : planned moves (see _plan)
+    rods : all three rod names
+    """
+    for (disk, source, target) in reversed(plan):
+        yield (disk, source, target)
+        spare = _third(rods, source, target)
+        yield from iter_moves(height=(disk - 1), source=spare, target=target,
+                              spare=source)
+
+
+def _iter_spread(plan, rods):
+    """ Generates the moves that spread a tower out to the planned disks.
+    This is the reverse of gathering the target configuration onto the rod.
+    PARAMETERS:
+    plan : planned moves for the target configuration (see _plan)
+    rods : all three rod names
+    """
+    for (disk, source, target) in plan:
+        spare = _third(rods, source, target)
+        yield from iter_moves(height=(disk - 1), source=target, target=spare,
+                              spare=source)
+        yield (disk, target, source)
+
+
+def _route(start, goal):
+    """ Chooses the shortest route between two configurations.
+    Only the largest disk that differs must be moved; every larger disk
+    stays in place.  That disk either moves directly to its goal rod (the
+    smaller disks are gathered onto the third rod), or moves twice by way
+    of the third rod (the smaller disks are gathered onto the goal rod,
+    then moved as a tower back onto the start rod).  Both costs are counted
+    in O(height) and the cheaper route is returned.
+    PARAMETERS:
+    start : dictionary of disk number lists keyed by rod
+    goal  : dictionary of disk number lists keyed by rod
+    RETURNS:
+    (count, steps) tuple, where steps lists the route as plans and moves
+    """
+    rods = tuple(start.keys())
+    src = _positions(start)
+    dst = _positions(goal)
+    if (len(src) != len(dst)) or (set(goal.keys()) != set(rods)):
+        raise ValueError('Both configurations must hold the same disks/rods')
+    disk = len(src) - 1
+    while (disk > 0) and (src[disk] == dst[disk]):
+        disk -= 1
+    if (disk < 1):
+        return (0, [])
+    source = src[disk]
+    target = dst[disk]
+    spare = _third(rods, source, target)
+
+    # Direct route (the largest differing disk moves once)
+    gather = _plan(src, disk - 1, spare, rods)
+    spread = _plan(dst, disk - 1, spare, rods)
+    direct = _cost(gather) + 1 + _cost(spread)
+
+    # Indirect route (the largest differing disk moves twice)
+    gather2 = _plan(src, disk - 1, target, rods)
+    spread2 = _plan(dst, disk - 1, source, rods)
+    indirect = _cost(gather2) + (1 << (disk - 1)) + 1 + _cost(spread2)
+
+    if (direct <= indirect):
+        return (direct, [('gather', gather), ('move', (disk, source, target)),
+                         ('spread', spread)])
+    return (indirect, [('gather', gather2), ('move', (disk, source, spare)),
+                       ('tower', (disk - 1, target, source, spare)),
+                       ('move', (disk, spare, target)),
+                       ('spread', spread2)])
+
+
+def _goal(start, rod='C'):
+    """ Returns the configuration having all of the disks on one rod.
+    PARAMETERS:
+    start : dictionary of disk number lists keyed by rod
+    rod   : goal rod name
+    """
+    height = len(_positions(start)) - 1
+    goal = {name: list() for name in start.keys()}
+    goal[rod] = list(range(height, 0, -1))
+    return goal
+
+
+def iter_solution(start, goal=None):
+    """ Generates the shortest move sequence between two configurations.
+    PARAMETERS:
+    start : dictionary of disk number lists keyed by rod (bottom to top)
+    goal  : dictionary of disk number lists keyed by rod (defaults to all of
+            the disks on rod C)
+    YIELDS:
+    (disk, source, target) tuples, one per move
+    """
+    if (goal is None):
+        goal = _goal(start)
+    rods = tuple(start.keys())
+    (count, steps) = _route(start, goal)
+    for (kind, step) in steps:
+        if (kind == 'gather'):
+            yield from _iter_gather(step, rods)
+        elif (kind == 'spread'):
+            yield from _iter_spread(step, rods)
+        elif (kind == 'tower'):
+            yield from iter_moves(*step)
+        else:
+            yield step
+
+
+def count_solution(start, goal=None):
+    """ Returns the shortest number of moves between two configurations.
+    PARAMETERS:
+    start : dictionary of disk number lists keyed by rod (bottom to top)
+    goal  : dictionary of disk number lists keyed by rod (defaults to all of
+            the disks on rod C)
+    """
+    if (goal is None):
+        goal = _goal(start)
+    return _route(start, goal)[0]
+
+
+def hint(start, goal=None):
+    """ Returns the best next move between two configurations in O(height).
+    PARAMETERS:
+    start : dictionary of disk number lists keyed by rod (bottom to top)
+    goal  : dictionary of disk number lists keyed by rod (defaults to all of
+            the disks on rod C)
+    RETURNS:
+    (disk, source, target) tuple, or None when already at the goal
+    """
+    return next(iter_solution(start, goal), None)
+
+
+def hint_place(rods, disk):
+    """ Returns the best rod for placing a lifted disk, being the rod that
+    leaves the fewest remaining moves (each fitting rod is counted in
+    O(height)).
+    PARAMETERS:
+    rods : rods without the lifted disk (Rods object, restored on return)
+    disk : lifted disk number
+    RETURNS:
+    rod name
+    """
+    best = None
+    for rod in NAMES:
+        top = rods.top(rod)
+        if (top == 0) or (disk < top):
+            rods.push(rod, disk)
+            count = count_solution(rods.lists())
+            rods.pop(rod)
+            if (best is None) or (count < best[0]):
+                best = (count, rod)
+    return best[1]
+
+
+@hanoi_profile.captured
+def solve(height=0, mode='full', every=1, out=None, chunk=65536,
+          rule='classic'):
+    """ Solves the puzzle using the iterative move generator.
+    All of the output is collected by a single buffered writer and written
+    in large chunks, rather than printing each line separately.
+    PARAMETERS:
+    height : tower height
+    mode   : output mode (silent, moves, full or every)
+    every  : number of moves between each written board (every mode only)
+    out    : output stream (defaults to standard output)
+    chunk  : number of buffered characters written at once
+    rule   : rule set name (classic, cyclic or adjacent)
+    RETURNS:
+    number of moves applied
+    """
+    if (mode not in MODES):
+        raise ValueError(f'Unknown output mode: {mode}')
+    if (mode == 'every') and (every < 1):
+        raise ValueError(f'Invalid number of moves between boards: {every}')
+    moves = iter_rule(height=height, rule=rule)
+    if (out is None):
+        out = sys.stdout
+    out = hanoi_profile.writer(out, 'solve output')
+
+    # Initialize the rods and disk numbers
+    rods = Rods(height)
+
+    # Initialize the move counters
+    total = move_count(height, rule)
+    count = 0
+
+    # Initialize the output buffer (later updated using nonlocal keyword)
+    buffer = []
+    size = 0
+
+    def flush():
+        """ Writes the buffered output to the stream."""
+        nonlocal size  # required to assign an updated value
+        out.write(''.join(buffer))
+        buffer.clear()
+        size = 0
+
+    def write(text):
+        """ Appends text to the buffered output.
+        PARAMETERS:
+        text : output text
+        """
+        nonlocal size  # required to assign an updated value
+        buffer.append(text)
+        size += len(text)
+        if (size >= chunk):
+            flush()
+
+    def write_rods():
+        """ Writes the disk numbers contained on each rod."""
+        write('  A: ' + '  '.join(map(str, rods.disks('A'))) + '\n' +
+              '  B: ' + '  '.join(map(str, rods.disks('B'))) + '\n' +
+              '  C: ' + '  '.join(map(str, rods.disks('C'))) + '\n')
+
+    # Write the output header
+    label = '' if (rule == 'classic') else f' ({rule} rules)'
+    write(f'Solving for {height} disks in {total:,} moves{label} ...\n')
+    if (mode in ('full', 'every')):
+        write_rods()
+
+    # Solve the puzzle iteratively (the moved disk is always on top of the
+    # source rod, so no searching is required)
+    if (mode == 'silent'):
+        count = rods.apply(moves)
+    else:
+        for (n, source, target) in moves:
+            rods.move(source, target)
+            count += 1
+            if (mode == 'every') and ((count % every) != 0):
+                continue
+
+            # Write the output message
+            write(f'{count:,}: Moved disk {n} from {source} to {target}\n')
+            if (mode != 'moves'):
+                write_rods()
+
+    # Write the verification (silent mode only) and the output footer
+    if (mode == 'silent'):
+        if (count == total) and (rods.solved()):
+            write(f'Verified {count:,} moves, all disks are on rod C.\n')
+        else:
+            write(f'Verification failed after {count:,} moves.\n')
+    write('Solution completed.\n')
+    flush()
+    if (hanoi_profile.ENABLED):
+        hanoi_profile.count('solve moves', count)
+    return count
+
+
+# Start the program interactively
+if __name__ == '__main__':
+    height = int(input('Enter a height for the tower: '))
+    mode = input('Enter an output mode [silent|moves|full|every]: ')
+    every = 1
+    if (mode == 'every'):
+        every = int(input('Write the rods after every how many moves? '))
+    rule = input('Enter a rule set [classic|cyclic|adjacent]: ')
+    solve(height, mode=(mode or 'full'), every=every,
+          rule=(rule or 'classic'))
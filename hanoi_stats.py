@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+""" A Python module for the closed-form statistics of Tower of Hanoi solutions.
+https://en.wikipedia.org/wiki/Tower_of_Hanoi
+History:
+01.00 2026-Oct-17 Scott S. Initial release.
+
+The statistics of the optimal solution are computed from its structure,
+without generating any moves, so every function runs in O(height) integer
+operations (Python integers are arbitrary-precision, so a height of 64 or
+1,000 is answered at once).  Disk d moves 2 ** (height - d) times, and its
+n-th move is move number (2 ** (d - 1)) * ((2 * n) - 1).  Every disk travels
+around the rods in a fixed cycle: from the source to the target when
+(height - d) is even, and otherwise from the source to the spare.
+
+The states are counted from the start (before move 1) to the finish (after
+the last move), so there are 2 ** height states in all.
+
+MIT License
+
+Copyright (c) 2023 TigerPointe Software, LLC
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+Please consider giving to cancer research.
+https://braintumor.org/
+https://www.cancer.org/
+"""
+
+from hanoi_solver import iter_moves
+
+
+def _cycle(height, disk, source='A', target='C', spare='B'):
+    """ Returns the cycle of rods travelled by a disk (starting at the
+    source rod).
+    PARAMETERS:
+    height : tower height
+    disk   : disk number
+    source : source rod
+    target : target rod
+    spare  : spare rod
+    """
+    if (((height - disk) % 2) == 0):
+        return (source, target, spare)
+    return (source, spare, target)
+
+
+def disk_moves(height=0):
+    """ Returns the number of moves of each disk.
+    PARAMETERS:
+    height : tower height
+    RETURNS:
+    dictionary of move counts keyed by disk number
+    """
+    return {disk: 1 << (height - disk) for disk in range(1, height + 1)}
+
+
+def pair_counts(height=0, source='A', target='C', spare='B'):
+    """ Returns the number of moves between each pair of rods.
+    The moves of each disk are shared in turn by the three steps of its
+    cycle, so the i-th step (from 0) takes ceil((count - i) / 3) of them.
+    PARAMETERS:
+    height : tower height
+    source : source rod
+    target : target rod
+    spare  : spare rod
+    RETURNS:
+    dictionary of move counts keyed by (source, target) rod pairs
+    """
+    rods = (source, target, spare)
+    counts = {(s, t): 0 for s in rods for t in rods if (s != t)}
+    for disk in range(1, height + 1):
+        count = 1 << (height - disk)
+        cycle = _cycle(height, disk, source, target, spare)
+        for step in range(3):
+            pair = (cycle[step], cycle[(step + 1) % 3])
+            counts[pair] += (count - step + 2) // 3
+    return counts
+
+
+def empty_counts(height=0, source='A', target='C', spare='B'):
+    """ Returns the number of states in which each rod is empty.
+    The solution for n disks moves n - 1 disks to the spare (with disk n on
+    the source), moves disk n, then moves n - 1 disks to the target (with
+    disk n on the target).  So, with e(n) holding the (source, target,
+    spare) counts for n disks, starting from e(0) = (1, 1, 1):
+      source : e(n - 1) spare
+      target : e(n - 1) spare
+      spare  : e(n - 1) target + e(n - 1) source
+    PARAMETERS:
+    height : tower height
+    source : source rod
+    target : target rod
+    spare  : spare rod
+    RETURNS:
+    dictionary of state counts keyed by rod
+    """
+    (s, t, p) = (1, 1, 1)
+    for _ in range(height):
+        (s, t, p) = (p, p, t + s)
+    return {source: s, target: t, spare: p}
+
+
+def first_arrivals(height=0, rod='C', source='A', target='C', spare='B'):
+    """ Returns the move number at which each disk first reaches a rod.
+    Disk d reaches the j-th rod of its cycle on its j-th move, so on the
+    target this is move 2 ** (d - 1) when (height - d) is even, and
+    otherwise move 3 * (2 ** (d - 1)).
+    PARAMETERS:
+    height : tower height
+    rod    : rod name (defaults to C)
+    source : source rod
+    target : target rod
+    spare  : spare rod
+    RETURNS:
+    dictionary of move numbers keyed by disk number (None when the disk
+    never reaches the rod)
+    """
+    arrivals = {}
+    for disk in range(1, height + 1):
+        step = _cycle(height, disk, source, target, spare).index(rod)
+        n = step if (step > 0) else 3  # the source is reached on move 3
+        if (n > (1 << (height - disk))):
+            arrivals[disk] = None
+        else:
+            arrivals[disk] = (1 << (disk - 1)) * ((2 * n) - 1)
+    return arrivals
+
+
+def statistics(height=0, source='A', target='C', spare='B'):
+    """ Returns all of the solution statistics.
+    PARAMETERS:
+    height : tower height
+    source : source rod
+    target : target rod
+    spare  : spare rod
+    RETURNS:
+    dictionary of the total moves, disk moves, pair counts, empty counts
+    and first arrivals on the target
+    """
+    return {'moves': (1 << height) - 1,
+            'disk_moves': disk_moves(height),
+            'pair_counts': pair_counts(height, source, target, spare),
+            'empty_counts': empty_counts(height, source, target, spare),
+            'first_arrivals': first_arrivals(height, target, source, target,
+                                             spare)}
+
+
+def simulate(height=0, source='A', target='C', spare='B'):
+    """ Returns the solution statistics by generating every move (used to
+    cross-check the closed forms, so only practical for small heights).
+    PARAMETERS:
+    height : tower height
+    source : source rod
+    target : target rod
+    spare  : spare rod
+    """
+    rods = (source, target, spare)
+    counts = {rod: height if (rod == source) else 0 for rod in rods}
+    moves = {disk: 0 for disk in range(1, height + 1)}
+    pairs = {(s, t): 0 for s in rods for t in rods if (s != t)}
+    empty = {rod: int(counts[rod] == 0) for rod in rods}
+    arrivals = {disk: None for disk in range(1, height + 1)}
+    k = 0
+    for (disk, s, t) in iter_moves(height, source, target, spare):
+        k += 1
+        moves[disk] += 1
+        pairs[(s, t)] += 1
+        counts[s] -= 1
+        counts[t] += 1
+        for rod in rods:
+            if (counts[rod] == 0):
+                empty[rod] += 1
+        if (t == target) and (arrivals[disk] is None):
+            arrivals[disk] = k
+    return {'moves': k, 'disk_moves': moves, 'pair_counts': pairs,
+            'empty_counts': empty, 'first_arrivals': arrivals}
+
+
+def cross_check(heights=range(0, 13), source='A', target='C', spare='B'):
+    """ Verifies the closed forms against the iterative move generator.
+    PARAMETERS:
+    heights : tower heights to verify
+    source  : source rod
+    target  : target rod
+    spare   : spare rod
+    RETURNS:
+    list of the heights that do not match (empty when all are verified)
+    """
+    failed = []
+    for height in heights:
+        if (statistics(height, source, target, spare) !=
+                simulate(height, source, target, spare)):
+            failed.append(height)
+    return failed
+
+
+# Start the program interactively
+if __name__ == '__main__':
+    height = int(input('Enter a height for the tower: '))
+    stats = statistics(height)
+    print('Total moves:', f"{stats['moves']:,}")
+    for disk in range(1, min(height, 10) + 1):
+        print(f'  Disk {disk} moves', f"{stats['disk_moves'][disk]:,}",
+              'times, first reaching C on move',
+              f"{stats['first_arrivals'][disk]:,}")
+    for ((source, target), count) in stats['pair_counts'].items():
+        print(f'  Moves from {source} to {target}:', f'{count:,}')
+    for (rod, count) in stats['empty_counts'].items():
+        print(f'  States with rod {rod} empty:', f'{count:,}')
+    failed = cross_check(range(0, min(height, 16) + 1))
+    if (failed):
+        print('Cross-check FAILED for heights:', failed)
+    else:
+        print('Cross-check verified for heights 0 to', min(height, 16))
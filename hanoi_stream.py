@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+""" A Python module for archiving Tower of Hanoi solutions as binary streams.
+https://en.wikipedia.org/wiki/Tower_of_Hanoi
+History:
+01.00 2026-Oct-17 Scott S. Initial release.
+01.01 2026-Oct-17 Scott S. Normalized the move ranges like slices.
+
+Each move is packed into a single byte holding the rod pair code (0 to 5).
+The disk number is not stored, since the k-th move of a solution always
+belongs to the disk numbered by the lowest set bit of k.
+
+File layout (little-endian):
+  magic    4 bytes  b'HNOI'
+  version  1 byte   1
+  height   1 byte   tower height (0 to 64)
+  source   1 byte   source rod name (ASCII)
+  target   1 byte   target rod name (ASCII)
+  count    8 bytes  number of moves
+  checksum 4 bytes  CRC-32 of the move bytes
+  moves    count bytes
+
+MIT License
+
+Copyright (c) 2023 TigerPointe Software, LLC
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+Please consider giving to cancer research.
+https://braintumor.org/
+https://www.cancer.org/
+"""
+
+import mmap
+import struct
+import zlib
+
+from hanoi_solver import iter_moves
+
+# Define the file header layout
+MAGIC = b'HNOI'
+VERSION = 1
+HEADER = struct.Struct('<4sBBccQI')
+
+# Define the rod pair codes (one code per packed move byte)
+PAIRS = (('A', 'B'), ('A', 'C'), ('B', 'A'), ('B', 'C'), ('C', 'A'),
+         ('C', 'B'))
+CODES = {pair: code for (code, pair) in enumerate(PAIRS)}
+
+
+class StreamWriter:
+    """ Writes the packed moves of a solution to a binary stream file."""
+
+    def __init__(self, path, height=0, source='A', target='C', chunk=1 << 20):
+        """ Opens the file and writes a placeholder header.
+        PARAMETERS:
+        path   : file path
+        height : tower height (0 to 64)
+        source : source rod
+        target : target rod
+        chunk  : number of moves buffered before each write
+        """
+        if (height < 0) or (height > 64):
+            raise ValueError(f'Height {height} is out of range [0-64]')
+        self.height = height
+        self.source = source
+        self.target = target
+        self.chunk = chunk
+        self.count = 0
+        self.checksum = 0
+        self.buffer = bytearray()
+        self.file = open(path, 'wb')
+        self.file.write(self._header())
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def _header(self):
+        """ Returns the packed file header."""
+        return HEADER.pack(MAGIC, VERSION, self.height,
+                           self.source.encode('ascii'),
+                           self.target.encode('ascii'),
+                           self.count, self.checksum)
+
+    def flush(self):
+        """ Writes the buffered moves to the file."""
+        if (self.buffer):
+            self.count += len(self.buffer)
+            self.checksum = zlib.crc32(self.buffer, self.checksum)
+            self.file.write(self.buffer)
+            self.buffer = bytearray()
+
+    def write(self, disk, source, target):
+        """ Appends a single move.
+        PARAMETERS:
+        disk   : disk number (implied by the move number, not stored)
+        source : source rod
+        target : target rod
+        """
+        self.buffer.append(CODES[(source, target)])
+        if (len(self.buffer) >= self.chunk):
+            self.flush()
+
+    def write_codes(self, codes):
+        """ Appends moves that have already been packed as pair codes.
+        PARAMETERS:
+        codes : bytes of rod pair codes (see PAIRS)
+        """
+        self.buffer += codes
+        if (len(self.buffer) >= self.chunk):
+            self.flush()
+
+    def write_all(self, moves):
+        """ Appends all of the moves from an iterable.
+        PARAMETERS:
+        moves : iterable of (disk, source, target) tuples
+        """
+        codes = CODES
+        for (disk, source, target) in moves:
+            self.buffer.append(codes[(source, target)])
+            if (len(self.buffer) >= self.chunk):
+                self.flush()
+        self.flush()
+
+    def close(self):
+        """ Flushes the moves, then rewrites the completed header."""
+        if (self.file.closed):
+            return
+        self.flush()
+        self.file.seek(0)
+        self.file.write(self._header())
+        self.file.close()
+
+
+class MoveStream:
+    """ Reads the packed moves of a solution using a memory-mapped file.
+    Moves are indexed from 0, so item k is move number (k + 1).  Items and
+    slices are decoded on demand, without loading the whole file.
+    """
+
+    def __init__(self, path):
+        """ Opens and maps the file, then reads the header.
+        PARAMETERS:
+        path : file path
+        """
+        self.file = open(path, 'rb')
+        self.map = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        (magic, version, self.height, source, target, self.count,
+         self.checksum) = HEADER.unpack_from(self.map, 0)
+        if (magic != MAGIC) or (version != VERSION):
+            self.close()
+            raise ValueError(f'Not a move stream file: {path}')
+        if (len(self.map) < HEADER.size + self.count):
+            self.close()
+            raise ValueError(f'Truncated move stream file: {path}')
+        self.source = source.decode('ascii')
+        self.target = target.decode('ascii')
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, key):
+        """ Returns a (disk, source, target) tuple, or a list for slices.
+        PARAMETERS:
+        key : move index or slice
+        """
+        if (isinstance(key, slice)):
+            (start, stop, step) = key.indices(self.count)
+            if (step < 0):
+                return [self[k] for k in range(start, stop, step)]
+            return list(self.iter_moves(start, stop, step))
+        if (key < 0):
+            key += self.count
+        if (key < 0) or (key >= self.count):
+            raise IndexError('Move index out of range')
+        k = key + 1
+        return ((k & -k).bit_length(),) + PAIRS[self.map[HEADER.size + key]]
+
+    def iter_moves(self, start=0, stop=None, step=1):
+        """ Generates the (disk, source, target) tuples for a range of moves.
+        The indexes follow the slice rules (negative indexes count back from
+        the end, and out of range indexes are clipped).
+        PARAMETERS:
+        start : first move index
+        stop  : move index to stop before (defaults to the end)
+        step  : move index increment (positive)
+        """
+        if (step is not None) and (step < 1):
+            raise ValueError(f'Invalid move index step: {step}')
+        (start, stop, step) = slice(start, stop, step).indices(self.count)
+        codes = self.map[(HEADER.size + start):(HEADER.size + stop):step]
+        for (k, code) in zip(range(start + 1, stop + 1, step), codes):
+            yield ((k & -k).bit_length(),) + PAIRS[code]
+
+    def verify(self):
+        """ Checks the move bytes against the header checksum."""
+        start = HEADER.size
+        crc = 0
+        while (start < HEADER.size + self.count):
+            stop = min(start + (1 << 20), HEADER.size + self.count)
+            crc = zlib.crc32(self.map[start:stop], crc)
+            start = stop
+        return crc == self.checksum
+
+    def close(self):
+        """ Unmaps and closes the file."""
+        self.map.close()
+        self.file.close()
+
+
+def write_solution(path, height=0, source='A', target='C', spare='B'):
+    """ Writes a complete solution, streamed from the iterative solver.
+    PARAMETERS:
+    path   : file path
+    height : tower height (0 to 64)
+    source : source rod
+    target : target rod
+    spare  : spare rod
+    RETURNS:
+    number of moves written
+    """
+    with StreamWriter(path, height=height, source=source,
+                      target=target) as writer:
+        writer.write_all(iter_moves(height=height, source=source,
+                                    target=target, spare=spare))
+    return writer.count
+
+
+# Start the program interactively
+if __name__ == '__main__':
+    height = int(input('Enter a height for the tower: '))
+    path = input('Enter a file name for the solution: ')
+    count = write_solution(path, height=height)
+    print('Wrote', f'{count:,}', 'moves to', path)
@@ -0,0 +1,369 @@
+#!/usr/bin/env python3
+""" A Python module for validating and scoring recorded Tower of Hanoi games.
+https://en.wikipedia.org/wiki/Tower_of_Hanoi
+History:
+01.00 2026-Oct-17 Scott S. Initial release.
+01.01 2026-Oct-17 Scott S. Streamed the logs with a strict line parser.
+01.02 2026-Oct-18 Scott S. Used the target rod of the binary move streams.
+
+A move log is streamed through a compact rod state (one bitmask per rod), so
+each move is checked in constant time, without printing anything.  Every
+illegal move is rejected with its position (counted from 1).
+
+The score of a game is its excess over the optimal number of moves.  After k
+moves, the fewest remaining moves d(k) to the goal tower is found by walking
+the disks from the largest down: a disk that is not on its target rod must
+be moved there once (2 ** (disk - 1) moves, including its smaller disks),
+and the smaller disks must then be gathered onto the third rod.  Since a
+move changes d(k) by at most one, the excess k + d(k) - d(0) never decreases
+(it is 0 throughout an optimal game, where d(0) = (2 ** height) - 1).
+
+Move logs are either text, holding one move per line as a pair of rod
+letters (such as "A C", "AC" or "A -> C", with an optional first line of
+"height N", while blank lines and "#" comments are skipped), or the binary
+move streams written by hanoi_stream.  Either kind of log is read in chunks
+and streamed into the validation, rather than being loaded all at once.
+
+MIT License
+
+Copyright (c) 2023 TigerPointe Software, LLC
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+Please consider giving to cancer research.
+https://braintumor.org/
+https://www.cancer.org/
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+import os
+import time
+
+from hanoi_engine import NAMES
+from hanoi_stream import HEADER, MAGIC, PAIRS
+
+# Define the rod indexes of the rod pair codes
+INDEXES = tuple((NAMES.index(source), NAMES.index(target))
+                for (source, target) in PAIRS)
+
+# Define the rod indexes of the rod letters in a text log
+LETTERS = {b'A': 0, b'B': 1, b'C': 2, b'a': 0, b'b': 1, b'c': 2}
+
+# Define the number of bytes read from a binary move stream at once
+CHUNK = 1 << 16
+
+
+def distance(masks, height=0, goal='C'):
+    """ Returns the fewest moves from a configuration to the goal tower.
+    PARAMETERS:
+    masks  : (A, B, C) tuple of rod bitmasks
+    height : tower height
+    goal   : rod name of the goal tower (defaults to C)
+    """
+    target = NAMES.index(goal)
+    total = 0
+    for disk in range(height, 0, -1):
+        bit = 1 << (disk - 1)
+        rod = 0 if (masks[0] & bit) else (1 if (masks[1] & bit) else 2)
+        if (rod != target):
+            total += bit
+            target = 3 - rod - target
+    return total
+
+
+def iter_scores(moves, height=0, goal='C'):
+    """ Validates a stream of moves, yielding the score after each move.
+    The targets of the disks smaller than the moved disk are the only ones
+    that can change, so each step only revisits those disks (most moves are
+    of the smallest disks).
+    PARAMETERS:
+    moves  : iterable of (source, target) rod name pairs
+    height : tower height
+    goal   : rod name of the goal tower (defaults to C)
+    YIELDS:
+    (k, disk, source, target, remaining, excess) tuple for each move k
+    """
+    masks = [(1 << height) - 1, 0, 0]
+    rods = [0] * (height + 1)     # rod index of each disk (all on A)
+    targets = [0] * (height + 1)  # target rod index of each disk
+    rods[height] = targets[height] = NAMES.index(goal)  # (the goal tower)
+    remaining = 0
+    optimal = None
+    k = 0
+    disk = height
+    moves = iter(moves)
+    while (True):
+
+        # Update the targets of the moved disk and the smaller disks
+        for index in range(disk - 1, -1, -1):
+            if (rods[index + 1] == targets[index + 1]):
+                targets[index] = targets[index + 1]
+            else:
+                targets[index] = 3 - rods[index + 1] - targets[index + 1]
+            if (rods[index] != targets[index]):
+                remaining += 1 << index
+        if (optimal is None):
+            optimal = remaining
+        else:
+            yield (k, disk, source, target, remaining, k + remaining - optimal)
+
+        # Check and apply the next move
+        move = next(moves, None)
+        if (move is None):
+            return
+        (source, target) = move
+        k += 1
+        s = NAMES.find(source)
+        t = NAMES.find(target)
+        mask = masks[s] if (s >= 0) else 0
+        low = mask & -mask
+        if (low == 0) or (t < 0) or (s == t) or (masks[t] & (low - 1)):
+            raise ValueError(f'Illegal move {k}: {source} onto {target}')
+        masks[s] = mask ^ low
+        masks[t] |= low
+        disk = low.bit_length()
+
+        # Remove the moves counted for the moved disk and the smaller disks
+        for index in range(disk):
+            if (rods[index] != targets[index]):
+                remaining -= 1 << index
+        rods[disk - 1] = t
+
+
+def check(pairs, height=0, goal='C'):
+    """ Validates a sequence of moves given as rod index pairs, then scores
+    the final configuration (the fast path of the batch validation).
+    PARAMETERS:
+    pairs  : iterable of (source, target) rod index pairs (0, 1 or 2)
+    height : tower height
+    goal   : rod name of the goal tower (defaults to C)
+    RETURNS:
+    dictionary of the moves, error, position, solved flag, remaining
+    moves, optimal moves and excess moves
+    """
+    masks = [(1 << height) - 1, 0, 0]
+    error = None
+    position = None
+    k = 0
+    for (s, t) in pairs:
+        mask = masks[s]
+        low = mask & -mask
+        if (low == 0) or (s == t) or (masks[t] & (low - 1)):
+            position = k + 1
+            error = (f'Illegal move {position}: {NAMES[s]} onto '
+                     f'{NAMES[t]}')
+            break
+        masks[s] = mask ^ low
+        masks[t] |= low
+        k += 1
+    remaining = distance(masks, height, goal)
+    optimal = distance(((1 << height) - 1, 0, 0), height, goal)
+    return {'moves': k, 'valid': (error is None), 'error': error,
+            'position': position,
+            'solved': (remaining == 0) and (error is None),
+            'remaining': remaining, 'optimal': optimal,
+            'excess': k + remaining - optimal}
+
+
+def _parse(line, number, path):
+    """ Returns the rod index pair of a text log line (or None when blank).
+    PARAMETERS:
+    line   : line bytes
+    number : line number (counted from 1)
+    path   : move log file path (for the error message)
+    """
+    fields = line.split(b'#', 1)[0].replace(b'->', b' ').split()
+    if (not fields):
+        return None
+    if (len(fields) == 1) and (len(fields[0]) == 2):
+        fields = [fields[0][:1], fields[0][1:]]
+    if (len(fields) != 2) or (fields[0] not in LETTERS) or \
+            (fields[1] not in LETTERS):
+        text = line.decode('ascii', 'replace').strip()
+        raise ValueError(f'Invalid move on line {number}: {text!r} ({path})')
+    return (LETTERS[fields[0]], LETTERS[fields[1]])
+
+
+def _iter_text(f, path, number=0):
+    """ Generates the rod index pairs of a text log, one line at a time.
+    PARAMETERS:
+    f      : open file, positioned after any height line
+    path   : move log file path
+    number : number of lines already read
+    """
+    try:
+        for line in f:
+            number += 1
+            pair = _parse(line, number, path)
+            if (pair is not None):
+                yield pair
+    finally:
+        f.close()
+
+
+def _iter_stream(f, path, count, chunk=CHUNK):
+    """ Generates the rod index pairs of a binary move stream, one chunk of
+    packed rod pair codes at a time.
+    PARAMETERS:
+    f     : open file, positioned after the header
+    path  : move log file path
+    count : number of moves in the stream
+    chunk : number of bytes read at once
+    """
+    indexes = INDEXES
+    try:
+        while (count > 0):
+            codes = f.read(min(chunk, count))
+            if (not codes):
+                raise ValueError(f'Truncated move stream file: {path}')
+            count -= len(codes)
+            for code in codes:
+                yield indexes[code]
+    finally:
+        f.close()
+
+
+def read_log(path, height=None, goal=None):
+    """ Opens a move log file for streaming its rod index pairs.
+    Only the header (or height line) is read here; the moves are read as
+    the pairs are consumed, and the file is closed once they are exhausted
+    (or the generator is closed).
+    PARAMETERS:
+    path   : move log file path (text or binary move stream)
+    height : tower height (defaults to the height in the log)
+    goal   : rod name of the goal tower (defaults to the target rod of a
+             binary move stream, or C)
+    RETURNS:
+    (height, goal, pairs) tuple, where pairs is a generator
+    """
+    f = open(path, 'rb')
+    try:
+
+        # Read a binary move stream, using the packed rod pair codes
+        head = f.read(HEADER.size)
+        if (head[:len(MAGIC)] == MAGIC):
+            if (len(head) < HEADER.size):
+                raise ValueError(f'Truncated move stream file: {path}')
+            (magic, version, size, source, target, count, checksum) = \
+                HEADER.unpack(head)
+            if (source != b'A'):
+                raise ValueError(f'Move stream does not start on rod A: '
+                                 f'{path}')
+            if (target not in (b'A', b'B', b'C')):
+                raise ValueError(f'Move stream has an invalid target rod: '
+                                 f'{path}')
+            if (height is None):
+                height = size
+            if (goal is None):
+                goal = target.decode('ascii')
+            return (height, goal, _iter_stream(f, path, count))
+
+        # Otherwise, read a text log (with an optional height line)
+        f.seek(0)
+        first = f.readline()
+        number = 1
+        if (first.strip().lower().startswith(b'height')):
+            fields = first.split()
+            if (len(fields) != 2) or (not fields[1].isdigit()):
+                raise ValueError(f'Invalid height on line 1: {path}')
+            if (height is None):
+                height = int(fields[1])
+        else:
+            f.seek(0)
+            number = 0
+        if (height is None):
+            raise ValueError(f'Height is not specified for the log: {path}')
+        if (goal is None):
+            goal = 'C'
+        return (height, goal, _iter_text(f, path, number))
+    except BaseException:
+        f.close()
+        raise
+
+
+def validate_file(path, height=None, goal=None):
+    """ Validates and scores a move log file.  A log that cannot be read
+    (or holds an unreadable line) is reported by its result, rather than
+    being raised, so that a batch is never stopped by a single log.
+    PARAMETERS:
+    path   : move log file path (text or binary move stream)
+    height : tower height (defaults to the height in the log)
+    goal   : rod name of the goal tower (defaults to the target rod of a
+             binary move stream, or C)
+    RETURNS:
+    dictionary of the results (see check), including the path, height and
+    goal (the scores are None for an unreadable log)
+    """
+    try:
+        (height, goal, pairs) = read_log(path, height=height, goal=goal)
+        try:
+            result = check(pairs, height=height, goal=goal)
+        finally:
+            pairs.close()
+    except (OSError, ValueError) as e:
+        result = {'moves': 0, 'valid': False, 'error': str(e),
+                  'position': None, 'solved': False, 'remaining': None,
+                  'optimal': None, 'excess': None}
+    result['path'] = path
+    result['height'] = height
+    result['goal'] = goal
+    return result
+
+
+def validate_batch(paths, height=None, goal=None, workers=None, chunk=16):
+    """ Validates and scores many move log files across processes.
+    PARAMETERS:
+    paths   : move log file paths
+    height  : tower height (defaults to the height in each log)
+    goal    : rod name of the goal tower (defaults to the target rod of
+              each binary move stream, or C)
+    workers : number of worker processes (defaults to the CPU count)
+    chunk   : number of logs sent to a worker at once
+    RETURNS:
+    list of the results, in the same order as the paths
+    """
+    paths = list(paths)
+    if (workers is None):
+        workers = os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(validate_file, paths, [height] * len(paths),
+                             [goal] * len(paths), chunksize=chunk))
+
+
+# Start the program interactively
+if __name__ == '__main__':
+    path = input('Enter a move log file, or a folder of move logs: ')
+    start = time.perf_counter()
+    if (os.path.isdir(path)):
+        results = validate_batch(os.path.join(path, name)
+                                 for name in sorted(os.listdir(path)))
+    else:
+        results = [validate_file(path)]
+    elapsed = time.perf_counter() - start
+    for result in results:
+        if (result['excess'] is None):
+            print(result['path'], 'unreadable,', result['error'])
+            continue
+        status = 'solved' if (result['solved']) else \
+            (result['error'] or f"{result['remaining']:,} moves remaining")
+        print(result['path'], f"{result['moves']:,} moves,",
+              f"{result['excess']:,} over optimal,", status)
+    total = sum(result['moves'] for result in results)
+    print(f'{total:,}', 'moves in', len(results), 'logs',
+          f'in {elapsed:.2f} seconds')
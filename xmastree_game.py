@@ -1,383 +1,678 @@
-﻿#!/usr/bin/env python3
-""" A Python module for playing the Xmas Tree (Tower of Hanoi) puzzle game.
-https://github.com/tigerpointe
-https://en.wikipedia.org/wiki/Tower_of_Hanoi
-History:
-01.00 2023-Oct-31 Scott S. Initial release.
-
-Instead of disks and rods, this holiday-themed "Tower of Hanoi" game is played
-with boughs and bases.
-
-ANSI Color Escape Codes, ESC = \\033 (ASCII Hex Value)
-(ex. foreground black '\\033[30m' and background white '\\033[47m')
-COLOR          FG BG
-Reset          0  0
-Black          30 40
-Red            31 41
-Green          32 42
-Yellow         33 43
-Blue           34 44
-Magenta        35 45
-Cyan           36 46
-White          37 47
-Default        39 49
-Bright Black   90 100 (Gray)
-Bright Red     91 101
-Bright Green   92 102
-Bright Yellow  93 103
-Bright Blue    94 104
-Bright Magenta 95 105
-Bright Cyan    96 106
-Bright White   97 107
-
-MIT License
-
-Copyright (c) 2023 TigerPointe Software, LLC
-
-Permission is hereby granted, free of charge, to any person obtaining a copy
-of this software and associated documentation files (the "Software"), to deal
-in the Software without restriction, including without limitation the rights
-to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
-copies of the Software, and to permit persons to whom the Software is
-furnished to do so, subject to the following conditions:
-
-The above copyright notice and this permission notice shall be included in all
-copies or substantial portions of the Software.
-
-THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
-IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
-FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
-AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
-LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
-OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
-SOFTWARE.
-
-Please consider giving to cancer research.
-https://braintumor.org/
-https://www.cancer.org/
-"""
-
-# Requires:  pip install pynput
-# (using a keypress library improves the game playability over text inputs)
-from pynput.keyboard import Key, Listener
-import json
-import os
-import time
-
-# Enable the console escape codes
-_ = os.system('')
-
-# Define the ASCII artwork (original image by Scott S.)
-# Each disk level must contain three rows of text
-# Be sure to escape the backslashes
-ascii = """
-          _/^\\_
-         <  o  >
-          /.^.\\
-           /"\\
-         ( o o )
-         '"'"'"'
-       ./'"'"'"'\\.
-       ( o  O  o )
-       "'"'"'"'"'"
-     ./"'"'"'"'"'"\\.
-     ( o  O   O  o )
-     '"'"'"'"'"'"'"'
-   ./'"'"'"'"'"'"'"'\\.
-   ( o  O   o   O  o )
-   "'"'"'"'"'"'"'"'"'"
- ./"'"'"'"'"'"'"'"'"'"\\.
- ( o  O   o   o   O  o )
- '"'"'"'"'"'"'"'"'"'"'"'
-/'"'"'"'"'"'"'"'"'"'"'"'\\
-.o  O   o   O   o   O  o.
-"'"'"'"'"'"'"'"'"'"'"'"'"
-        '=,...,='
-    ..--..]###[..--..
-============X============
-"""
-
-
-def play(height=2, solve=False):
-    """ Starts the gameplay.
-    PARAMETERS:
-    height : tower height
-    solve  : solve automatically
-    """
-
-    # Sanity checks for the minimum/maximum tower height
-    if (height < 2):
-        height = 2  # 2 requires 3 moves ((2 ** height) - 1)
-    elif (height > 7):
-        height = 7  # 7 requires 127 moves ((2 ** height) - 1)
-
-    # Split the artwork into lines (padded to equal widths)
-    lines = ascii.splitlines()
-    del lines[0]
-    width = len(lines[len(lines) - 1])
-    for idx in range(len(lines)):
-        lines[idx] = lines[idx].rstrip()
-        lines[idx] = lines[idx].ljust(width)
-
-    # Create a new dictionary for the game data (can be saved as JSON)
-    data = {}
-
-    # Initialize the A, B, C rods and disk numbers
-    data['A'] = list((x + 1) for x in reversed(range(height)))
-    data['B'] = list()
-    data['C'] = list()
-
-    # Initialize the state variables
-    data['disk'] = None      # disk currently being moved
-    data['height'] = height  # height of the tower
-    data['n'] = 0            # number of moves counter
-
-    def write_disks():
-        """ Writes all the disks contained on each rod."""
-
-        # Loop through all rods A, B, C disk levels in reverse order
-        for x in reversed(range(data['height'])):
-
-            # Set the default colors
-            topper = '\033[93m'
-            colorA = '\033[32m'
-            colorB = '\033[32m'
-            colorC = '\033[32m'
-            small = '\033[95mo\033[32m'
-            large = '\033[96mO\033[32m'
-            reset = '\033[0m'
-
-            # Set rod A level as disk or spaces
-            if (x < len(data['A'])):
-                idx = (data['A'][x] - 1) * 3
-                outA1 = lines[idx]
-                outA2 = lines[idx + 1]
-                outA3 = lines[idx + 2]
-                if ((data['A'][x] == 1)):
-                    colorA = topper  # special top color
-                else:
-                    outA2 = outA2.replace('o', small)  # ornament color
-                    outA2 = outA2.replace('O', large)  # ornament color
-            else:
-                outA1 = ' ' * len(lines[0])
-                outA2 = outA1
-                outA3 = outA1
-
-            # Set rod B level as disk or spaces
-            if (x < len(data['B'])):
-                idx = (data['B'][x] - 1) * 3
-                outB1 = lines[idx]
-                outB2 = lines[idx + 1]
-                outB3 = lines[idx + 2]
-                if ((data['B'][x] == 1)):
-                    colorB = topper  # special top color
-                else:
-                    outB2 = outB2.replace('o', small)  # ornament color
-                    outB2 = outB2.replace('O', large)  # ornament color
-            else:
-                outB1 = ' ' * len(lines[0])
-                outB2 = outB1
-                outB3 = outB1
-
-            # Set rod C level as disk or spaces
-            if (x < len(data['C'])):
-                idx = (data['C'][x] - 1) * 3
-                outC1 = lines[idx]
-                outC2 = lines[idx + 1]
-                outC3 = lines[idx + 2]
-                if ((data['C'][x] == 1)):
-                    colorC = topper  # special top color
-                else:
-                    outC2 = outC2.replace('o', small)  # ornament color
-                    outC2 = outC2.replace('O', large)  # ornament color
-            else:
-                outC1 = ' ' * len(lines[0])
-                outC2 = outC1
-                outC3 = outC1
-
-            # Write the disk level for rods A, B, C
-            print(colorA, outA1, colorB, outB1, colorC, outC1, reset, sep='')
-            print(colorA, outA2, colorB, outB2, colorC, outC2, reset, sep='')
-            print(colorA, outA3, colorB, outB3, colorC, outC3, reset, sep='')
-
-        # Write the rod bases A, B, C
-        color = '\033[90m'
-        reset = '\033[0m'
-        out = lines[len(lines) - 3]
-        print(color, out, out, out, reset, sep='')
-        out = lines[len(lines) - 2]
-        print(color, out, out, out, reset, sep='')
-
-        # Write the rod labels A, B, C
-        color = '\033[37m\033[41m'
-        reset = '\033[0m'
-        label = (lines[len(lines) - 1]).replace('=', ' ')
-        labelA = label.replace('X', 'A')
-        labelB = label.replace('X', 'B')
-        labelC = label.replace('X', 'C')
-        print(color, labelA, labelB, labelC, reset, sep='')
-
-    def solve_game(disk, source, target, spare):
-        """ Solves the game using a recursive subproblems code pattern.
-        PARAMETERS:
-        disk   : disk number
-        source : source rod
-        target : target rod
-        spare  : spare rod
-        """
-
-        # Stop the recursion when no more disks can be moved
-        if (disk < 1):
-            return
-
-        # Recursively move the next disk from the source to the spare
-        solve_game(disk=(disk - 1), source=source, target=spare, spare=target)
-
-        # Move the current disk from the source to the target
-        data[target].append(data[source].pop(data[source].index(disk)))
-        data['n'] += 1
-        print('Moving bough', disk, 'from', source, 'onto', target,
-              f"(move {data['n']:,})")
-        write_disks()
-        time.sleep(2)
-
-        # Recursively move the next disk from the spare to the target
-        solve_game(disk=(disk - 1), source=spare, target=target, spare=source)
-
-    def save_game():
-        """ Saves the game data to a file."""
-        file = os.path.basename(__file__) + '.txt'
-        f = open(file, 'w')
-        f.write(json.dumps(data))
-        f.close()
-        print('Game saved:', file)
-        return True
-
-    def reload_game():
-        """ Reloads the game data from a file."""
-        nonlocal data  # required for assigning a new value
-        file = os.path.basename(__file__) + '.txt'
-        if (os.path.isfile(file)):
-            f = open(file, 'r')
-            data = json.loads(f.read())
-            f.close()
-            print('Game reloaded:', file)
-            write_disks()
-            if ((data['disk']) is not None):
-                print('Moving bough', data['disk'], 'onto ...')
-        else:
-            print('File not found:', file)
-        return True
-
-    def move_disk(rod):
-        """Moves a disk between rods.
-        PARAMETERS:
-        rod : rod name (A, B or C)
-        """
-
-        # If unset, pop the top disk from the source rod
-        if (data['disk'] is None) and (len(data[rod]) > 0):
-            data['disk'] = data[rod].pop()
-            print('Moving bough', data['disk'], 'from', rod, 'onto ...')
-
-        # Otherwise, append the popped disk to the target rod
-        elif (data['disk'] is not None):
-            top = None
-            if (len(data[rod]) > 0):
-                top = data[rod][-1]
-            if (top is None) or (data['disk'] < top):
-                data[rod].append(data['disk'])
-                data['disk'] = None
-                data['n'] += 1
-                print('  ...', rod, f"(move {data['n']:,})")
-                write_disks()
-            else:
-                print('  ... invalid move onto ', rod, ', try again', sep='')
-
-        # Check for a solution (all disks having been moved)
-        if (len(data['C']) < data['height']):
-            return True  # not solved, continue listening
-        label = 'moves'
-        if (data['n'] == 1):
-            label = 'move'
-        print('Success, puzzle solved in', f"{data['n']:,}", label)
-        return False  # solved, stop listening
-
-    def on_press(key):
-        """Handles the keypress event.
-        PARAMETERS:
-        key : pressed key
-        """
-        if (hasattr(key, 'char')):
-            if (key.char == 'a'):
-                return move_disk(rod='A')
-            elif (key.char == 'b'):
-                return move_disk(rod='B')
-            elif (key.char == 'c'):
-                return move_disk(rod='C')
-            elif (key.char == 'l'):
-                return reload_game()
-            elif (key.char == 'r'):
-                return reload_game()
-            elif (key.char == 's'):
-                return save_game()
-            elif (key.char == 'q'):
-                return False
-        else:
-            if (key == Key.esc):
-                return False
-        return True  # for any other key, continue listening
-
-    # Show the solution, if specified
-    if (solve):
-        print('Solving, please wait ...\r\n')
-        write_disks()
-        time.sleep(4)
-        solve_game(disk=data['height'], source='A', target='C', spare='B')
-        return
-
-    # Otherwise, begin listening for keypresses until False is returned
-    # (suppress input events from being passed back to the console)
-    print('Good luck, move boughs by pressing A, B, or C ...\r\n')
-    write_disks()
-    with Listener(on_press=on_press, suppress=True) as lstn:
-        lstn.join()
-
-
-def clear():
-    """Clears the console."""
-    if (os.name == 'nt'):
-        _ = os.system('cls')  # Microsoft Windows
-    else:
-        _ = os.system('clear')  # all others
-
-
-# Start the program interactively
-if __name__ == '__main__':
-    try:
-        clear()
-        color = '\033[37m\033[41m'
-        reset = '\033[0m'
-        print(color, '         THE XMAS TREE GAME (TOWER OF HANOI)         ',
-              reset, sep='')
-        height = int(
-            input('Enter the Xmas tree height/difficulty level [2-7]: '))
-        solve = None
-        while (solve != 'y') and (solve != 'n'):
-            solve = input('Do you want the computer to play itself? [Y|N]: ')
-            solve = solve.lower()
-        print('  Move all of the boughs from base A to base C')
-        print('  Press A, B, or C to move a bough between two bases')
-        print('  A larger bough cannot be placed on top of a smaller bough')
-        print('  Each bough is numbered according to its ornament count')
-        print('  Press S to save the game, R or L to reload a saved game')
-        print('  Press ESC or Q to quit')
-        play(height=height, solve=(solve == 'y'))
-        color = '\033[36m'
-        reset = '\033[0m'
-        print(color, 'MERRY CHRISTMAS AND HAPPY HOLIDAYS', reset, sep='')
-    except Exception as e:
-        print(str(e))
-    finally:
-        print('\033[0m', end='')  # tidy up, just in case
-        input('Press the ENTER key to exit the game: ')
+﻿#!/usr/bin/env python3
+""" A Python module for playing the Xmas Tree (Tower of Hanoi) puzzle game.
+https://github.com/tigerpointe
+https://en.wikipedia.org/wiki/Tower_of_Hanoi
+History:
+01.00 2023-Oct-31 Scott S. Initial release.
+01.01 2026-Oct-17 Scott S. Added the incremental frame renderer.
+01.02 2026-Oct-17 Scott S. Added the non-blocking autoplay controls.
+01.03 2026-Oct-17 Scott S. Moved the gameplay rules to the headless engine.
+01.04 2026-Oct-17 Scott S. Added the move journal autosave, undo and redo.
+01.05 2026-Oct-17 Scott S. Added the optional profiling hooks.
+01.06 2026-Oct-17 Scott S. Deferred the keyboard and terminal setup.
+01.07 2026-Oct-17 Scott S. Added the generated boughs for taller trees.
+01.08 2026-Oct-17 Scott S. Moved the key handling off the listener thread.
+01.09 2026-Oct-17 Scott S. Added the cyclic and adjacent rule sets.
+01.10 2026-Oct-18 Scott S. Profiled the interactive moves and messages.
+01.11 2026-Oct-18 Scott S. Kept the journal when a reload is rejected.
+
+Instead of disks and rods, this holiday-themed "Tower of Hanoi" game is played
+with boughs and bases.
+
+ANSI Color Escape Codes, ESC = \\033 (ASCII Hex Value)
+(ex. foreground black '\\033[30m' and background white '\\033[47m')
+COLOR          FG BG
+Reset          0  0
+Black          30 40
+Red            31 41
+Green          32 42
+Yellow         33 43
+Blue           34 44
+Magenta        35 45
+Cyan           36 46
+White          37 47
+Default        39 49
+Bright Black   90 100 (Gray)
+Bright Red     91 101
+Bright Green   92 102
+Bright Yellow  93 103
+Bright Blue    94 104
+Bright Magenta 95 105
+Bright Cyan    96 106
+Bright White   97 107
+
+MIT License
+
+Copyright (c) 2023 TigerPointe Software, LLC
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+Please consider giving to cancer research.
+https://braintumor.org/
+https://www.cancer.org/
+"""
+
+from functools import lru_cache
+import os
+import sys
+
+# Shared rod state and solver modules
+from hanoi_engine import RULES, Game
+from hanoi_events import EventQueue
+from hanoi_journal import Journal
+import hanoi_profile
+from hanoi_solver import hint, hint_place, iter_rule
+
+# Define the minimum number of levels of the artwork (the original image by
+# Scott S. had 7 levels, so smaller trees keep the original width)
+LEVELS = 7
+
+
+def _alternate(length, first):
+    """ Returns a row of alternating quotes.
+    PARAMETERS:
+    length : number of characters
+    first  : first character (single or double quote)
+    """
+    other = '"' if (first == "'") else "'"
+    return ((first + other) * ((length + 1) // 2))[:length]
+
+
+def build_sprite(disk, width):
+    """ Generates the three rows of a bough (centered on the width).
+    Each bough k (from 3) is 4k - 1 characters wide: the top row is ./ and
+    \\. around alternating quotes, the middle row holds k ornaments (large O
+    ornaments alternating inward from the small o ornaments at the ends),
+    and the bottom row is a fringe of alternating quotes.  A bough that is
+    wider than the artwork (the bottom bough) is drawn with its edges
+    trimmed to the width.
+    PARAMETERS:
+    disk  : bough number
+    width : artwork width
+    """
+    if (disk == 1):
+        rows = ('_/^\\_', '<  o  >', '/.^.\\')
+    elif (disk == 2):
+        rows = ('/"\\', '( o o )', '\'"\'"\'"\'')
+    else:
+        quote = "'" if ((disk % 2) == 1) else '"'
+        fringe = '"' if ((disk % 2) == 1) else "'"
+        ornaments = ['o' if ((min(idx, disk - 1 - idx) % 2) == 0) else 'O'
+                     for idx in range(disk)]
+        middle = ornaments[0] + '  ' + '   '.join(ornaments[1:-1]) + \
+            '  ' + ornaments[-1]
+        if (((4 * disk) - 1) > width):
+            rows = ('/' + _alternate((4 * disk) - 5, quote) + '\\',
+                    '.' + middle + '.',
+                    _alternate(width, fringe))
+        else:
+            rows = ('./' + _alternate((4 * disk) - 5, quote) + '\\.',
+                    '( ' + middle + ' )',
+                    _alternate((4 * disk) - 1, fringe))
+    return tuple(row.center(width).rstrip().ljust(width) for row in rows)
+
+
+# Define the artwork colors
+TOPPER = '\033[93m'               # top bough
+BOUGH = '\033[32m'                # all other boughs
+SMALL = '\033[95mo\033[32m'       # small ornaments
+LARGE = '\033[96mO\033[32m'       # large ornaments
+BASE = '\033[90m'                 # bases
+LABEL = '\033[37m\033[41m'        # base labels
+RESET = '\033[0m'
+
+
+@lru_cache(maxsize=None)
+def build_lines(height=LEVELS):
+    """ Generates the artwork lines for a tree height (padded to equal widths),
+    as three rows per bough followed by the two base rows and the label row.
+    PARAMETERS:
+    height : tower height (smaller trees are drawn with 7 levels)
+    """
+    levels = max(height, LEVELS)
+    width = (4 * levels) - 3
+    lines = []
+    for disk in range(1, levels + 1):
+        lines.extend(build_sprite(disk, width))
+    for row in ("'=,...,='", '..--..]###[..--..'):
+        lines.append(row.center(width).rstrip().ljust(width))
+    lines.append(('=' * (width // 2)) + 'X' + ('=' * (width // 2)))
+    return tuple(lines)
+
+
+@lru_cache(maxsize=None)
+def build_atlas(height=2):
+    """ Builds the pre-colorized sprite cells for a tree height (built once).
+    PARAMETERS:
+    height : tower height
+    RETURNS:
+    (cells, footer) tuple, where cells[n] holds the three colorized rows of
+    bough n (index 0 is an empty base) and footer holds the bases and labels
+    """
+    lines = build_lines(height)
+    blank = BOUGH + (' ' * len(lines[0]))
+    cells = [(blank, blank, blank)]
+    for disk in range(1, height + 1):
+        idx = (disk - 1) * 3
+        if (disk == 1):
+            color = TOPPER  # special top color
+            middle = lines[idx + 1]
+        else:
+            color = BOUGH
+            middle = lines[idx + 1].replace('o', SMALL)  # ornament color
+            middle = middle.replace('O', LARGE)           # ornament color
+        cells.append((color + lines[idx], color + middle,
+                      color + lines[idx + 2]))
+
+    # Write the rod bases and labels A, B, C
+    footer = ''
+    for out in (lines[len(lines) - 3], lines[len(lines) - 2]):
+        footer += BASE + out + out + out + RESET + '\n'
+    label = (lines[len(lines) - 1]).replace('=', ' ')
+    footer += LABEL + label.replace('X', 'A') + label.replace('X', 'B') + \
+        label.replace('X', 'C') + RESET + '\n'
+    return (cells, footer)
+
+
+class TreeRenderer:
+    """ Writes the tree frames, redrawing only the cells that have changed.
+    The first frame clears the screen and is drawn at the top, then the
+    rows below it are set as a scrolling region for the game messages.
+    Each later frame only sends the cursor-addressed updates for the cells
+    that differ from the previous frame.  When the output is not a terminal
+    (or the terminal is too short), every frame is written in full.
+    """
+
+    def __init__(self, height=2, out=None, incremental=None):
+        """ Initializes the renderer.
+        PARAMETERS:
+        height      : tower height
+        out         : output stream (defaults to standard output)
+        incremental : redraw only the changed cells (defaults to True when
+                      the output is a terminal tall enough for the frame)
+        """
+        self.height = height
+        self.out = out or sys.stdout
+        (self.cells, self.footer) = build_atlas(height)
+        self.width = len(build_lines(height)[0])
+        self.rows = (3 * height) + 3
+        import shutil  # only imported for rendering (slow to import)
+        self.lines = shutil.get_terminal_size().lines
+        if (incremental is None):
+            incremental = (self.out.isatty()) and \
+                (self.lines > (self.rows + 1))
+        self.incremental = incremental
+        self.previous = None
+
+    def grid(self, rods):
+        """ Returns the frame cells as rows (top to bottom) of A, B, C cells.
+        PARAMETERS:
+        rods : rod state
+        """
+        cols = []
+        for name in 'ABC':
+            disks = rods.disks(name)  # bough numbers from bottom to top
+            cols.append(disks + ([0] * (self.height - len(disks))))
+        cells = self.cells
+        grid = []
+        for (a, b, c) in reversed(list(zip(*cols))):
+            for line in range(3):
+                grid.append((cells[a][line], cells[b][line], cells[c][line]))
+        return grid
+
+    def changes(self, old, new):
+        """ Returns the cells of a rod that differ between two bitmasks.
+        The disks larger than the highest changed disk are unchanged at the
+        bottom of the rod, so only the slots above them are compared (for a
+        single move, this is only the slot of the moved bough).
+        PARAMETERS:
+        old : previous rod bitmask
+        new : current rod bitmask
+        RETURNS:
+        list of (row, line, cell) tuples, where row counts from the top
+        """
+        size = (old ^ new).bit_length()
+        slot = bin(new >> size).count('1')  # unchanged slots at the bottom
+        disks = [disk for disk in range(size, 0, -1)
+                 if ((new >> (disk - 1)) & 1)]
+        top = max(bin(old).count('1'), bin(new).count('1'))
+        cells = []
+        for idx in range(top - slot):
+            disk = disks[idx] if (idx < len(disks)) else 0
+            row = (self.height - 1 - slot - idx) * 3
+            for line in range(3):
+                cells.append((row + line, self.cells[disk][line]))
+        return cells
+
+    @hanoi_profile.timed('xmastree_game draw')
+    def draw(self, rods):
+        """ Writes the frame for the rods.
+        PARAMETERS:
+        rods : rod state
+        """
+        state = rods.state()
+        if (not self.incremental):
+            grid = self.grid(rods)
+            full = ''.join(a + b + c + RESET + '\n' for (a, b, c) in grid)
+            self.out.write(full + self.footer)
+        elif (self.previous is None):
+            grid = self.grid(rods)
+            full = ''.join(a + b + c + RESET + '\n' for (a, b, c) in grid)
+            self.out.write('\033[H\033[2J' + full + self.footer +
+                           f'\033[{self.rows + 1};{self.lines}r' +
+                           f'\033[{self.rows + 1};1H')
+        else:
+
+            # Only address the changed cells (in screen order)
+            updates = []
+            for (col, (old, new)) in enumerate(zip(self.previous, state)):
+                if (old != new):
+                    updates.extend((row, col, cell)
+                                   for (row, cell) in self.changes(old, new))
+            updates.sort()
+            pieces = ['\0337']  # save the cursor position
+            for (row, col, cell) in updates:
+                pieces.append(f'\033[{row + 1};{(col * self.width) + 1}H')
+                pieces.append(cell + RESET)
+            pieces.append('\0338')  # restore the cursor position
+            self.out.write(''.join(pieces))
+        self.previous = state
+        self.out.flush()
+
+    def reset(self):
+        """ Forces the next frame to be written in full."""
+        self.previous = None
+
+    def close(self):
+        """ Restores the full-screen scrolling region."""
+        if (self.incremental) and (self.previous is not None):
+            self.out.write(f'\033[r\033[{self.lines};1H\n')
+            self.out.flush()
+        self.previous = None
+
+
+def load_keyboard():
+    """ Imports the keyboard library when the gameplay begins, rather than
+    when the module is imported (it loads the display input backends).
+    RETURNS:
+    (Key, Listener) tuple
+    """
+
+    # Requires:  pip install pynput
+    # (using a keypress library improves the game playability over text
+    # inputs)
+    from pynput.keyboard import Key, Listener
+    return (Key, Listener)
+
+
+def enable_escapes():
+    """ Enables the console escape codes (required on Microsoft Windows)."""
+    if (os.name == 'nt'):
+        _ = os.system('')
+
+
+@hanoi_profile.captured
+@hanoi_profile.printed('xmastree_game print')
+def play(height=2, solve=False, delay=2.0, rule='classic'):
+    """ Starts the gameplay.
+    PARAMETERS:
+    height : tower height
+    solve  : solve automatically
+    delay  : seconds between automatic moves (0 is as fast as possible)
+    rule   : rule set name (classic, cyclic or adjacent, see RULES)
+    """
+
+    # Sanity checks for the minimum/maximum tower height
+    if (height < 2):
+        height = 2  # 2 requires 3 moves ((2 ** height) - 1)
+    elif (height > 20):
+        height = 20  # 20 requires 1,048,575 moves ((2 ** height) - 1)
+
+    # Enable the console escape codes
+    enable_escapes()
+
+    # Create the frame renderer (pre-colorizes the artwork once, and counts
+    # the bytes written to the terminal when profiling is enabled)
+    renderer = TreeRenderer(height, out=hanoi_profile.writer(
+        sys.stdout, 'xmastree_game terminal'))
+
+    # Create a new headless game (the A, B, C rods are held as bitmasks,
+    # along with the lifted bough and the number of moves counter)
+    game = Game(height, rule=rule)
+
+    # Create a new dictionary for the display data
+    data = {}
+    data['last'] = None  # last automatic move
+
+    # Initialize the move journal (started by the first move, so that the
+    # previously saved game can still be reloaded until then); each rule set
+    # keeps its own files, so that a game never overwrites the game saved
+    # under other rules
+    file = os.path.basename(__file__)
+    if (rule != 'classic'):
+        file += '.' + rule
+    journal = None
+
+    def write_disks():
+        """ Writes all the disks contained on each rod."""
+        renderer.draw(game.rods)
+
+    def apply_move(move):
+        """ Applies an automatic move (without writing any output).
+        PARAMETERS:
+        move : bough, source and target
+        """
+        game.apply_moves((move[1:],))
+        data['last'] = move
+
+    def show_move():
+        """ Writes the last automatic move and all the disks."""
+        if (data['last'] is None):
+            write_disks()
+            print('Solving, please wait ...\r\n')
+            return
+        (disk, source, target) = data['last']
+        print('Moving bough', disk, 'from', source, 'onto', target,
+              f"(move {game.n:,})")
+        write_disks()
+
+    def solve_game():
+        """ Solves the game using the iterative move generator, played on a
+        non-blocking schedule (frames are dropped when the moves are faster
+        than the terminal).
+        """
+        # The scheduler is only imported for the automatic moves
+        import asyncio
+        from hanoi_autoplay import Autoplay
+        moves = iter_rule(height=game.height, rule=game.rule)
+        autoplay = Autoplay(moves, apply=apply_move, render=show_move,
+                            delay=delay, wait=(delay * 2))
+
+        def on_control(key):
+            """Handles the keypress event while solving.
+            PARAMETERS:
+            key : pressed key
+            """
+            if (hasattr(key, 'char')):
+                if (key.char == ' ') or (key.char == 'p'):
+                    autoplay.call('toggle')
+                elif (key.char == 'n'):
+                    autoplay.call('step')
+                elif (key.char == '+') or (key.char == '='):
+                    autoplay.call('faster')
+                elif (key.char == '-'):
+                    autoplay.call('slower')
+                elif (key.char == 'q'):
+                    autoplay.call('stop')
+                    return False
+            else:
+                if (key == Key.space):
+                    autoplay.call('toggle')
+                elif (key == Key.esc):
+                    autoplay.call('stop')
+                    return False
+            return True  # for any other key, continue listening
+
+        # Listen for the controls while the boughs are moved (when the keyboard
+        # library is available, otherwise the moves are played without them)
+        try:
+            (Key, Listener) = load_keyboard()
+        except ImportError:
+            asyncio.run(autoplay.run())
+            return
+        lstn = Listener(on_press=on_control, suppress=True)
+        lstn.start()
+        try:
+            asyncio.run(autoplay.run())
+        finally:
+            lstn.stop()
+
+    def save_game():
+        """ Saves a snapshot of the game data to a file (the moves are also
+        saved automatically to the journal file).
+        """
+        nonlocal journal  # required for assigning a new value
+        if (journal is None):
+            journal = Journal(file, game)
+        else:
+            journal.snapshot()
+        print('Game saved:', file + '.sav')
+        return True
+
+    def reload_game():
+        """ Reloads the game data from the snapshot and journal files."""
+        nonlocal game, journal, renderer  # required for assigning new values
+        if (os.path.isfile(file + '.sav')):
+            if (journal is not None):
+                journal.flush()  # writes any buffered moves
+
+            # A saved game that cannot be reloaded (such as one using another
+            # rule set) leaves the current game and its journal unchanged
+            try:
+                loaded = Journal.load(file, rule=game.rule)
+            except (OSError, ValueError) as e:
+                print('Game not reloaded:', e)
+                return True
+            if (journal is not None):
+                journal.close()
+            journal = loaded
+            game = journal.game
+            print('Game reloaded:', file + '.sav')
+            if (game.height != renderer.height):
+
+                # Rebuild the artwork for the height of the saved tree
+                renderer.close()
+                renderer = TreeRenderer(game.height, out=renderer.out)
+            renderer.reset()
+            events.invalidate()
+        else:
+            print('File not found:', file + '.sav')
+        return True
+
+    def undo_game(redo=False):
+        """ Undoes (or redoes) the last move from the journal.
+        PARAMETERS:
+        redo : redo the last undone move instead
+        """
+        label = 'Redo' if (redo) else 'Undo'
+        move = None
+        if (journal is not None):
+            move = journal.redo() if (redo) else journal.undo()
+        if (move is None):
+            print(label + ': no move available')
+            return True
+        if (hanoi_profile.ENABLED):
+            hanoi_profile.count('xmastree_game moves')
+        print(label + ': moving bough', move[0], 'from', move[1], 'onto',
+              move[2], f"(move {game.n:,})")
+        events.invalidate()
+        return finish_game()
+
+    def hint_game():
+        """ Writes a hint for the best next move."""
+
+        # The shortest remaining solution is only searched for the classic
+        # rules (the other rule sets are solved from the start only)
+        if (game.rule != 'classic'):
+            print('Hint: only available for the classic rules')
+            return True
+
+        # If unset, suggest the first move of the shortest solution
+        rods = game.rods
+        disk = game.held
+        if (disk == 0):
+            move = hint(rods.lists())
+            if (move is None):
+                print('Hint: the puzzle is already solved')
+            else:
+                print('Hint: move bough', move[0], 'from', move[1], 'onto',
+                      move[2])
+            return True
+
+        # Otherwise, suggest the rod leaving the fewest remaining moves
+        print('  ... hint: place bough', disk, 'onto', hint_place(rods, disk))
+        return True
+
+    def move_disk(rod):
+        """Moves a disk between rods.
+        PARAMETERS:
+        rod : rod name (A, B or C)
+        """
+        nonlocal journal  # required for assigning a new value
+
+        # Lift the top bough from the source base, or place the lifted bough
+        # onto the target base (the rules are checked by the game engine)
+        result = game.select(rod)
+        if (result['action'] == 'lift'):
+            if (journal is None):
+                journal = Journal(file, game)
+            print('Moving bough', result['disk'], 'from', rod, 'onto ...')
+        elif (result['action'] == 'place'):
+            journal.record(result['source'], rod)
+            if (hanoi_profile.ENABLED):
+                hanoi_profile.count('xmastree_game moves')
+            print('  ...', rod, f"(move {result['n']:,})")
+            events.invalidate()
+        elif (result['action'] == 'invalid'):
+            print('  ... invalid move onto ', rod, ', try again', sep='')
+        return finish_game()
+
+    def finish_game():
+        """Checks for a solution (all disks having been moved)."""
+        if (not game.solved()):
+            return True  # not solved, continue listening
+        events.draw()  # writes the final boughs before the message
+        label = 'moves'
+        if (game.n == 1):
+            label = 'move'
+        print('Success, puzzle solved in', f"{game.n:,}", label)
+        return False  # solved, stop listening
+
+    def on_press(key):
+        """Handles the keypress event (applied on the game thread).
+        PARAMETERS:
+        key : pressed key
+        """
+        if (hasattr(key, 'char')):
+            if (key.char == 'a'):
+                return move_disk(rod='A')
+            elif (key.char == 'b'):
+                return move_disk(rod='B')
+            elif (key.char == 'c'):
+                return move_disk(rod='C')
+            elif (key.char == 'h'):
+                return hint_game()
+            elif (key.char == 'l'):
+                return reload_game()
+            elif (key.char == 'r'):
+                return reload_game()
+            elif (key.char == 's'):
+                return save_game()
+            elif (key.char == 'u'):
+                return undo_game()
+            elif (key.char == 'y'):
+                return undo_game(redo=True)
+            elif (key.char == 'q'):
+                return False
+        else:
+            if (key == Key.esc):
+                return False
+        return True  # for any other key, continue listening
+
+    try:
+
+        # Show the solution, if specified
+        if (solve):
+            solve_game()
+            return
+
+        # Otherwise, begin listening for keypresses (suppress input events
+        # from being passed back to the console); the listener only queues
+        # the events, which are applied here until False is returned, with
+        # the boughs being drawn at most once per refresh interval
+        (Key, Listener) = load_keyboard()
+        events = EventQueue(handle=on_press, render=write_disks,
+                            name='xmastree_game input')
+        write_disks()
+        print('Good luck, move boughs by pressing A, B, or C ...\r\n')
+        lstn = Listener(on_press=events.put, suppress=True)
+        lstn.start()
+        try:
+            events.run()
+        finally:
+            lstn.stop()
+    finally:
+        if (journal is not None):
+            journal.close()  # writes any buffered moves
+        renderer.close()
+
+
+def clear():
+    """Clears the console."""
+    if (os.name == 'nt'):
+        _ = os.system('cls')  # Microsoft Windows
+    else:
+        _ = os.system('clear')  # all others
+
+
+# Start the program interactively
+if __name__ == '__main__':
+    try:
+        clear()
+        enable_escapes()
+        color = '\033[37m\033[41m'
+        reset = '\033[0m'
+        print(color, '         THE XMAS TREE GAME (TOWER OF HANOI)         ',
+              reset, sep='')
+        height = int(
+            input('Enter the Xmas tree height/difficulty level [2-20]: '))
+        solve = None
+        while (solve != 'y') and (solve != 'n'):
+            solve = input('Do you want the computer to play itself? [Y|N]: ')
+            solve = solve.lower()
+        delay = 2.0
+        if (solve == 'y'):
+            delay = input('Enter the seconds between moves [2, 0 = fastest]: ')
+            delay = float(delay or 2)
+        rule = None
+        while (rule not in RULES):
+            rule = input('Choose the rules [classic|cyclic|adjacent]: ')
+            rule = rule.lower() or 'classic'
+        print('  Move all of the boughs from base A to base C')
+        print('  Press A, B, or C to move a bough between two bases')
+        print('  A larger bough cannot be placed on top of a smaller bough')
+        print('  Cyclic rules: boughs only move clockwise (A, B, C, A)')
+        print('  Adjacent rules: boughs only move to a neighbouring base')
+        print('  Each bough is numbered according to its ornament count')
+        print('  Press H for a hint')
+        print('  Press U to undo a move, Y to redo an undone move')
+        print('  Moves are saved automatically, press S to save a snapshot')
+        print('  Press R or L to reload the saved game')
+        print('  Press SPACE or P to pause the computer, N to step one move')
+        print('  Press + or - to change the speed of the computer')
+        print('  Press ESC or Q to quit')
+        play(height=height, solve=(solve == 'y'), delay=delay, rule=rule)
+        color = '\033[36m'
+        reset = '\033[0m'
+        print(color, 'MERRY CHRISTMAS AND HAPPY HOLIDAYS', reset, sep='')
+    except Exception as e:
+        print(str(e))
+    finally:
+        print('\033[0m', end='')  # tidy up, just in case
+        input('Press the ENTER key to exit the game: ')